@@ -38,6 +38,17 @@ def generator() -> tuple[Sequence, Any]:
     pass
 
 
+def sized_generator(n: int) -> tuple[Sequence, Any]:
+    """
+    Генерация тестового случая заданного размера для анализа сложности.
+
+    :param n: Размер входных данных.
+    :returns: Кортеж из двух элементов:
+    последовательность аргументов теста, ожидаемое значение.
+    """
+    pass
+
+
 # Допустимые значения:
 # имя функции, класса или метода класса (в формате ClassName.methodName)
 TARGET = None
@@ -46,6 +57,30 @@ TARGET = None
 # "function", "method", "class", "stream"
 TESTER = None
 
+# Ограничение по времени выполнения одного теста в секундах.
+TIME_LIMIT = None
+
+# Ограничение по памяти одного теста в мегабайтах.
+MEMORY_LIMIT = None
+
+# Отслеживать изменение аргументов тестируемым кодом (раздел "Arguments after").
+# Решение всегда получает сами аргументы теста, а не их копию.
+# Если False, аргументы не сериализуются до выполнения теста: валидатор
+# получает их уже измененными, а непройденные генерируемые тесты
+# не уменьшаются (эталон REFERENCE по-прежнему выполняется на копии).
+TRACK_MUTATIONS = True
+
+# Заявленная сложность решения: "O(1)", "O(log n)", "O(n)", "O(n log n)",
+# "O(n^2)" или "O(2^n)". Проверяется командой test --complexity
+# на тестах из COMPLEXITY_GENERATOR.
+COMPLEXITY = None
+
+# COMPLEXITY_GENERATOR = sized_generator
+
+# Эталонное решение для генерируемых тестов (стресс-тестирование):
+# функция, класс или имя папки решения.
+# REFERENCE = None
+
 # RUNNER = runner
 
 # VALIDATOR = validator
@@ -47,6 +47,16 @@ def stress_generator() -> tuple[Sequence, Any]:
     return generator(-(10**9), 10**9, 10**4)
 
 
+def sized_generator(n: int) -> tuple[Sequence, Any]:
+    """
+    Худший случай размера n для анализа сложности (test --complexity):
+    подходящая пара чисел находится в конце списка
+    (остальные числа меньше, поэтому другой такой пары нет).
+    """
+    nums = random.sample(range(10**9), n - 2) + [10**9, 10**9 + 1]
+    return [nums, nums[-2] + nums[-1]], [n - 2, n - 1]
+
+
 # По умолчанию будет выбран method.
 TESTER = None
 
@@ -55,6 +65,11 @@ TARGET = None
 
 VALIDATOR = validator
 
+# Заявленная сложность решения и генератор тестов заданного размера
+# для ее проверки (test --complexity).
+COMPLEXITY = "O(n)"
+COMPLEXITY_GENERATOR = sized_generator
+
 TESTS = [
     {
         # Обычный тест, имеющий аргументы и ожидаемое значение.
@@ -4,6 +4,8 @@ import typing
 
 import requests
 
+from src.api.problem_index import IndexEntry, ProblemIndex
+from src.config import LEETCODE_INDEX_FILE_NAME, LEETCODE_INDEX_TTL
 from src.nodes.node import Node, get_nodes
 from src.problem import Problem
 from src.utils.general import string_to_json, to_json_string
@@ -30,43 +32,64 @@ def parse_leetcode_problem(obj: dict) -> Problem:
     )
 
 
-def get_leetcode_problem_slug(problem_id: int) -> str | None:
+def get_leetcode_problem_list(skip: int, limit: int) -> tuple[int, list[IndexEntry]]:
+    """
+    Страница списка задач (по возрастанию номера) и общее количество задач.
+    """
     url = LEETCODE_GRAPHQL_URL
-    headers = {
-        "Content-Type": "application/json",
-    }
+    headers = {"Content-Type": "application/json"}
     query = """
-    {
+    query problemsetQuestionList($skip: Int, $limit: Int) {
         problemsetQuestionList: questionList(
             categorySlug: ""
-            limit: 10000
-            skip: 0
+            limit: $limit
+            skip: $skip
             filters: {}
         ) {
+            total: totalNum
             questions: data {
-                questionId
+                questionFrontendId
                 title
                 titleSlug
                 difficulty
                 topicTags {
                     name
-                    slug
                 }
             }
         }
     }
     """
-
-    response = requests.post(url, json={"query": query}, headers=headers)
+    variables = {"skip": skip, "limit": limit}
+    response = requests.post(
+        url, json={"query": query, "variables": variables}, headers=headers
+    )
     response.raise_for_status()
+    data = response.json()["data"]["problemsetQuestionList"]
+
+    return data["total"], [
+        IndexEntry(
+            id=int(obj["questionFrontendId"]),
+            slug=obj["titleSlug"],
+            title=obj["title"],
+            difficulty=obj["difficulty"],
+            tags=[x["name"] for x in obj["topicTags"]],
+        )
+        for obj in data["questions"]
+    ]
+
 
-    data = response.json()
-    problems = data["data"]["problemsetQuestionList"]["questions"]
+def get_leetcode_index() -> ProblemIndex:
+    return ProblemIndex(
+        LEETCODE_INDEX_FILE_NAME, get_leetcode_problem_list, LEETCODE_INDEX_TTL
+    )
 
-    if problem_id > len(problems):
-        raise ValueError(f"Problem id={problem_id} not found")
 
-    return problems[problem_id - 1]["titleSlug"]
+def get_leetcode_problem_slug(problem_id: int) -> str:
+    """
+    Slug задачи по номеру (из локального индекса задач).
+    """
+    with get_leetcode_index() as index:
+        return index.find_by_id(problem_id).slug
 
 
 def get_leetcode_problem_by_slug(problem_slug: str) -> Problem:
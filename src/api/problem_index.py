@@ -0,0 +1,167 @@
+import json
+import os
+import sqlite3
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from src.utils.style import print_warning
+
+# Количество задач, запрашиваемых за один запрос при обновлении индекса.
+REFRESH_PAGE_SIZE = 1000
+
+
+@dataclass
+class IndexEntry:
+    """
+    Краткие данные задачи в индексе.
+    """
+
+    id: int
+    slug: str
+    title: str
+    difficulty: str
+    tags: list[str]
+
+
+# Загрузка страницы списка задач: принимает количество пропускаемых задач
+# и размер страницы, возвращает общее количество задач и задачи страницы.
+FetchPage = Callable[[int, int], tuple[int, list[IndexEntry]]]
+
+
+class ProblemIndex:
+    """
+    Локальный индекс задач ресурса (номер, slug, название, сложность, теги)
+    в базе SQLite. Поиск выполняется без обращения к сети.
+    Если задачи нет в индексе, он дополняется задачами, появившимися
+    после последнего обновления. Индекс старше ttl при поиске загружается
+    заново (чтобы обновить названия, сложность и теги), а если это не удалось
+    (нет сети), используются сохраненные данные.
+    """
+
+    def __init__(self, file_name: str, fetch_page: FetchPage, ttl: float):
+        """
+        :param file_name: Файл базы индекса.
+        :param fetch_page: Загрузка страницы списка задач ресурса
+        (задачи упорядочены по номеру, новые – в конце).
+        :param ttl: Время, после которого индекс загружается заново, в секундах.
+        """
+        self.__fetch_page = fetch_page
+        self.__ttl = ttl
+
+        os.makedirs(os.path.dirname(file_name) or ".", exist_ok=True)
+        self.__connection = sqlite3.connect(file_name)
+        with self.__connection:
+            self.__connection.execute(
+                "CREATE TABLE IF NOT EXISTS problems ("
+                "id INTEGER PRIMARY KEY, slug TEXT NOT NULL UNIQUE, "
+                "title TEXT NOT NULL, difficulty TEXT NOT NULL, tags TEXT NOT NULL)"
+            )
+            self.__connection.execute(
+                "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value)"
+            )
+
+    def __enter__(self) -> "ProblemIndex":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.__connection.close()
+
+    def __find(self, column: str, value: int | str) -> IndexEntry | None:
+        row = self.__connection.execute(
+            f"SELECT id, slug, title, difficulty, tags FROM problems "
+            f"WHERE {column} = ?",
+            (value,),
+        ).fetchone()
+        if row is None:
+            return None
+
+        problem_id, slug, title, difficulty, tags = row
+        return IndexEntry(problem_id, slug, title, difficulty, json.loads(tags))
+
+    def get_by_id(self, problem_id: int) -> IndexEntry | None:
+        return self.__find("id", problem_id)
+
+    def get_by_slug(self, slug: str) -> IndexEntry | None:
+        return self.__find("slug", slug)
+
+    def find_by_id(self, problem_id: int) -> IndexEntry:
+        """
+        Задача по номеру. Если ее нет в индексе или индекс устарел,
+        индекс обновляется (если задачи нет и после дополнения индекса,
+        он загружается заново). Если обновить индекс не удалось,
+        используются сохраненные данные.
+        """
+        entry = self.get_by_id(problem_id)
+        if entry is None or self.is_expired():
+            try:
+                full = self.is_expired()
+                self.refresh(full)
+                if not full and self.get_by_id(problem_id) is None:
+                    # Если задачи удалялись и добавлялись, количество задач
+                    # могло не измениться, и новые задачи не были загружены.
+                    self.refresh(full=True)
+            except (OSError, KeyError, TypeError, ValueError) as e:
+                # Ошибки запросов (requests) – подклассы OSError,
+                # остальные – ошибки разбора ответа неожиданного формата.
+                if entry is None:
+                    raise
+                print_warning(f"Problem index is not refreshed: {e}", level=True)
+            else:
+                entry = self.get_by_id(problem_id)
+
+        if entry is None:
+            raise ValueError(f"Problem id={problem_id} not found")
+
+        return entry
+
+    def count(self) -> int:
+        return self.__connection.execute("SELECT COUNT(*) FROM problems").fetchone()[0]
+
+    def is_expired(self) -> bool:
+        row = self.__connection.execute(
+            "SELECT value FROM meta WHERE key = 'loaded_at'"
+        ).fetchone()
+        return row is None or time.time() - row[0] > self.__ttl
+
+    def refresh(self, full: bool = False) -> int:
+        """
+        Загружает задачи, добавленные после последнего обновления
+        (все задачи, если индекс устарел или из списка задачи удалялись).
+        Возвращает количество загруженных задач.
+
+        :param full: Загрузить все задачи заново.
+        """
+        full = full or self.is_expired()
+        skip = 0 if full else self.count()
+        total, entries = self.__fetch_page(skip, REFRESH_PAGE_SIZE)
+
+        # Список задач стал короче индекса – индекс загружается заново.
+        if total < skip:
+            return self.refresh(full=True)
+
+        while entries and skip + len(entries) < total:
+            total, page = self.__fetch_page(skip + len(entries), REFRESH_PAGE_SIZE)
+            if not page:
+                break
+            entries += page
+
+        with self.__connection:
+            if full:
+                self.__connection.execute("DELETE FROM problems")
+                self.__connection.execute(
+                    "INSERT OR REPLACE INTO meta VALUES ('loaded_at', ?)",
+                    (time.time(),),
+                )
+            self.__connection.executemany(
+                "INSERT OR REPLACE INTO problems VALUES (?, ?, ?, ?, ?)",
+                (
+                    (x.id, x.slug, x.title, x.difficulty, json.dumps(x.tags))
+                    for x in entries
+                ),
+            )
+
+        return len(entries)
@@ -1,9 +1,12 @@
 import importlib
 import pkgutil
+from types import ModuleType
 
-__all__ = []
+# Модули пакета импортируются при первом обращении к ним.
+__all__ = [module_name for _, module_name, _ in pkgutil.iter_modules(__path__)]
 
-for _, module_name, _ in pkgutil.iter_modules(__path__):
-    module = importlib.import_module(f".{module_name}", __name__)
-    globals()[module_name] = module
-    __all__.append(module_name)
+
+def __getattr__(name: str) -> ModuleType:
+    if name in __all__:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -7,6 +7,7 @@ from collections.abc import Sequence
 
 from src.config import SOLUTION_MODULE_NAME
 from src.utils.general import print_exc_from_level
+from src.utils.registry import Registry
 from src.utils.style import print_error
 
 
@@ -30,12 +31,21 @@ class Command:
         pass
 
 
+COMMANDS = Registry(
+    {
+        "create": "src.commands.create_command.CreateCommand",
+        "load": "src.commands.load_command.LoadCommand",
+        "test": "src.commands.test_command.TestCommand",
+    }
+)
+
+
 def get_command_by_name(name: str) -> type[Command]:
-    return {x.NAME: x for x in Command.__subclasses__()}.get(name)
+    return COMMANDS.get(name)
 
 
 def get_command_names() -> list[str]:
-    return [x.NAME for x in Command.__subclasses__()]
+    return COMMANDS.names()
 
 
 def proc_command(args: Sequence[str]) -> None:
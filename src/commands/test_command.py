@@ -1,7 +1,12 @@
+import sys
 from argparse import ArgumentParser
 
 from src.commands.command import Command
+from src.config import BENCH_REPEAT, BENCH_WARMUP, RESULT_PREVIEW_LENGTH
+from src.testing.batch import testing_solutions
+from src.testing.options import TestOptions
 from src.testing.testing import testing_solution
+from src.testing.watch import watch_solution
 
 
 class TestCommand(Command):
@@ -15,7 +20,11 @@ class TestCommand(Command):
     NAME = "test"
 
     def _init_args(self, parser: ArgumentParser) -> None:
-        parser.add_argument("solution", nargs="?", help="Solution name")
+        parser.add_argument(
+            "solution",
+            nargs="?",
+            help="Solution name (with --all – glob pattern of solution names)",
+        )
         parser.add_argument(
             "-t",
             "--time",
@@ -23,6 +32,150 @@ class TestCommand(Command):
             help="Print execution time of each test",
         )
         parser.add_argument("-d", "--debug", action="store_true", help="Debug mode")
+        parser.add_argument(
+            "-j",
+            "--jobs",
+            type=int,
+            help="Number of processes to run tests in (0 – number of CPU cores, "
+            "default 1, with --all – number of CPU cores)",
+        )
+        parser.add_argument(
+            "-w",
+            "--watch",
+            action="store_true",
+            help="Rerun tests on every change of solution files",
+        )
+        parser.add_argument(
+            "--no-cache",
+            action="store_true",
+            help="Run all tests, including the ones passed in previous runs",
+        )
+        parser.add_argument(
+            "-b",
+            "--bench",
+            type=int,
+            nargs="?",
+            const=BENCH_REPEAT,
+            help=f"Measure each test N times (default {BENCH_REPEAT}) "
+            f"and print time statistics",
+        )
+        parser.add_argument(
+            "--warmup",
+            type=int,
+            default=BENCH_WARMUP,
+            help="Number of warmup runs before measurements in benchmark mode",
+        )
+        parser.add_argument(
+            "-c",
+            "--complexity",
+            action="store_true",
+            help="Estimate time complexity on inputs of growing size "
+            "from COMPLEXITY_GENERATOR instead of running tests",
+        )
+        parser.add_argument(
+            "-m",
+            "--memory",
+            action="store_true",
+            help="Print peak memory of each test "
+            "and top allocation sites of the heaviest one",
+        )
+        parser.add_argument(
+            "-p",
+            "--profile",
+            action="store_true",
+            help="Profile the solution on all tests, print the slowest functions "
+            "and save the profile in pstats and collapsed stack formats",
+        )
+        parser.add_argument(
+            "--methods",
+            action="store_true",
+            help="Print call latency statistics of each method "
+            "for every test of a class solution",
+        )
+        parser.add_argument(
+            "-i",
+            "--isolated",
+            action="store_true",
+            help="Run each test of a stream solution as a separate "
+            "'python solution.py' process, as online judges do",
+        )
+        parser.add_argument(
+            "-a",
+            "--all",
+            action="store_true",
+            help="Test all solutions in a process pool, print a table of results "
+            "and exit with a non-zero code if any test fails",
+        )
+        parser.add_argument(
+            "--tag",
+            action="append",
+            help="With --all: test only solutions of problems with this tag "
+            "(from data.json, may be repeated)",
+        )
+        parser.add_argument(
+            "-q",
+            "--quiet",
+            action="store_true",
+            help="Print only failed tests and a progress line with testing speed",
+        )
+        parser.add_argument(
+            "--preview",
+            type=int,
+            nargs="?",
+            const=RESULT_PREVIEW_LENGTH,
+            help=f"Truncate printed arguments and results to about N characters "
+            f"(default {RESULT_PREVIEW_LENGTH})",
+        )
 
     def execute(self) -> None:
-        testing_solution(self.args.solution, self.args.time, self.args.debug)
+        if self.args.all:
+            self.__execute_batch()
+            return
+
+        options = TestOptions(
+            show_time=self.args.time,
+            debug=self.args.debug,
+            jobs=self.args.jobs,
+            use_cache=not self.args.no_cache,
+            bench=self.args.bench,
+            warmup=self.args.warmup,
+            complexity=self.args.complexity,
+            memory=self.args.memory,
+            profile=self.args.profile,
+            methods=self.args.methods,
+            isolated=self.args.isolated,
+            quiet=self.args.quiet,
+            preview=self.args.preview,
+        )
+        if self.args.watch:
+            watch_solution(self.args.solution, options)
+        else:
+            testing_solution(self.args.solution, options)
+
+    def __execute_batch(self) -> None:
+        modes = {
+            "watch": self.args.watch,
+            "bench": self.args.bench,
+            "complexity": self.args.complexity,
+            "memory": self.args.memory,
+            "profile": self.args.profile,
+            "methods": self.args.methods,
+        }
+        for name, enabled in modes.items():
+            if enabled:
+                raise Exception(f"--{name} can not be used with --all")
+
+        success = testing_solutions(
+            self.args.solution,
+            self.args.tag,
+            self.args.jobs,
+            TestOptions(
+                show_time=self.args.time,
+                debug=self.args.debug,
+                use_cache=not self.args.no_cache,
+                isolated=self.args.isolated,
+                quiet=True,
+            ),
+        )
+        if not success:
+            sys.exit(1)
@@ -17,12 +17,69 @@ LAUNCH_LAST_MODIFIED_SOLUTION = True
 # Ширина шапки вывода информационных блоков (результатов тестов).
 HEADER_WIDTH = 40
 
+# Длина сокращенного представления аргументов и результатов
+# в выводе тестов (test --preview).
+RESULT_PREVIEW_LENGTH = 200
+
+# Интервал записи накопленного вывода и обновления строки прогресса
+# в тихом режиме тестирования (в секундах).
+REPORT_INTERVAL = 0.1
+
+# Наибольшее количество узлов (ListNode, BinaryTreeNode, NTreeNode)
+# при преобразовании в список. Защищает от бесконечного обхода и роста
+# памяти, если решение вернуло неверно построенную структуру.
+NODE_MAX_SIZE = 10**7
+
+# Время, после которого локальный индекс задач LeetCode (номер, slug,
+# название, сложность, теги) загружается заново при следующем поиске,
+# в секундах. До этого индекс только дополняется новыми задачами,
+# если задача не найдена.
+LEETCODE_INDEX_TTL = 7 * 24 * 60 * 60
+
 # Имя класса решения для тестирования метода класса.
 SOLUTION_CLASS_NAME = "Solution"
 
 # Имя функции точки входа для тестирования через поток ввода-вывода.
 MAIN_FUNCTION_NAME = "main"
 
+# Интервал проверки изменений файлов решения в режиме наблюдения (в секундах).
+WATCH_INTERVAL = 0.05
+
+# Количество замеров и прогревочных запусков каждого теста в режиме бенчмарка.
+BENCH_REPEAT = 20
+BENCH_WARMUP = 3
+
+# Количество строк кода с наибольшим выделением памяти,
+# выводимых для самого тяжелого теста в режиме измерения памяти.
+MEMORY_TOP_ALLOCATIONS = 10
+
+# Количество функций с наибольшим временем выполнения,
+# выводимых в режиме профилирования.
+PROFILE_TOP_FUNCTIONS = 15
+
+# Анализ сложности: размеры входных данных растут геометрически
+# от COMPLEXITY_MIN_SIZE до COMPLEXITY_MAX_SIZE с множителем COMPLEXITY_SIZE_FACTOR,
+# пока время одного запуска не превысит COMPLEXITY_SIZE_TIME секунд
+# или общее время анализа – COMPLEXITY_TIME_BUDGET секунд.
+COMPLEXITY_MIN_SIZE = 8
+COMPLEXITY_MAX_SIZE = 2**20
+COMPLEXITY_SIZE_FACTOR = 2**0.5
+COMPLEXITY_SIZE_TIME = 0.2
+COMPLEXITY_TIME_BUDGET = 10
+# Количество замеров на каждом размере.
+COMPLEXITY_REPEAT = 5
+# Минимальное количество размеров для подбора класса сложности.
+COMPLEXITY_MIN_POINTS = 4
+# Минимальный учитываемый разброс измерений (квадрат относительного отклонения).
+COMPLEXITY_MIN_NOISE = 1e-4
+# Ограничение по времени одного запуска, если в решении не задан TIME_LIMIT.
+COMPLEXITY_RUN_TIME_LIMIT = 2
+
+# Уменьшение непройденного генерируемого теста ограничено количеством
+# запусков уменьшенных вариантов и общим временем (в секундах).
+SHRINK_MAX_RUNS = 10000
+SHRINK_TIME_BUDGET = 30
+
 
 # =============================================================================
 #                                ФАЙЛЫ И ПАПКИ
@@ -30,6 +87,9 @@ MAIN_FUNCTION_NAME = "main"
 
 SOLUTIONS_DIRECTORY = "solutions"
 ASSETS_DIRECTORY = "assets"
+CACHE_DIRECTORY = ".cache"
+PROFILE_DIRECTORY = ".profile"
+LEETCODE_INDEX_FILE_NAME = os.path.join(CACHE_DIRECTORY, "leetcode.sqlite3")
 
 TEMPLATES_DIRECTORY = os.path.join(ASSETS_DIRECTORY, "templates")
 SOLUTION_TEMPLATES_DIRECTORY = os.path.join(TEMPLATES_DIRECTORY, "solution")
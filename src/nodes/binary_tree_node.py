@@ -1,8 +1,8 @@
-from collections import deque
 from collections.abc import Sequence
 from typing import Any
 
-from src.nodes.node import Node
+from src.config import NODE_MAX_SIZE
+from src.nodes.node import REACHED_CHECK_START, Node, gc_paused
 
 
 class BinaryTreeNode(Node):
@@ -12,6 +12,8 @@ class BinaryTreeNode(Node):
 
     ALT_NAME = "TreeNode"
 
+    __slots__ = ("val", "left", "right")
+
     def __init__(
         self,
         val: Any = None,
@@ -22,24 +24,51 @@ class BinaryTreeNode(Node):
         self.left = left
         self.right = right
 
-    def to_list(self) -> list:
-        values = []
-        nodes = deque()
-        nodes.append(self)
+    def _equals(self, other: "BinaryTreeNode") -> bool:
+        pairs = [(self, other)]
+        # Ограничение количества шагов завершает обход дерева с циклом.
+        steps = 0
+
+        while pairs:
+            node, other_node = pairs.pop()
+            # Общее поддерево заведомо совпадает.
+            if node is other_node:
+                continue
+            if node is None or other_node is None or node.val != other_node.val:
+                return False
+
+            steps += 1
+            if steps > NODE_MAX_SIZE:
+                return False
+            pairs.append((node.right, other_node.right))
+            pairs.append((node.left, other_node.left))
+
+        return True
+
+    def to_list(self, max_size: int | None = NODE_MAX_SIZE) -> list:
+        # Узлы в порядке обхода в ширину (список дополняется во время обхода),
+        # значения – по позициям узлов.
+        nodes = [self]
+        seen = set()
+        checked, next_check = 0, REACHED_CHECK_START
+        last = 0
 
-        while nodes:
-            node = nodes.popleft()
-            if node:
-                values.append(node.val)
-                nodes.append(node.left)
-                nodes.append(node.right)
-            else:
-                values.append(None)
+        for index, node in enumerate(nodes):
+            if node is None:
+                continue
 
-        while values and values[-1] is None:
-            values.pop()
+            nodes.append(node.left)
+            nodes.append(node.right)
+            last = index
 
-        return values
+            if index >= next_check:
+                checked = self._check_reached(nodes, checked, seen, max_size)
+                next_check *= 2
+
+        self._check_reached(nodes, checked, seen, max_size)
+
+        # Пустые позиции после последнего узла не выводятся.
+        return [None if node is None else node.val for node in nodes[: last + 1]]
 
     @classmethod
     def from_list(cls, values: Sequence) -> "BinaryTreeNode | None":
@@ -47,18 +76,29 @@ class BinaryTreeNode(Node):
             return None
 
         root = cls(values[0])
-        nodes = deque()
-        nodes.append((root, "left"))
-        nodes.append((root, "right"))
+        # Узлы, ожидающие детей, в порядке обхода в ширину.
+        nodes = [root]
+        count = len(values)
+        i = 1
+
+        with gc_paused():
+            for node in nodes:
+                if i >= count:
+                    break
+
+                if values[i] is not None:
+                    node.left = cls(values[i])
+                    nodes.append(node.left)
 
-        for value in values[1:]:
-            node, direction = nodes.popleft()
+                if i + 1 < count and values[i + 1] is not None:
+                    node.right = cls(values[i + 1])
+                    nodes.append(node.right)
 
-            if value is not None:
-                new_node = cls(value)
-                setattr(node, direction, new_node)
+                i += 2
 
-                nodes.append((new_node, "left"))
-                nodes.append((new_node, "right"))
+        # Значения, для которых не осталось родительских узлов,
+        # могут быть только пустыми позициями.
+        if any(value is not None for value in values[i:]):
+            raise IndexError(f"Values without a parent node: {list(values[i:])}")
 
         return root
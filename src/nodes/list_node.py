@@ -1,7 +1,14 @@
 from collections.abc import Sequence
+from itertools import count
 from typing import Any
 
-from src.nodes.node import Node
+from src.config import NODE_MAX_SIZE
+from src.nodes.node import (
+    Node,
+    NodeCycleError,
+    NodeSizeError,
+    gc_paused,
+)
 
 
 class ListNode(Node):
@@ -11,27 +18,83 @@ class ListNode(Node):
 
     ALT_NAME = "ListNode"
 
+    __slots__ = ("val", "next")
+
     def __init__(self, val: Any = None, next: "ListNode | None" = None):
         self.val = val
         self.next = next
 
-    def to_list(self) -> list:
+    def _equals(self, other: "ListNode") -> bool:
+        node, other_node = self, other
+        # Цикл в списке обнаруживается алгоритмом Брента (см. to_list).
+        mark, power, steps = self, 1, 0
+
+        while node is not None and other_node is not None:
+            # Общий хвост списков заведомо совпадает.
+            if node is other_node:
+                return True
+            if node.val != other_node.val:
+                return False
+            node, other_node = node.next, other_node.next
+
+            steps += 1
+            if node is mark:
+                return False
+            if steps == power:
+                mark, power, steps = node, power * 2, 0
+
+        return node is other_node
+
+    def __find_cycle_start(self, cycle_length: int) -> int:
+        """
+        Номер узла, с которого начинается цикл заданной длины.
+        """
+        node, ahead = self, self
+        for _ in range(cycle_length):
+            ahead = ahead.next
+
+        index = 0
+        while node is not ahead:
+            node, ahead = node.next, ahead.next
+            index += 1
+
+        return index
+
+    def to_list(self, max_size: int | None = NODE_MAX_SIZE) -> list:
         values = []
+        append = values.append
         node = self
+        # Алгоритм Брента: узел-метка переставляется через 1, 2, 4, ... шагов.
+        # Если обход вернулся к метке, в списке цикл, а количество шагов
+        # от метки – его длина. Дополнительная память не нужна.
+        mark, power, steps = self, 1, 0
 
-        while node:
-            values.append(node.val)
+        for _ in range(max_size) if max_size is not None else count():
+            append(node.val)
             node = node.next
+            if node is None:
+                return values
 
-        return values
+            steps += 1
+            if node is mark:
+                index = self.__find_cycle_start(steps)
+                raise NodeCycleError(
+                    f"Linked list has a cycle at node {index}", index=index
+                )
+            if steps == power:
+                mark, power, steps = node, power * 2, 0
+
+        raise NodeSizeError(
+            f"Linked list has more than {max_size} nodes", max_size=max_size
+        )
 
     @classmethod
     def from_list(cls, values: Sequence) -> "ListNode | None":
-        dummy_node = ListNode()
-        current_node = dummy_node
-
-        for val in values or []:
-            current_node.next = ListNode(val)
-            current_node = current_node.next
+        # Список строится с конца: каждый узел создается сразу со ссылкой
+        # на следующий, без отдельного присваивания.
+        head = None
+        with gc_paused():
+            for val in reversed(values or []):
+                head = cls(val, head)
 
-        return dummy_node.next
+        return head
@@ -1,8 +1,9 @@
-from collections import deque
 from collections.abc import Sequence
+from itertools import islice
 from typing import Any
 
-from src.nodes.node import Node
+from src.config import NODE_MAX_SIZE
+from src.nodes.node import REACHED_CHECK_START, Node, gc_paused
 
 
 class NTreeNode(Node):
@@ -12,22 +13,54 @@ class NTreeNode(Node):
 
     ALT_NAME = "Node"
 
+    __slots__ = ("val", "children")
+
     def __init__(self, val: Any = None, children: list["NTreeNode"] = None):
         self.val = val
         self.children = children or []
 
-    def to_list(self) -> list:
+    def _equals(self, other: "NTreeNode") -> bool:
+        pairs = [(self, other)]
+        # Ограничение количества шагов завершает обход дерева с циклом.
+        steps = 0
+
+        while pairs:
+            node, other_node = pairs.pop()
+            # Общее поддерево заведомо совпадает.
+            if node is other_node:
+                continue
+
+            children = node.children or []
+            other_children = other_node.children or []
+            if node.val != other_node.val or len(children) != len(other_children):
+                return False
+
+            steps += 1
+            if steps > NODE_MAX_SIZE:
+                return False
+            pairs.extend(zip(children, other_children))
+
+        return True
+
+    def to_list(self, max_size: int | None = NODE_MAX_SIZE) -> list:
         values = [self.val, None]
-        nodes = deque()
-        nodes.append(self)
+        # Узлы в порядке обхода в ширину (список дополняется во время обхода).
+        nodes = [self]
+        seen = set()
+        checked, next_check = 0, REACHED_CHECK_START
 
-        while nodes:
-            node = nodes.popleft()
+        for node in nodes:
             for child in node.children or []:
                 values.append(child.val)
                 nodes.append(child)
             values.append(None)
 
+            if len(nodes) >= next_check:
+                checked = self._check_reached(nodes, checked, seen, max_size)
+                next_check *= 2
+
+        self._check_reached(nodes, checked, seen, max_size)
+
         while values and values[-1] is None:
             values.pop()
 
@@ -39,18 +72,22 @@ class NTreeNode(Node):
             return None
 
         root = cls(values[0])
-        nodes = deque()
-        nodes.append(root)
+        # Узлы в порядке обхода в ширину: None в списке значений
+        # переходит к детям следующего из них.
+        nodes = [root]
+        position = -1
         node = None
 
-        for value in values[1:]:
-            if value is None:
-                node = nodes.popleft()
-            else:
-                if node.children is None:
-                    node.children = []
-                new_node = cls(value)
-                node.children.append(new_node)
-                nodes.append(new_node)
+        with gc_paused():
+            for value in islice(values, 1, None):
+                if value is None:
+                    position += 1
+                    node = nodes[position]
+                else:
+                    new_node = cls(value)
+                    if node.children is None:
+                        node.children = []
+                    node.children.append(new_node)
+                    nodes.append(new_node)
 
         return root
@@ -1,19 +1,206 @@
+import gc
 from abc import abstractmethod
-from collections.abc import Sequence
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+
+from src.config import NODE_MAX_SIZE
+
+
+class NodeStructureError(ValueError):
+    """
+    Структура узлов, которую нельзя преобразовать в список.
+    """
+
+
+class NodeCycleError(NodeStructureError):
+    """
+    Узел достижим повторно: в списке есть цикл, а в дереве – цикл
+    или общее поддерево.
+    """
+
+    def __init__(self, message: str, index: int):
+        """
+        :param index: Номер повторно достижимого узла в представлении списком.
+        """
+        super().__init__(message)
+        self.index = index
+
+
+class NodeSizeError(NodeStructureError):
+    """
+    Количество узлов превышает ограничение.
+    """
+
+    def __init__(self, message: str, max_size: int):
+        super().__init__(message)
+        self.max_size = max_size
+
+
+@contextmanager
+def gc_paused() -> Iterator[None]:
+    """
+    Отключает сборщик мусора на время массового создания узлов: узлы
+    не образуют циклов, а сборки, запускаемые по количеству новых объектов,
+    замедляют построение больших структур в несколько раз.
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def restore_node_graph(
+    node_class: type["Node"], values: list, links: list[tuple]
+) -> "Node":
+    """
+    Восстанавливает структуру узлов по таблице узлов (см. Node.to_graph)
+    и возвращает первый узел.
+    """
+    link_names = [name for name in node_class.__slots__ if name != "val"]
+    with gc_paused():
+        nodes = [node_class.__new__(node_class) for _ in values]
+
+    for node, value, node_links in zip(nodes, values, links):
+        node.val = value
+        for name, link in zip(link_names, node_links):
+            if isinstance(link, list):
+                link = [None if x is None else nodes[x] for x in link]
+            elif link is not None:
+                link = nodes[link]
+            setattr(node, name, link)
+
+    return nodes[0]
+
+
+# Количество узлов, после которого обход дерева впервые проверяется
+# на повторно достижимые узлы (далее – при каждом удвоении).
+REACHED_CHECK_START = 1024
 
 
 class Node:
+    """
+    Базовый класс узлов. Узлы не имеют словаря атрибутов (__slots__):
+    большие списки и деревья из стресс-тестов занимают меньше памяти.
+    """
+
     ALT_NAME: str = None
 
+    __slots__ = ()
+
     def __repr__(self):
-        return str(self.to_list())
+        try:
+            return str(self.to_list())
+        except NodeStructureError as e:
+            return f"<{type(self).__name__}: {e}>"
 
     def __eq__(self, other: "Node"):
-        return self.to_list() == other.to_list()
+        if not isinstance(other, Node):
+            return NotImplemented
+        if type(self) is not type(other):
+            try:
+                return self.to_list() == other.to_list()
+            except NodeStructureError:
+                return False
+
+        return self._equals(other)
+
+    def __reduce__(self):
+        # Сериализация и копирование через список, а не рекурсивно по узлам:
+        # глубина рекурсии для длинных списков и деревьев превысила бы лимит.
+        try:
+            return self.from_list, (self.to_list(max_size=None),)
+        except NodeCycleError:
+            # Циклы и общие узлы сохраняются таблицей узлов.
+            return restore_node_graph, (type(self), *self.to_graph())
+
+    def to_graph(self) -> tuple[list, list[tuple]]:
+        """
+        Таблица узлов, достижимых из данного (в порядке обхода в ширину),
+        без рекурсии и для любой структуры связей (циклы, общие узлы).
+        Возвращает значения узлов и связи каждого узла: для каждого поля связи
+        (кроме val) – номер узла, None или список номеров узлов.
+        """
+        link_names = [name for name in self.__slots__ if name != "val"]
+        nodes = [self]
+        index = {id(self): 0}
+
+        def get_index(node: Node | None) -> int | None:
+            if node is None:
+                return None
+            if id(node) not in index:
+                index[id(node)] = len(nodes)
+                nodes.append(node)
+            return index[id(node)]
+
+        links = []
+        for node in nodes:
+            node_links = []
+            for name in link_names:
+                link = getattr(node, name)
+                if isinstance(link, list):
+                    node_links.append([get_index(x) for x in link])
+                else:
+                    node_links.append(get_index(link))
+            links.append(tuple(node_links))
+
+        return [node.val for node in nodes], links
+
+    @classmethod
+    def _check_reached(
+        cls, nodes: list, start: int, seen: set[int], max_size: int | None
+    ) -> int:
+        """
+        Проверяет, что узлы обхода в ширину nodes[start:] (None пропускаются)
+        не встречались раньше, и возвращает количество проверенных узлов.
+        Узлы добавляются в множество пачкой, поэтому проверка почти
+        не замедляет обход. Вызывается по мере обхода, чтобы обход дерева
+        с циклом завершился, и после него, чтобы найти общие поддеревья.
+
+        :param seen: Идентификаторы уже проверенных узлов.
+        """
+        # У узлов нет __len__ и __bool__, поэтому filter отбрасывает только None.
+        new_nodes = list(filter(None, nodes[start:]))
+        count = len(seen) + len(new_nodes)
+        seen.update(map(id, new_nodes))
+
+        if len(seen) != count:
+            # Номер первого повторного узла ищется отдельным обходом.
+            ids = set()
+            for index, node in enumerate(x for x in nodes if x is not None):
+                if id(node) in ids:
+                    raise NodeCycleError(
+                        f"Tree node {index} (in level order) is reached twice: "
+                        f"the tree has a cycle or a shared subtree",
+                        index=index,
+                    )
+                ids.add(id(node))
+
+        if max_size is not None and len(seen) > max_size:
+            raise NodeSizeError(
+                f"Tree has more than {max_size} nodes", max_size=max_size
+            )
+
+        return len(nodes)
 
     @abstractmethod
-    def to_list(self) -> list:
-        pass
+    def _equals(self, other: "Node") -> bool:
+        """
+        Сравнение структур одного класса: обход обеих структур одновременно
+        до первого различия (без преобразования в списки).
+        Структура с циклом (и любая структура, обход которой длиннее
+        NODE_MAX_SIZE узлов) равна только самой себе.
+        """
+
+    @abstractmethod
+    def to_list(self, max_size: int | None = NODE_MAX_SIZE) -> list:
+        """
+        Представление структуры списком.
+        Если узел достижим повторно, вызывается исключение NodeCycleError,
+        если узлов больше max_size – NodeSizeError (None – без ограничения).
+        """
 
     @classmethod
     @abstractmethod
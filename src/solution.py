@@ -1,6 +1,7 @@
 import json
 import os
-from importlib import import_module
+import sys
+from importlib import import_module, invalidate_caches
 from types import ModuleType
 
 from src.config import (
@@ -36,6 +37,42 @@ def get_solution_name_by_problem_id(problem_id: int) -> str | None:
     return None
 
 
+def get_solution_directory(solution_name: str) -> str:
+    """
+    Путь к папке решения. Решение можно указать по id задачи.
+    """
+    path = os.path.join(SOLUTIONS_DIRECTORY, solution_name)
+    if os.path.isdir(path):
+        return path
+
+    if solution_name.isdigit():
+        problem_id = int(solution_name)
+        solution_name = get_solution_name_by_problem_id(problem_id)
+        if not solution_name:
+            raise Exception(f"There is no solution id={problem_id}")
+        return os.path.join(SOLUTIONS_DIRECTORY, solution_name)
+
+    raise Exception(f'There is no solution named "{solution_name}"')
+
+
+def unload_solution_modules(solution_name: str) -> None:
+    """
+    Выгружает импортированные модули решения (решение, настройки
+    и вспомогательные модули из папки решения), чтобы при следующем
+    импорте они были загружены из измененных файлов.
+    """
+    path = os.path.abspath(get_solution_directory(solution_name)) + os.sep
+
+    for name, module in list(sys.modules.items()):
+        file_name = getattr(module, "__file__", None)
+        if not file_name or not os.path.abspath(file_name).startswith(path):
+            continue
+
+        del sys.modules[name]
+
+    invalidate_caches()
+
+
 def get_solution_module(solution_name: str) -> ModuleType:
     try:
         return import_module(
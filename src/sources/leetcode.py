@@ -6,6 +6,7 @@ from src.api.leetcode_api import (
     get_leetcode_daily_problem,
     get_leetcode_problem_by_id,
     get_leetcode_problem_by_slug,
+    get_leetcode_problem_slug,
 )
 from src.problem import Problem
 from src.sources.source import Source
@@ -28,11 +29,12 @@ class Leetcode(Source):
 
     @classmethod
     def get_problem_url(cls, slug: str) -> str:
-        if not slug.isdigit() and slug != cls.DAILY_SLUG:
-            return LEETCODE_PROBLEM_URL_FORMAT.format(slug)
+        if slug == cls.DAILY_SLUG:
+            slug = get_leetcode_daily_problem().slug
+        elif slug.isdigit():
+            slug = get_leetcode_problem_slug(int(slug))
 
-        problem = cls._get_problem(slug)
-        return LEETCODE_PROBLEM_URL_FORMAT.format(problem.slug)
+        return LEETCODE_PROBLEM_URL_FORMAT.format(slug)
 
     @classmethod
     def get_problem_slug_by_url(cls, url: str) -> str | None:
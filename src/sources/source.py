@@ -6,6 +6,7 @@ from typing import AnyStr
 from src.config import CREATE_NEW_SOLUTIONS, SOLUTION_DEFAULT_NAME
 from src.problem import Problem
 from src.solution import create_solution
+from src.utils.registry import Registry
 from src.utils.style import print_message
 
 
@@ -55,16 +56,26 @@ class Source:
         print_message(f'{cls.NAME.capitalize()} problem "{problem}" loaded')
 
 
+# Модули ресурсов (и их API с тяжелыми зависимостями)
+# импортируются только при обращении к ресурсу.
+SOURCES = Registry(
+    {
+        "codeforces": "src.sources.codeforces.Codeforces",
+        "leetcode": "src.sources.leetcode.Leetcode",
+    }
+)
+
+
 def get_sources() -> list[type[Source]]:
-    return Source.__subclasses__()
+    return SOURCES.values()
 
 
 def get_source_by_name(name: str) -> type[Source]:
-    return {x.NAME: x for x in Source.__subclasses__()}.get(name)
+    return SOURCES.get(name)
 
 
 def get_source_names() -> list[str]:
-    return [x.NAME for x in Source.__subclasses__()]
+    return SOURCES.names()
 
 
 def get_source_by_problem_url(url: str) -> type[Source] | None:
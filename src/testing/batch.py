@@ -0,0 +1,207 @@
+import json
+import os
+import time
+import traceback
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from fnmatch import fnmatch
+
+from src.config import (
+    SOLUTION_DATA_FILE_NAME,
+    SOLUTION_MODULE_NAME,
+    SOLUTIONS_DIRECTORY,
+)
+from src.solution import get_solution_names
+from src.testing.options import TestOptions
+from src.testing.parallel import create_executor, get_jobs_count
+from src.testing.results.session import TestSession
+from src.testing.stdio import discard_output
+from src.testing.testing import testing_solution
+from src.utils.file import read_text_file
+from src.utils.general import time_to_string
+from src.utils.style import print_error, print_info, print_message, print_warning
+
+
+@dataclass
+class SolutionRun:
+    """
+    Итоги тестирования одного решения в пакетном режиме.
+    """
+
+    name: str
+    session: TestSession
+    time: float
+    # Описание ошибки, из-за которой решение не удалось протестировать.
+    error: str | None = None
+
+    @property
+    def success(self) -> bool:
+        return self.error is None and self.session.success
+
+
+def get_solution_tags(solution_name: str) -> set[str]:
+    """
+    Теги задачи решения из файла данных (в нижнем регистре).
+    """
+    file_name = os.path.join(
+        SOLUTIONS_DIRECTORY, solution_name, SOLUTION_DATA_FILE_NAME
+    )
+    if not os.path.exists(file_name):
+        return set()
+
+    data = json.loads(read_text_file(file_name))
+    return {tag.lower() for tag in data.get("tags") or []}
+
+
+def get_batch_solution_names(pattern: str = None, tags: list[str] = None) -> list[str]:
+    """
+    Имена решений, подходящих под фильтры, в алфавитном порядке.
+
+    :param pattern: Шаблон имени решения (glob, например "two-*").
+    :param tags: Теги, которые должны быть у задачи решения (все сразу).
+    """
+    tags = {tag.lower() for tag in tags or []}
+
+    return sorted(
+        name
+        for name in get_solution_names()
+        if os.path.exists(
+            os.path.join(SOLUTIONS_DIRECTORY, name, f"{SOLUTION_MODULE_NAME}.py")
+        )
+        and (not pattern or fnmatch(name, pattern))
+        and (not tags or tags <= get_solution_tags(name))
+    )
+
+
+def run_solution(solution_name: str, options: TestOptions) -> SolutionRun:
+    """
+    Тестирует решение в процессе пула. Вывод тестирования отбрасывается,
+    возвращаются только итоги. Любое исключение решения (в том числе
+    SystemExit при импорте модуля) становится ошибкой решения, а не завершает
+    процесс пула или пакетный запуск.
+    """
+    session = TestSession()
+    error = None
+    start_time = time.perf_counter()
+
+    with discard_output():
+        try:
+            testing_solution(solution_name, options, session=session, batch=True)
+        except BaseException as e:
+            error = str(e) or traceback.format_exception_only(e)[-1].strip()
+            if isinstance(e, SystemExit):
+                error = f"Exit code: {e.code}"
+
+    return SolutionRun(solution_name, session, time.perf_counter() - start_time, error)
+
+
+def run_solution_alone(solution_name: str, options: TestOptions) -> SolutionRun:
+    """
+    Тестирует решение в отдельном пуле из одного процесса
+    (после аварийного завершения процесса общего пула).
+    """
+    executor = create_executor(1)
+    try:
+        return executor.submit(run_solution, solution_name, options).result()
+    except BrokenProcessPool:
+        return SolutionRun(
+            solution_name, TestSession(), 0.0, "Process terminated abruptly"
+        )
+    finally:
+        executor.shutdown(cancel_futures=True)
+
+
+def print_solution_run(run: SolutionRun, width: int) -> None:
+    """
+    Выводит строку таблицы итогов: статус, имя решения,
+    количество пройденных тестов и время тестирования.
+    """
+    if run.error:
+        status, tests = "ERROR", "-"
+    else:
+        status = "OK" if run.success else "FAIL"
+        tests = f"{run.session.count_passed}/{run.session.count_runs}"
+
+    line = (
+        f"{status:<5}  {run.name:<{width}}  {tests:>9}  {time_to_string(run.time):>9}"
+    )
+    if run.error:
+        line += f"  {run.error}"
+
+    if run.success:
+        print_info(line)
+    else:
+        print_error(line)
+
+
+def testing_solutions(
+    pattern: str = None,
+    tags: list[str] = None,
+    jobs: int = None,
+    options: TestOptions = TestOptions(),
+) -> bool:
+    """
+    Тестирует все решения из SOLUTIONS_DIRECTORY, подходящие под фильтры,
+    в пуле процессов и выводит таблицу итогов (по мере готовности,
+    в алфавитном порядке). Возвращает, пройдены ли все тесты всех решений.
+
+    :param pattern: Шаблон имени решения (glob).
+    :param tags: Теги, которые должны быть у задачи решения.
+    :param jobs: Количество процессов (по умолчанию – по количеству ядер).
+    :param options: Параметры запуска тестов каждого решения.
+    """
+    solution_names = get_batch_solution_names(pattern, tags)
+    if not solution_names:
+        print_warning("No solutions found", level=True)
+        return True
+
+    jobs = min(get_jobs_count(0 if jobs is None else jobs), len(solution_names))
+    print_message(f"Solutions: {len(solution_names)}, processes: {jobs}")
+
+    width = max(len(name) for name in solution_names)
+    session = TestSession()
+    count_passed = 0
+    start_time = time.perf_counter()
+
+    # Тесты каждого решения выполняются последовательно в одном процессе пула.
+    executor = create_executor(jobs)
+    futures = {
+        name: executor.submit(run_solution, name, options) for name in solution_names
+    }
+    try:
+        for i, name in enumerate(solution_names):
+            try:
+                run = futures[name].result()
+            except BrokenProcessPool:
+                # Процесс пула завершился аварийно (os._exit, сигнал), и пул
+                # больше не принимает задачи. Неизвестно, какое решение его
+                # завершило, поэтому текущее решение проверяется отдельно,
+                # а незавершенные задачи остальных отправляются в новый пул.
+                executor.shutdown(cancel_futures=True)
+                run = run_solution_alone(name, options)
+                executor = create_executor(jobs)
+                for other_name in solution_names[i + 1 :]:
+                    future = futures[other_name]
+                    if (
+                        not future.done()
+                        or future.cancelled()
+                        or future.exception() is not None
+                    ):
+                        futures[other_name] = executor.submit(
+                            run_solution, other_name, options
+                        )
+
+            print_solution_run(run, width)
+            session.merge(run.session)
+            count_passed += run.success
+
+    finally:
+        executor.shutdown(cancel_futures=True)
+
+    print_message(
+        f"Solutions passed: {count_passed}/{len(solution_names)} "
+        f"({time_to_string(time.perf_counter() - start_time)})"
+    )
+    session.print_status(options.show_time)
+
+    return count_passed == len(solution_names)
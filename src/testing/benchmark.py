@@ -0,0 +1,88 @@
+import gc
+import statistics
+from collections.abc import Sequence
+
+from src.testing.results.bench_stats import BenchStats
+from src.testing.snapshot import ArgsSnapshot
+from src.testing.testers.tester import Tester
+
+# Количество вызовов пустой функции для измерения накладных расходов.
+CALIBRATION_COUNT = 1000
+
+
+def _noop() -> None:
+    pass
+
+
+class Benchmark:
+    """
+    Многократный замер времени выполнения теста:
+    сначала прогревочные запуски, затем замеры.
+    Перед каждым запуском собирается мусор, а во время запуска
+    сборщик мусора отключен, чтобы его паузы не попадали в замеры.
+    Из каждого замера вычитаются накладные расходы тестировщика
+    на вызов тестируемого кода, измеренные на пустой функции.
+    """
+
+    def __init__(self, repeat: int, warmup: int = 0):
+        """
+        :param repeat: Количество замеров.
+        :param warmup: Количество прогревочных запусков.
+        """
+        if repeat < 1:
+            raise ValueError("Number of benchmark repetitions must be positive")
+        if warmup < 0:
+            raise ValueError("Number of warmup runs must not be negative")
+
+        self.repeat = repeat
+        self.warmup = warmup
+        self.__overheads = {}
+
+    def get_overhead(self, tester: Tester) -> float:
+        """
+        Накладные расходы тестировщика на вызов (медиана по нескольким вызовам).
+        """
+        key = id(tester)
+        if key not in self.__overheads:
+            times = [tester.execute(_noop).time for _ in range(CALIBRATION_COUNT)]
+            self.__overheads[key] = statistics.median(times)
+
+        return self.__overheads[key]
+
+    def measure(
+        self, tester: Tester, args: Sequence, debug: bool = False
+    ) -> BenchStats:
+        """
+        :param tester: Тестировщик.
+        :param args: Аргументы теста в исходном состоянии
+        (каждый запуск получает их копию, так как код может их изменять).
+        :param debug: Выводить отладочные данные.
+        """
+        overhead = self.get_overhead(tester)
+        snapshot = ArgsSnapshot(args)
+        times = []
+
+        # Отслеживание памяти, профилирование и замер вызовов методов
+        # замедляют выполнение и не должны влиять на замеры.
+        trace_memory, tester.trace_memory = tester.trace_memory, False
+        profiler, tester.profiler = tester.profiler, None
+        trace_methods, tester.trace_methods = tester.trace_methods, False
+        try:
+            for i in range(self.warmup + self.repeat):
+                run_args = snapshot.restore()
+                gc.collect()
+                gc.disable()
+                try:
+                    result = tester.run(run_args, debug)
+                finally:
+                    gc.enable()
+
+                if i >= self.warmup:
+                    times.append(max(0.0, result.time - overhead))
+
+        finally:
+            tester.trace_memory = trace_memory
+            tester.profiler = profiler
+            tester.trace_methods = trace_methods
+
+        return BenchStats.from_times(times)
@@ -0,0 +1,219 @@
+import hashlib
+import json
+import marshal
+import os
+import struct
+from collections.abc import Callable, Iterable, Iterator
+from typing import Any, BinaryIO
+
+from src.config import CACHE_DIRECTORY
+from src.utils.file import create_text_file, read_text_file, read_text_file_lines
+
+
+class ResultCache:
+    """
+    Кэш пройденных тестов решения.
+    Ключ теста – хэш исходного кода решения, его настроек, имени тестировщика
+    и самого теста, поэтому любое изменение этих данных делает запись
+    недействительной. Значение – время выполнения теста.
+    """
+
+    def __init__(self, name: str, sources: Iterable[bytes | str]):
+        """
+        :param name: Имя кэша (имя решения).
+        :param sources: Данные, от которых зависят результаты всех тестов
+        (исходный код решения и настроек, имя тестировщика).
+        """
+        self.__file_name = os.path.join(CACHE_DIRECTORY, f"{name}.json")
+        self.__hash = hashlib.sha256()
+        for source in sources:
+            self.__hash.update(self.__to_bytes(source))
+            self.__hash.update(b"\0")
+
+        self.__times = {}
+        self.__used_times = {}
+
+    @staticmethod
+    def __to_bytes(value: bytes | str) -> bytes:
+        return value if isinstance(value, bytes) else value.encode("utf-8")
+
+    def load(self) -> None:
+        if not os.path.exists(self.__file_name):
+            return
+
+        try:
+            self.__times = json.loads(read_text_file(self.__file_name))
+        except ValueError:
+            self.__times = {}
+
+    def save(self) -> None:
+        """
+        Сохраняет записи тестов текущего запуска
+        (записи удаленных или измененных тестов отбрасываются).
+        """
+        os.makedirs(CACHE_DIRECTORY, exist_ok=True)
+        temp_file_name = self.__file_name + ".tmp"
+        create_text_file(temp_file_name, json.dumps(self.__used_times))
+        os.replace(temp_file_name, self.__file_name)
+
+    def get_key(self, test: Any) -> str:
+        hash_ = self.__hash.copy()
+        hash_.update(self.__to_bytes(repr(test)))
+        return hash_.hexdigest()
+
+    def get(self, key: str) -> float | None:
+        """
+        Время выполнения пройденного теста или None, если его нет в кэше.
+        """
+        run_time = self.__times.get(key)
+        if run_time is not None:
+            self.__used_times[key] = run_time
+        return run_time
+
+    def add(self, key: str, run_time: float) -> None:
+        self.__times[key] = run_time
+        self.__used_times[key] = run_time
+
+
+# Максимальный размер заголовка кэша разобранных тестов в байтах.
+MAX_HEADER_SIZE = 4096
+
+
+class ParsedTestsCache:
+    """
+    Кэш разобранных тестов из файла тестов решения.
+    Тесты хранятся в двоичном виде (marshal) по одному и читаются по мере
+    выполнения, поэтому повторный разбор текста (JSON) не требуется.
+    Кэш действителен, пока не изменились время изменения и размер файла тестов,
+    а также способ его разбора (тестировщик).
+    """
+
+    VERSION = 1
+
+    # Каждая запись – длина данных и сами данные, сериализованные marshal
+    # (чтение записи целиком и marshal.loads намного быстрее marshal.load,
+    # читающего файл небольшими частями).
+    RECORD_SIZE = struct.Struct("<Q")
+
+    def __init__(self, name: str):
+        """
+        :param name: Имя кэша (имя решения).
+        """
+        self.__file_name = os.path.join(CACHE_DIRECTORY, f"{name}.tests.cache")
+
+    @classmethod
+    def __write_record(cls, f: BinaryIO, value: Any) -> None:
+        data = marshal.dumps(value)
+        f.write(cls.RECORD_SIZE.pack(len(data)))
+        f.write(data)
+
+    @classmethod
+    def __read_record(cls, f: BinaryIO, max_size: int = None) -> Any:
+        """
+        Читает запись. В конце файла выбрасывает EOFError.
+
+        :param max_size: Максимальный допустимый размер записи
+        (для проверки заголовка файла, который может быть поврежден).
+        """
+        size = f.read(cls.RECORD_SIZE.size)
+        if len(size) < cls.RECORD_SIZE.size:
+            raise EOFError()
+
+        (size,) = cls.RECORD_SIZE.unpack(size)
+        if max_size is not None and size > max_size:
+            raise ValueError("Invalid record size")
+
+        data = f.read(size)
+        if len(data) < size:
+            raise EOFError()
+        return marshal.loads(data)
+
+    def __get_header(self, test_file_name: str, parser_name: str) -> tuple:
+        stat = os.stat(test_file_name)
+        return self.VERSION, parser_name, stat.st_mtime_ns, stat.st_size
+
+    def __load(self, header: tuple) -> Iterator[Any] | None:
+        """
+        Итератор по тестам из кэша или None, если кэш недействителен.
+        """
+        try:
+            f = open(self.__file_name, "rb")
+        except OSError:
+            return None
+
+        try:
+            if self.__read_record(f, MAX_HEADER_SIZE) != header:
+                f.close()
+                return None
+        except (EOFError, ValueError, TypeError):
+            f.close()
+            return None
+
+        def load_tests() -> Iterator[Any]:
+            with f:
+                while True:
+                    try:
+                        yield self.__read_record(f)
+                    except EOFError:
+                        return
+
+        return load_tests()
+
+    def __write(
+        self,
+        test_file_name: str,
+        parse: Callable[[Iterable[str]], Iterable[Any]],
+        header: tuple,
+    ) -> Iterator[Any] | None:
+        """
+        Разбирает все тесты файла, записывает их в кэш и возвращает итератор
+        по тестам из кэша или None, если файл тестов не удалось разобрать
+        (или кэш записать).
+        """
+        os.makedirs(CACHE_DIRECTORY, exist_ok=True)
+        temp_file_name = f"{self.__file_name}.{os.getpid()}.tmp"
+        try:
+            with open(temp_file_name, "wb") as f:
+                self.__write_record(f, header)
+                for test in parse(read_text_file_lines(test_file_name)):
+                    self.__write_record(f, test)
+            os.replace(temp_file_name, self.__file_name)
+
+        except Exception:
+            if os.path.exists(temp_file_name):
+                os.remove(temp_file_name)
+            return None
+
+        except BaseException:
+            if os.path.exists(temp_file_name):
+                os.remove(temp_file_name)
+            raise
+
+        return self.__load(header)
+
+    def read(
+        self,
+        test_file_name: str,
+        parse: Callable[[Iterable[str]], Iterable[Any]],
+        parser_name: str,
+    ) -> Iterator[Any]:
+        """
+        Тесты из файла: из кэша, если он действителен, иначе разобранные
+        из текста файла. Кэш записывается целиком до выдачи первого теста:
+        тестируемый код в это время не выполняется, поэтому его аварийное
+        завершение (os._exit) не оставляет временный файл кэша.
+        Если файл тестов не удалось разобрать, тесты выдаются из текста файла
+        без кэша (до теста с ошибкой).
+
+        :param test_file_name: Файл тестов.
+        :param parse: Функция разбора строк файла тестов.
+        :param parser_name: Имя способа разбора (при его смене кэш недействителен).
+        """
+        header = self.__get_header(test_file_name, parser_name)
+        tests = self.__load(header)
+        if tests is None:
+            tests = self.__write(test_file_name, parse, header)
+        if tests is None:
+            tests = parse(read_text_file_lines(test_file_name))
+
+        yield from tests
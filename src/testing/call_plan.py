@@ -0,0 +1,152 @@
+import inspect
+from collections.abc import Callable, Sequence
+from typing import Any, get_origin
+
+from src.nodes.node import Node, get_nodes
+from src.utils.general import args_to_string
+
+# Виды параметров, которые можно проверить без связывания аргументов.
+POSITIONAL_KINDS = (
+    inspect.Parameter.POSITIONAL_ONLY,
+    inspect.Parameter.POSITIONAL_OR_KEYWORD,
+)
+
+
+def get_param_node_class(param: inspect.Parameter) -> type[Node] | None:
+    """
+    Класс узла, указанный в аннотации параметра (по имени класса).
+    """
+    annotation = str(param.annotation)
+    for node_class in get_nodes():
+        if node_class.__name__ in annotation or node_class.ALT_NAME in annotation:
+            return node_class
+
+    return None
+
+
+def get_param_type(param: inspect.Parameter) -> type | None:
+    """
+    Тип, которому должен соответствовать аргумент (None – не проверяется).
+    Строковые аннотации, объединения типов и типы, не являющиеся
+    классами (Any), не проверяются.
+    """
+    if param.annotation is inspect.Parameter.empty:
+        return None
+
+    annotation = get_origin(param.annotation) or param.annotation
+    return annotation if isinstance(annotation, type) else None
+
+
+class CallPlan:
+    """
+    План вызова тестируемой функции, составленный один раз по ее сигнатуре:
+    количество обязательных параметров, преобразование списков в узлы
+    для параметров-узлов, проверки типов аргументов и преобразование
+    результата. Поэтому для каждого теста не нужно заново разбирать сигнатуру.
+    План не хранит саму функцию (тестировщики передаются в процессы пула).
+    """
+
+    def __init__(self, func: Callable):
+        signature = inspect.signature(func)
+        params = list(signature.parameters.values())
+
+        self.name = func.__qualname__
+        self.count_required = sum(
+            1 for param in params if param.default is inspect.Parameter.empty
+        )
+        self.__signature = signature
+        # Аргументы можно проверить по позициям, без связывания.
+        self.__positional = all(param.kind in POSITIONAL_KINDS for param in params)
+        self.__node_classes = [get_param_node_class(param) for param in params]
+        self.__has_nodes = any(self.__node_classes)
+        self.__types = {param.name: get_param_type(param) for param in params}
+        self.__count_params = len(params)
+        # Позиции и типы проверяемых аргументов.
+        self.__checked_types = [
+            (i, param_type)
+            for i, param_type in enumerate(self.__types.values())
+            if param_type is not None
+        ]
+
+        # Узлы в результате преобразуются в списки, а пустой результат
+        # функции, возвращающей узел, – в пустой список.
+        self.__result_node_classes = tuple(get_nodes())
+        return_annotation = str(signature.return_annotation)
+        self.__returns_node = any(
+            node_class.__name__ in return_annotation
+            for node_class in self.__result_node_classes
+        )
+
+    @property
+    def converts_args(self) -> bool:
+        """
+        Хотя бы один аргумент конвертируется в узел.
+        """
+        return self.__has_nodes
+
+    @property
+    def converts_result(self) -> bool:
+        """
+        Функция возвращает узел (по аннотации).
+        """
+        return self.__returns_node
+
+    def convert_args(self, args: Sequence) -> list:
+        """
+        Конвертирует списки в узлы (и списки списков – в списки узлов),
+        если соответствующие параметры функции имеют аннотацию узла.
+        """
+        result_args = list(args)
+        if not self.__has_nodes:
+            return result_args
+
+        for i, (arg, node_class) in enumerate(zip(args, self.__node_classes)):
+            if node_class is None:
+                continue
+            if len(arg) and isinstance(arg[0], Sequence):
+                result_args[i] = [node_class.from_list(x) or [] for x in arg]
+            else:
+                result_args[i] = node_class.from_list(arg) or []
+
+        return result_args
+
+    def convert_result(self, value: Any) -> Any:
+        """
+        Конвертирует узел в список.
+        """
+        if isinstance(value, self.__result_node_classes):
+            return value.to_list()
+        if value is None and self.__returns_node:
+            return []
+
+        return value
+
+    def validate(self, args: Sequence) -> None:
+        """
+        Проверяет, что аргументы подходят под сигнатуру функции
+        (по количеству и по типам, указанным в аннотациях).
+        """
+        if self.__positional:
+            count = len(args)
+            valid = self.count_required <= count <= self.__count_params
+            for i, param_type in self.__checked_types:
+                if i < count and not isinstance(args[i], param_type):
+                    valid = False
+                    break
+        else:
+            try:
+                bound_args = self.__signature.bind(*args)
+                valid = all(
+                    self.__types[name] is None or isinstance(value, self.__types[name])
+                    for name, value in bound_args.arguments.items()
+                )
+            except TypeError:
+                valid = False
+
+        if not valid:
+            parameters = ", ".join(map(str, self.__signature.parameters.values()))
+            raise TypeError(
+                f"Arguments ({args_to_string(*args)}) "
+                f"are not suitable for the signature of function "
+                f"{self.name}({parameters})"
+            )
@@ -0,0 +1,240 @@
+import math
+import time
+from collections.abc import Callable, Sequence
+from typing import Any
+
+from src.config import (
+    COMPLEXITY_MAX_SIZE,
+    COMPLEXITY_MIN_NOISE,
+    COMPLEXITY_MIN_POINTS,
+    COMPLEXITY_MIN_SIZE,
+    COMPLEXITY_REPEAT,
+    COMPLEXITY_RUN_TIME_LIMIT,
+    COMPLEXITY_SIZE_FACTOR,
+    COMPLEXITY_SIZE_TIME,
+    COMPLEXITY_TIME_BUDGET,
+)
+from src.testing.benchmark import Benchmark
+from src.testing.results.complexity_result import ComplexityResult
+from src.testing.results.verdict import Verdict
+from src.testing.testers.tester import Tester
+
+# Классы сложности в порядке роста и логарифмы их функций роста
+# (в логарифмах, чтобы 2ⁿ не переполнялось на больших n).
+COMPLEXITY_CLASSES: dict[str, Callable[[int], float]] = {
+    "O(1)": lambda n: 0.0,
+    "O(log n)": lambda n: math.log(math.log(n)),
+    "O(n)": lambda n: math.log(n),
+    "O(n log n)": lambda n: math.log(n) + math.log(math.log(n)),
+    "O(n²)": lambda n: 2 * math.log(n),
+    "O(2ⁿ)": lambda n: n * math.log(2),
+}
+
+# Альтернативные написания степеней в обозначениях сложности.
+COMPLEXITY_ALIASES = {
+    "**2": "²",
+    "^2": "²",
+    "**n": "ⁿ",
+    "^n": "ⁿ",
+}
+
+
+def _normalize_complexity(name: str) -> str:
+    name = "".join(name.split()).lower()
+    for alias, value in COMPLEXITY_ALIASES.items():
+        name = name.replace(alias, value)
+    return name.replace("o(", "O(")
+
+
+def parse_complexity(name: str) -> str:
+    """
+    Приводит обозначение сложности к одному из COMPLEXITY_CLASSES.
+    Допускаются пробелы в любом месте и степени в виде "^2" или "**2".
+    """
+    if not isinstance(name, str):
+        raise Exception("Complexity must be specified by the string")
+
+    normalized = _normalize_complexity(name)
+    for complexity in COMPLEXITY_CLASSES:
+        if _normalize_complexity(complexity) == normalized:
+            return complexity
+
+    raise Exception(
+        f'Unknown complexity "{name}", '
+        f'expected one of: {", ".join(COMPLEXITY_CLASSES)}'
+    )
+
+
+def get_complexity_rank(name: str) -> int:
+    return list(COMPLEXITY_CLASSES).index(name)
+
+
+def _fit_error(
+    sizes: Sequence[int], times: Sequence[float], log_func: Callable[[int], float]
+) -> float:
+    """
+    Средняя квадратичная относительная ошибка приближения времени
+    функцией вида a * f(n) + b (a, b >= 0).
+    Ошибки относительные, так как время на разных размерах
+    отличается на порядки и иначе приближение определялось бы
+    только самыми большими размерами.
+    """
+    logs = [log_func(n) for n in sizes]
+    max_log = max(logs)
+    # Значения функции нормированы на максимальное (от 0 до 1).
+    xs = [math.exp(x - max_log) for x in logs]
+    ws = [1 / max(t, 1e-9) ** 2 for t in times]
+
+    sw = sum(ws)
+    sx = sum(w * x for w, x in zip(ws, xs))
+    sxx = sum(w * x * x for w, x in zip(ws, xs))
+    st = sum(w * t for w, t in zip(ws, times))
+    sxt = sum(w * x * t for w, x, t in zip(ws, xs, times))
+
+    det = sw * sxx - sx * sx
+    if det <= 1e-12 * sw * sxx:
+        a, b = 0.0, st / sw
+    else:
+        a = (sw * sxt - sx * st) / det
+        b = (st - a * sx) / sw
+        if a < 0:
+            a, b = 0.0, st / sw
+        elif b < 0:
+            a, b = sxt / sxx, 0.0
+
+    return sum(w * (a * x + b - t) ** 2 for w, x, t in zip(ws, xs, times)) / len(times)
+
+
+def choose_complexity(
+    sizes: Sequence[int], times: Sequence[float], noise: float = 0.0
+) -> str:
+    """
+    Класс сложности, лучше всего приближающий измерения.
+    Модели более быстрого роста приближают данные не хуже медленных
+    (коэффициент при функции может быть почти нулевым), поэтому
+    выбирается самый медленный класс, ошибка которого близка к наименьшей
+    с учетом разброса самих измерений.
+
+    :param noise: Средний квадрат относительного разброса измерений.
+    """
+    errors = {
+        name: _fit_error(sizes, times, log_func)
+        for name, log_func in COMPLEXITY_CLASSES.items()
+    }
+    min_error = min(errors.values())
+
+    for name, error in errors.items():
+        if error <= min_error * 1.5 + noise:
+            return name
+
+
+def fit_complexity(
+    sizes: Sequence[int], times: Sequence[float], noise: float = 0.0
+) -> tuple[str, float]:
+    """
+    Подбирает класс сложности по времени выполнения на разных размерах.
+    Возвращает класс сложности и уверенность (от 0 до 1) – долю
+    измерений, при исключении каждого из которых выбирается тот же класс.
+
+    :param noise: Средний квадрат относительного разброса измерений.
+    """
+    complexity = choose_complexity(sizes, times, noise)
+
+    matches = 0
+    for i in range(len(sizes)):
+        if (
+            choose_complexity(
+                sizes[:i] + sizes[i + 1 :], times[:i] + times[i + 1 :], noise
+            )
+            == complexity
+        ):
+            matches += 1
+
+    return complexity, matches / len(sizes)
+
+
+def get_sizes() -> list[int]:
+    """
+    Геометрически растущие размеры входных данных.
+    """
+    sizes = []
+    size = COMPLEXITY_MIN_SIZE
+    while size <= COMPLEXITY_MAX_SIZE:
+        if not sizes or round(size) > sizes[-1]:
+            sizes.append(round(size))
+        size *= COMPLEXITY_SIZE_FACTOR
+
+    return sizes
+
+
+def analyze_complexity(
+    tester: Tester,
+    generator: Callable[[int], tuple[Sequence, Any]],
+    declared: str | None = None,
+    debug: bool = False,
+) -> ComplexityResult:
+    """
+    Измеряет время выполнения на растущих размерах входных данных
+    и подбирает класс сложности.
+    Рост размера прекращается, когда время одного запуска превышает
+    COMPLEXITY_SIZE_TIME (или ограничение по времени),
+    либо когда исчерпано общее время анализа.
+
+    :param tester: Тестировщик.
+    :param generator: Генератор теста, принимающий размер входных данных.
+    :param declared: Заявленный класс сложности.
+    :param debug: Выводить отладочные данные.
+    """
+    if not tester.time_limit:
+        tester.time_limit = COMPLEXITY_RUN_TIME_LIMIT
+
+    benchmark = Benchmark(COMPLEXITY_REPEAT, warmup=1)
+    sizes, times, noises = [], [], []
+    total_time = 0
+    start_time = time.perf_counter()
+
+    for size in get_sizes():
+        args, expected = generator(size)
+        tester.validate_args_and_expected(args, expected)
+
+        result = tester.run(args, debug)
+        total_time += result.time
+        if result.verdict is Verdict.TLE:
+            break
+        if result.verdict is not None:
+            return ComplexityResult(
+                sizes, times, None, 0, total_time, result.verdict, result.error
+            )
+
+        # Медленные запуски не повторяются: их погрешность мала.
+        if result.time < COMPLEXITY_SIZE_TIME:
+            stats = benchmark.measure(tester, result.args_before, debug)
+            run_time = stats.median
+            noises.append((stats.stddev / max(stats.median, 1e-9)) ** 2)
+        else:
+            run_time = result.time
+
+        sizes.append(size)
+        times.append(run_time)
+
+        if (
+            run_time >= COMPLEXITY_SIZE_TIME
+            or time.perf_counter() - start_time >= COMPLEXITY_TIME_BUDGET
+        ):
+            break
+
+    if len(sizes) < COMPLEXITY_MIN_POINTS:
+        raise Exception(
+            f"Complexity analysis needs at least {COMPLEXITY_MIN_POINTS} "
+            f"input sizes, only {len(sizes)} measured in time"
+        )
+
+    noise = max(sum(noises) / len(noises) if noises else 0, COMPLEXITY_MIN_NOISE)
+    complexity, confidence = fit_complexity(sizes, times, noise)
+    verdict = (
+        Verdict.OK
+        if declared is None
+        or get_complexity_rank(complexity) <= get_complexity_rank(declared)
+        else Verdict.WA
+    )
+    return ComplexityResult(sizes, times, complexity, confidence, total_time, verdict)
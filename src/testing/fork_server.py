@@ -0,0 +1,238 @@
+"""
+Сервер запуска решений в отдельных процессах.
+Запускается как отдельный скрипт (python fork_server.py <дескриптор>)
+и импортирует только стандартную библиотеку, чтобы процессы решений
+не наследовали состояние тестирующего кода.
+
+Сервер заранее импортирует часто используемые модули и держит наготове
+порожденный процесс, ожидающий запрос. Каждый тест выполняется в новом
+процессе: решение запускается как скрипт (__main__) с подмененными
+дескрипторами 0, 1 и 2, как при "python solution.py" в системе проверки.
+"""
+
+import sys
+
+# Папка скрипта (src/testing) не должна быть видна решению и импорту модулей.
+del sys.path[0]
+
+import json  # noqa: E402
+import os  # noqa: E402
+import runpy  # noqa: E402
+import signal  # noqa: E402
+import socket  # noqa: E402
+import time  # noqa: E402
+import traceback  # noqa: E402
+from importlib import import_module  # noqa: E402
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# Модули, импортируемые заранее (обычно используются решениями).
+PRELOAD_MODULES = (
+    "array",
+    "bisect",
+    "collections",
+    "copy",
+    "dataclasses",
+    "decimal",
+    "fractions",
+    "functools",
+    "heapq",
+    "io",
+    "itertools",
+    "math",
+    "operator",
+    "random",
+    "re",
+    "statistics",
+    "string",
+    "typing",
+)
+
+# Наибольший размер сообщения между процессами в байтах.
+MESSAGE_SIZE = 65536
+
+# Файл с информацией об использовании памяти текущим процессом (Linux).
+STATM_FILE_NAME = "/proc/self/statm"
+
+
+def set_limits(time_limit: float | None, memory_limit: float | None) -> None:
+    """
+    Ограничения процесса решения. По истечении времени процесс
+    завершается сигналом SIGALRM, при превышении памяти выделение
+    памяти завершается ошибкой MemoryError.
+
+    :param time_limit: Ограничение по времени в секундах.
+    :param memory_limit: Ограничение по памяти в мегабайтах.
+    """
+    if time_limit:
+        signal.signal(signal.SIGALRM, signal.SIG_DFL)
+        signal.setitimer(signal.ITIMER_REAL, time_limit)
+
+    if memory_limit and resource is not None and os.path.exists(STATM_FILE_NAME):
+        with open(STATM_FILE_NAME) as f:
+            size = int(f.read().split()[0]) * os.sysconf("SC_PAGE_SIZE")
+        _, hard = resource.getrlimit(resource.RLIMIT_AS)
+        soft = size + int(memory_limit * 2**20)
+        if hard != resource.RLIM_INFINITY:
+            soft = min(soft, hard)
+        resource.setrlimit(resource.RLIMIT_AS, (soft, hard))
+
+
+def get_exit_code(e: SystemExit) -> int:
+    """
+    Код возврата при вызове sys.exit(), как у интерпретатора.
+    """
+    if e.code is None:
+        return 0
+    if isinstance(e.code, int):
+        return e.code
+
+    print(e.code, file=sys.stderr)
+    return 1
+
+
+def print_solution_exception(e: BaseException, path: str) -> None:
+    """
+    Выводит трассировку исключения без кадров сервера и runpy.
+    """
+    tb = e.__traceback__
+    while tb and tb.tb_frame.f_code.co_filename != path:
+        tb = tb.tb_next
+
+    traceback.print_exception(type(e), e, tb or e.__traceback__)
+
+
+def receive_message(sock: socket.socket) -> tuple[bytes, list[int]]:
+    """
+    Получает сообщение (строку, оканчивающуюся переводом строки)
+    и приложенные к нему дескрипторы. Пустое сообщение – соединение закрыто.
+    """
+    message, fds = b"", []
+    while not message.endswith(b"\n"):
+        data, new_fds, _, _ = socket.recv_fds(sock, MESSAGE_SIZE, 3)
+        if not data:
+            return b"", fds
+        message += data
+        fds += new_fds
+
+    return message, fds
+
+
+def run_solution(channel: socket.socket) -> None:
+    """
+    Ожидает запрос и выполняет решение в текущем (порожденном) процессе.
+    Процесс завершается с кодом возврата решения.
+    """
+    message, fds = receive_message(channel)
+    channel.close()
+    if not message:
+        os._exit(0)
+
+    request = json.loads(message)
+    for fd, target in zip(fds, range(3)):
+        os.dup2(fd, target)
+        os.close(fd)
+
+    signal.signal(signal.SIGINT, signal.default_int_handler)
+    set_limits(request["time_limit"], request["memory_limit"])
+
+    path = request["path"]
+    sys.argv = [path]
+    sys.path.insert(0, os.path.dirname(path))
+
+    code = 0
+    try:
+        runpy.run_path(path, run_name="__main__")
+    except SystemExit as e:
+        code = get_exit_code(e)
+    except BaseException as e:
+        print_solution_exception(e, path)
+        code = 1
+
+    for stream in (sys.stdout, sys.stderr):
+        try:
+            stream.flush()
+        except (OSError, ValueError):
+            code = code or 1
+
+    os._exit(code)
+
+
+def fork_solution_process(connection: socket.socket) -> tuple[int, socket.socket]:
+    """
+    Порождает процесс, ожидающий запрос на запуск решения.
+    Возвращает идентификатор процесса и канал для отправки ему запроса.
+    """
+    parent_channel, child_channel = socket.socketpair()
+    pid = os.fork()
+    if pid == 0:
+        parent_channel.close()
+        connection.close()
+        try:
+            run_solution(child_channel)
+        finally:
+            os._exit(1)
+
+    child_channel.close()
+    return pid, parent_channel
+
+
+def serve(connection: socket.socket) -> None:
+    """
+    Обрабатывает запросы, пока тестирующий процесс не закроет соединение.
+    Сообщения – строки JSON. Запрос содержит путь к решению и ограничения,
+    к нему приложены дескрипторы ввода, вывода и потока ошибок. Ответ – время
+    выполнения, процессорным временем и кодом возврата (отрицательный –
+    номер сигнала, завершившего процесс).
+    """
+    pid, channel = fork_solution_process(connection)
+
+    while True:
+        message, fds = receive_message(connection)
+        if not message:
+            break
+
+        start_time = time.perf_counter()
+        socket.send_fds(channel, [message], fds)
+        for fd in fds:
+            os.close(fd)
+        channel.close()
+
+        _, status, usage = os.wait4(pid, 0)
+        run_time = time.perf_counter() - start_time
+
+        response = {
+            "time": run_time,
+            "user_time": usage.ru_utime,
+            "sys_time": usage.ru_stime,
+            "exit_code": os.waitstatus_to_exitcode(status),
+        }
+        connection.sendall(json.dumps(response).encode() + b"\n")
+
+        # Следующий процесс порождается, пока тестирующий процесс
+        # проверяет результат, а не во время выполнения теста.
+        pid, channel = fork_solution_process(connection)
+
+    channel.close()
+    os.waitpid(pid, 0)
+
+
+def main() -> None:
+    # Прерывание с клавиатуры получает тестирующий процесс.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    for name in PRELOAD_MODULES:
+        import_module(name)
+
+    connection = socket.socket(fileno=int(sys.argv[1]))
+    try:
+        serve(connection)
+    except (ConnectionError, KeyboardInterrupt):
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+import os
+import signal
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from types import FrameType
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# Файл с информацией об использовании памяти текущим процессом (Linux).
+STATM_FILE_NAME = "/proc/self/statm"
+
+
+class TimeLimitExceeded(BaseException):
+    """
+    Превышено ограничение по времени выполнения теста.
+    Наследуется от BaseException, чтобы его не перехватил
+    код решения с конструкцией "except Exception".
+    """
+
+
+def is_time_limit_supported() -> bool:
+    return hasattr(signal, "setitimer")
+
+
+def is_memory_limit_supported() -> bool:
+    return resource is not None and os.path.exists(STATM_FILE_NAME)
+
+
+def get_address_space_size() -> int:
+    """
+    Размер виртуального адресного пространства текущего процесса в байтах.
+    """
+    with open(STATM_FILE_NAME) as f:
+        pages = int(f.read().split()[0])
+    return pages * os.sysconf("SC_PAGE_SIZE")
+
+
+def _raise_time_limit_exceeded(signum: int, frame: FrameType) -> None:
+    raise TimeLimitExceeded()
+
+
+@contextmanager
+def limit_resources(
+    time_limit: float | None = None, memory_limit: float | None = None
+) -> Iterator[None]:
+    """
+    Ограничивает время выполнения и объем памяти, выделяемой внутри блока.
+    При превышении времени выбрасывается TimeLimitExceeded (сторожевой таймер),
+    при превышении памяти – MemoryError (ограничение RLIMIT_AS).
+    Ограничения, не поддерживаемые платформой, игнорируются.
+
+    :param time_limit: Ограничение по времени в секундах.
+    :param memory_limit: Ограничение по памяти в мегабайтах.
+    """
+    is_main_thread = threading.current_thread() is threading.main_thread()
+    use_timer = bool(time_limit) and is_main_thread and is_time_limit_supported()
+    use_memory = bool(memory_limit) and is_memory_limit_supported()
+
+    if use_memory:
+        old_memory_limit = resource.getrlimit(resource.RLIMIT_AS)
+        new_memory_limit = get_address_space_size() + int(memory_limit * 2**20)
+        if old_memory_limit[1] != resource.RLIM_INFINITY:
+            new_memory_limit = min(new_memory_limit, old_memory_limit[1])
+        resource.setrlimit(resource.RLIMIT_AS, (new_memory_limit, old_memory_limit[1]))
+
+    if use_timer:
+        old_handler = signal.signal(signal.SIGALRM, _raise_time_limit_exceeded)
+        signal.setitimer(signal.ITIMER_REAL, time_limit)
+
+    try:
+        yield
+
+    finally:
+        if use_timer:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, old_handler)
+
+        if use_memory:
+            resource.setrlimit(resource.RLIMIT_AS, old_memory_limit)
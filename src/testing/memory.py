@@ -0,0 +1,100 @@
+import os
+import sys
+import tracemalloc
+from collections import Counter
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from types import FrameType
+from typing import Any
+
+# Глубина стека, сохраняемого для каждого выделения памяти при поиске мест,
+# выделивших больше всего памяти.
+TRACEBACK_DEPTH = 32
+
+# Снимок памяти делается, когда ее объем вырос на эту долю с прошлого снимка.
+SNAPSHOT_GROWTH = 0.1
+
+
+@dataclass
+class MemoryUsage:
+    """
+    Пиковый объем памяти, выделенной Python-кодом внутри блока (в байтах).
+    """
+
+    peak: int = 0
+
+
+@contextmanager
+def trace_memory() -> Iterator[MemoryUsage]:
+    """
+    Измеряет пиковый объем памяти, выделенной внутри блока (tracemalloc).
+    Учитывается только память, выделенная через аллокаторы Python.
+    """
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+
+    tracemalloc.reset_peak()
+    current, _ = tracemalloc.get_traced_memory()
+    usage = MemoryUsage()
+
+    try:
+        yield usage
+
+    finally:
+        usage.peak = max(0, tracemalloc.get_traced_memory()[1] - current)
+        if started:
+            tracemalloc.stop()
+
+
+def get_peak_allocations(
+    func: Callable[[], Any], directory: str, limit: int = 10
+) -> list[tuple[tracemalloc.Frame, int]]:
+    """
+    Выполняет функцию и возвращает строки кода из заданной папки,
+    выделившие больше всего памяти, в момент, близкий к пику ее использования.
+    Память, выделенная вызванным из них кодом (например, стандартной
+    библиотекой), относится к ним. Снимки памяти делаются при вызовах
+    и возвратах из функций, только когда объем памяти заметно вырос
+    с прошлого снимка.
+
+    :param func: Функция без аргументов.
+    :param directory: Папка кода, выделения памяти которого учитываются.
+    :param limit: Количество строк.
+    :returns: Список кортежей из строки кода и объема памяти в байтах.
+    """
+    max_size = 0
+    peak_snapshot = None
+
+    def take_snapshot(frame: FrameType, event: str, arg: Any) -> None:
+        nonlocal max_size, peak_snapshot
+        size, _ = tracemalloc.get_traced_memory()
+        if size > max_size * (1 + SNAPSHOT_GROWTH):
+            max_size = size
+            peak_snapshot = tracemalloc.take_snapshot()
+
+    was_tracing = tracemalloc.is_tracing()
+    tracemalloc.stop()
+    tracemalloc.start(TRACEBACK_DEPTH)
+    sys.setprofile(take_snapshot)
+    try:
+        func()
+
+    finally:
+        sys.setprofile(None)
+        take_snapshot(None, "return", None)
+        tracemalloc.stop()
+        if was_tracing:
+            tracemalloc.start()
+
+    directory = os.path.join(os.path.abspath(directory), "")
+    sizes = Counter()
+    for trace in peak_snapshot.traces if peak_snapshot else []:
+        # Кадры упорядочены от самого внешнего к самому внутреннему.
+        for frame in reversed(trace.traceback):
+            if os.path.abspath(frame.filename).startswith(directory):
+                sizes[frame] += trace.size
+                break
+
+    return sizes.most_common(limit)
@@ -0,0 +1,42 @@
+from array import array
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+
+@dataclass
+class OpLog:
+    """
+    Последовательность команд теста класса в столбцовом виде:
+    имена методов хранятся один раз, команды – номерами имен
+    в компактном массиве, аргументы – отдельным столбцом (списки аргументов
+    теста не копируются: распаковка списка при вызове не медленнее кортежа).
+    """
+
+    # Различные имена методов в порядке первого вызова.
+    names: tuple[str, ...]
+    # Номер имени метода для каждой команды (кроме создания объекта).
+    ids: array
+    # Аргументы конструктора.
+    init_args: Sequence
+    # Аргументы каждой команды (кроме создания объекта).
+    args: Sequence[Sequence]
+
+    @classmethod
+    def from_test(cls, commands: Sequence[str], args_list: Sequence) -> "OpLog":
+        """
+        Составляет журнал по спискам команд и их аргументов
+        (первая команда – создание объекта).
+        """
+        method_names = commands[1:]
+        names = tuple(dict.fromkeys(method_names))
+        index = {name: i for i, name in enumerate(names)}
+
+        return cls(
+            names=names,
+            ids=array("I", map(index.__getitem__, method_names)),
+            init_args=args_list[0],
+            args=args_list[1:],
+        )
+
+    def __len__(self) -> int:
+        return len(self.ids)
@@ -0,0 +1,49 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class TestOptions:
+    """
+    Параметры запуска тестов решения (задаются в командной строке).
+    """
+
+    # Показывать время выполнения каждого теста.
+    show_time: bool = False
+    # Выводить отладочные данные.
+    debug: bool = False
+    # Количество процессов для параллельного запуска тестов
+    # (None – 1, 0 – по количеству ядер).
+    jobs: int | None = None
+    # Не выполнять тесты, пройденные при предыдущих запусках
+    # (если с тех пор не изменились решение, его настройки и сам тест).
+    use_cache: bool = True
+    # Количество замеров времени выполнения каждого теста (режим бенчмарка).
+    # В этом режиме тесты запускаются в одном процессе и без кэша,
+    # так как замеры должны быть сопоставимы.
+    bench: int | None = None
+    # Количество прогревочных запусков перед замерами.
+    warmup: int = 0
+    # Вместо тестов подобрать класс сложности решения по времени выполнения
+    # на тестах из COMPLEXITY_GENERATOR и сравнить его с заявленным в COMPLEXITY.
+    complexity: bool = False
+    # Измерять пиковый объем памяти, выделенной каждым тестом, и вывести строки
+    # кода, выделившие больше всего памяти в самом тяжелом тесте.
+    # Тесты запускаются без кэша.
+    memory: bool = False
+    # Профилировать решение на всех тестах, вывести функции с наибольшим
+    # временем выполнения и сохранить профиль в PROFILE_DIRECTORY.
+    # Тесты запускаются в одном процессе и без кэша.
+    profile: bool = False
+    # Для каждого теста тестировщика класса выводить статистику времени вызовов
+    # по методам (количество, сумма, p50, p99, максимум и номер самого долгого
+    # вызова). Тесты запускаются без кэша.
+    methods: bool = False
+    # Запускать каждый тест потокового решения как отдельный процесс
+    # "python solution.py" (как в системе проверки). Время выполнения включает
+    # импорт решения, а выводится также процессорное время и код возврата.
+    isolated: bool = False
+    # Выводить только непройденные тесты (пачками)
+    # и строку прогресса со скоростью тестирования.
+    quiet: bool = False
+    # Длина сокращенного представления аргументов и результатов.
+    preview: int | None = None
@@ -0,0 +1,234 @@
+import os
+import random
+import sys
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from itertools import islice
+from typing import Any
+
+from src.testing.benchmark import Benchmark
+from src.testing.results.result import Result
+from src.testing.snapshot import ArgsSnapshot
+from src.testing.stdio import STDIN_FILENO, reopen_stdin
+from src.testing.testers.tester import Tester
+
+# Количество тестов, отправляемых в процесс за одну задачу.
+CHUNK_SIZE = 8
+
+# Количество задач на один процесс, которые могут выполняться одновременно.
+TASKS_PER_WORKER = 4
+
+
+@dataclass
+class CompletedTest:
+    """
+    Тест, результат которого уже известен (например, взят из кэша).
+    """
+
+    result: Result
+    expected: Any
+
+
+Test = tuple[Sequence, Any] | Callable[[], tuple[Sequence, Any]] | CompletedTest
+
+
+def get_jobs_count(jobs: int | None) -> int:
+    """
+    Количество процессов для тестирования.
+    Неположительное значение – по количеству ядер процессора.
+    """
+    if jobs is None:
+        return 1
+
+    return jobs if jobs > 0 else os.cpu_count() or 1
+
+
+def init_worker() -> None:
+    # Генераторы тестов в процессах не должны повторять друг друга
+    # (при fork состояние random копируется из родительского процесса).
+    random.seed()
+    reopen_stdin()
+
+
+class TestExecutor(ProcessPoolExecutor):
+    """
+    Пул процессов для запуска тестов.
+    multiprocessing закрывает sys.stdin в процессах, созданных через fork.
+    Поэтому, пока пул работает, sys.stdin родительского процесса заменен
+    копией на том же дескрипторе. Закрывается копия, а исходный объект,
+    который решение могло сохранить при импорте (input = sys.stdin.readline),
+    остается открытым.
+    """
+
+    def __init__(self, max_workers: int):
+        super().__init__(max_workers=max_workers, initializer=init_worker)
+        self.__stdin = sys.stdin
+        if sys.stdin is not None and sys.stdin is sys.__stdin__:
+            sys.stdin = open(STDIN_FILENO, encoding="utf-8", closefd=False)
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        super().shutdown(wait, cancel_futures=cancel_futures)
+        if sys.stdin is not self.__stdin:
+            sys.stdin.close()
+            sys.stdin = self.__stdin
+
+
+def create_executor(jobs: int) -> ProcessPoolExecutor:
+    return TestExecutor(jobs)
+
+
+def run_test(
+    tester: Tester, test: Test, debug: bool = False, benchmark: Benchmark = None
+) -> tuple[Result, Any]:
+    """
+    Запускает тест и возвращает его результат и ожидаемое значение.
+
+    :param tester: Тестировщик.
+    :param test: Кортеж из аргументов теста и ожидаемого значения
+    или функция-генератор, возвращающая такой кортеж.
+    :param debug: Выводить отладочные данные.
+    :param benchmark: Замер времени выполнения теста по нескольким повторениям
+    (для тестов, завершившихся без ошибок).
+    """
+    if isinstance(test, CompletedTest):
+        return test.result, test.expected
+
+    args, expected = test() if callable(test) else test
+    tester.validate_args_and_expected(args, expected)
+    result = tester.run(args, debug)
+
+    if benchmark and result.verdict is None:
+        result.bench = benchmark.measure(tester, result.args_before, debug)
+
+    return result, expected
+
+
+def run_tests(
+    tester: Tester, tests: Sequence[Test], debug: bool = False
+) -> list[tuple[Result, Any]]:
+    return [run_test(tester, test, debug) for test in tests]
+
+
+def run_reference(
+    reference: Tester, generator: Callable[[], tuple[Sequence, Any]], debug: bool
+) -> tuple[Sequence, Any]:
+    """
+    Генерирует тест и вычисляет ожидаемое значение эталонным решением.
+    Возвращает аргументы теста в исходном состоянии и результат эталона.
+
+    :param reference: Тестировщик эталонного решения.
+    :param generator: Генератор теста (его ожидаемое значение
+    используется только для проверки формата теста).
+    :param debug: Выводить отладочные данные.
+    """
+    args, expected = generator()
+    reference.validate_args_and_expected(args, expected)
+    # Тестируемое решение должно получить аргументы в исходном состоянии.
+    # Без отслеживания изменений args_before – те же объекты, что получил
+    # эталон, поэтому эталон выполняется на копии.
+    if reference.track_mutations:
+        result = reference.run(args, debug)
+        args = result.args_before
+    else:
+        result = reference.run(ArgsSnapshot(args).restore(), debug)
+
+    if result.verdict is not None:
+        raise Exception(
+            f"Reference solution failed with {result.verdict} on arguments: {args}"
+            + (f"\n{result.error}" if result.error else "")
+        )
+
+    return args, result.value
+
+
+def run_references(
+    reference: Tester,
+    generator: Callable[[], tuple[Sequence, Any]],
+    count: int,
+    debug: bool = False,
+) -> list[tuple[Sequence, Any]]:
+    return [run_reference(reference, generator, debug) for _ in range(count)]
+
+
+def run_references_in_executor(
+    reference: Tester,
+    generator: Callable[[], tuple[Sequence, Any]],
+    count: int,
+    executor: Executor,
+    jobs: int,
+    debug: bool = False,
+) -> Iterator[tuple[Sequence, Any]]:
+    """
+    Генерирует тесты и вычисляет ожидаемые значения эталонным решением
+    в пуле процессов (эталон обычно медленнее проверяемого решения).
+    Тесты возвращаются по мере готовности в порядке генерации.
+    Если перебор прерван, невыполненные задачи отменяются.
+    """
+    futures = deque()
+    max_futures = jobs * TASKS_PER_WORKER
+
+    try:
+        for start in range(0, count, CHUNK_SIZE):
+            size = min(CHUNK_SIZE, count - start)
+            futures.append(
+                executor.submit(run_references, reference, generator, size, debug)
+            )
+
+            while len(futures) >= max_futures:
+                yield from futures.popleft().result()
+
+        while futures:
+            yield from futures.popleft().result()
+
+    finally:
+        for future in futures:
+            future.cancel()
+
+
+def run_tests_in_executor(
+    tester: Tester,
+    tests: Iterable[Test],
+    executor: Executor,
+    jobs: int,
+    debug: bool = False,
+) -> Iterator[tuple[Result, Any]]:
+    """
+    Запускает тесты в пуле процессов.
+    Результаты возвращаются в исходном порядке тестов.
+    Количество одновременно выполняемых задач ограничено,
+    чтобы не держать в памяти все тестовые данные сразу.
+    """
+    tests = iter(tests)
+    futures = deque()
+    max_futures = jobs * TASKS_PER_WORKER
+
+    try:
+        while chunk := list(islice(tests, CHUNK_SIZE)):
+            # Завершенные тесты не отправляются в процессы,
+            # но занимают свое место в очереди результатов.
+            start = 0
+            for i, test in enumerate(chunk):
+                if isinstance(test, CompletedTest):
+                    if start < i:
+                        futures.append(
+                            executor.submit(run_tests, tester, chunk[start:i], debug)
+                        )
+                    futures.append(Future())
+                    futures[-1].set_result([(test.result, test.expected)])
+                    start = i + 1
+
+            if start < len(chunk):
+                futures.append(executor.submit(run_tests, tester, chunk[start:], debug))
+
+            while len(futures) >= max_futures:
+                yield from futures.popleft().result()
+
+        while futures:
+            yield from futures.popleft().result()
+
+    finally:
+        # Если перебор результатов прерван, невыполненные задачи отменяются.
+        for future in futures:
+            future.cancel()
@@ -0,0 +1,168 @@
+import atexit
+import json
+import os
+import signal
+import socket
+import subprocess
+import sys
+from dataclasses import dataclass
+
+from src.testing.results.verdict import Verdict
+from src.testing.stdio import create_memory_file
+
+# Скрипт сервера, порождающего процессы решений.
+FORK_SERVER_SCRIPT = os.path.join(os.path.dirname(__file__), "fork_server.py")
+
+# Наибольший размер сообщения между процессами в байтах.
+MESSAGE_SIZE = 65536
+
+
+@dataclass
+class ProcessRun:
+    """
+    Результат запуска решения в отдельном процессе.
+    """
+
+    output: bytes
+    errors: bytes
+    # Время от передачи запроса процессу до его завершения.
+    time: float
+    user_time: float
+    sys_time: float
+    # Код возврата (отрицательный – номер сигнала, завершившего процесс).
+    exit_code: int
+
+    def get_verdict(
+        self, time_limit: float | None
+    ) -> tuple[Verdict | None, str | None]:
+        """
+        Вердикт и описание ошибки по коду возврата процесса.
+        Вердикт задан, только если выполнение завершилось ошибкой
+        или превысило ограничения.
+        """
+        errors = self.errors.decode("utf-8", errors="replace").strip()
+
+        if self.exit_code == -signal.SIGALRM or (time_limit and self.time > time_limit):
+            return Verdict.TLE, None
+
+        if self.exit_code == 0:
+            return None, None
+
+        if errors.splitlines() and errors.splitlines()[-1].startswith("MemoryError"):
+            return Verdict.MLE, errors
+
+        if self.exit_code < 0:
+            status = f"Killed by signal {signal.Signals(-self.exit_code).name}"
+        else:
+            status = f"Exit code: {self.exit_code}"
+        return Verdict.RE, f"{errors}\n{status}" if errors else status
+
+
+def is_isolation_supported() -> bool:
+    return hasattr(os, "fork") and hasattr(socket, "send_fds")
+
+
+class ForkServer:
+    """
+    Сервер, запускающий решения в отдельных процессах.
+    Это отдельный интерпретатор с заранее импортированными модулями
+    стандартной библиотеки, который заранее порождает процесс
+    для следующего теста. Поэтому время запуска интерпретатора
+    не входит во время теста, а каждый тест начинается с чистого состояния.
+    """
+
+    def __init__(self):
+        self.__process: subprocess.Popen | None = None
+        self.__connection: socket.socket | None = None
+
+    def start(self) -> None:
+        self.__connection, channel = socket.socketpair()
+        self.__process = subprocess.Popen(
+            [sys.executable, FORK_SERVER_SCRIPT, str(channel.fileno())],
+            pass_fds=[channel.fileno()],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+        )
+        channel.close()
+
+    def stop(self) -> None:
+        if self.__connection:
+            self.__connection.close()
+            self.__process.wait()
+            self.__connection = self.__process = None
+
+    def __receive(self) -> bytes:
+        """
+        Получает ответ сервера (строку JSON, оканчивающуюся переводом строки).
+        """
+        message = b""
+        while not message.endswith(b"\n"):
+            data = self.__connection.recv(MESSAGE_SIZE)
+            if not data:
+                self.stop()
+                raise Exception("Fork server stopped unexpectedly")
+            message += data
+
+        return message
+
+    def run(
+        self,
+        path: str,
+        input_data: bytes,
+        time_limit: float | None = None,
+        memory_limit: float | None = None,
+    ) -> ProcessRun:
+        """
+        Запускает решение как скрипт и передает ему входные данные.
+        Ввод, вывод и поток ошибок процесса – временные файлы в памяти,
+        поэтому их объем не ограничен размером буфера канала.
+
+        :param path: Путь к файлу решения.
+        :param input_data: Входные данные.
+        :param time_limit: Ограничение по времени в секундах.
+        :param memory_limit: Ограничение по памяти в мегабайтах.
+        """
+        if not self.__connection:
+            self.start()
+
+        files = [create_memory_file(name) for name in ("stdin", "stdout", "stderr")]
+        try:
+            files[0].write(input_data)
+            files[0].seek(0)
+
+            request = {
+                "path": os.path.abspath(path),
+                "time_limit": time_limit,
+                "memory_limit": memory_limit,
+            }
+            socket.send_fds(
+                self.__connection,
+                [json.dumps(request).encode() + b"\n"],
+                [file.fileno() for file in files],
+            )
+            response = json.loads(self.__receive())
+
+            # Процесс решения разделял с файлами позицию чтения и записи.
+            files[1].seek(0)
+            files[2].seek(0)
+            return ProcessRun(
+                output=files[1].read(), errors=files[2].read(), **response
+            )
+
+        finally:
+            for file in files:
+                file.close()
+
+
+# Сервер текущего процесса (процессы пула создают свои серверы).
+_server: ForkServer | None = None
+_server_pid: int | None = None
+
+
+def get_fork_server() -> ForkServer:
+    global _server, _server_pid
+
+    if _server is None or _server_pid != os.getpid():
+        _server, _server_pid = ForkServer(), os.getpid()
+        atexit.register(_server.stop)
+    return _server
@@ -0,0 +1,148 @@
+import cProfile
+import os
+import pstats
+from collections import defaultdict
+
+from src.utils.file import create_text_file
+from src.utils.general import time_to_string
+
+# Папка тестирующего кода (его функции исключаются из профиля).
+TESTING_DIRECTORY = os.path.dirname(__file__)
+
+# Максимальная глубина стека в выводе для построения флеймграфа.
+MAX_STACK_DEPTH = 100
+
+# Функция профиля: (имя файла, номер строки, имя функции).
+Function = tuple[str, int, str]
+
+
+def is_harness_function(func: Function) -> bool:
+    filename, _, name = func
+    if filename == "~":
+        return "_lsprof.Profiler" in name
+    return os.path.abspath(filename).startswith(TESTING_DIRECTORY + os.sep)
+
+
+def function_to_string(func: Function) -> str:
+    filename, line, name = func
+    if filename == "~":
+        return name
+    return f"{os.path.relpath(filename)}:{line}({name})"
+
+
+class Profiler:
+    """
+    Профиль выполнения тестируемого кода, накапливаемый по всем тестам.
+    Функции тестирующего кода исключаются из итогового профиля.
+    """
+
+    def __init__(self):
+        self.__profile = cProfile.Profile()
+
+    def __enter__(self) -> "Profiler":
+        """
+        Профилирует код внутри блока with.
+        Вызовы методов профиля попадают только в исключаемые функции.
+        """
+        self.__profile.enable()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.__profile.disable()
+
+    def get_stats(self) -> pstats.Stats:
+        """
+        Статистика профиля без функций тестирующего кода.
+        Функции решения, вызванные тестирующим кодом,
+        становятся корнями графа вызовов.
+        """
+        stats = pstats.Stats(self.__profile)
+        harness = {func for func in stats.stats if is_harness_function(func)}
+
+        for func in harness:
+            del stats.stats[func]
+        for *_, callers in stats.stats.values():
+            for caller in harness & callers.keys():
+                del callers[caller]
+
+        stats.total_tt = sum(tt for _, _, tt, _, _ in stats.stats.values())
+        return stats
+
+    @staticmethod
+    def get_top_functions(stats: pstats.Stats, limit: int) -> str:
+        """
+        Функции с наибольшим суммарным временем (включая вложенные вызовы).
+        """
+        functions = sorted(stats.stats.items(), key=lambda x: x[1][3], reverse=True)
+        lines = [f"{'Calls':>10} {'Own time':>10} {'Total time':>10}  Function"]
+        for func, (_, nc, tt, ct, _) in functions[:limit]:
+            lines.append(
+                f"{nc:>10,} {time_to_string(tt):>10} {time_to_string(ct):>10}  "
+                f"{function_to_string(func)}"
+            )
+        return "\n".join(lines)
+
+    @staticmethod
+    def get_collapsed_stacks(stats: pstats.Stats) -> list[str]:
+        """
+        Стеки вызовов в свернутом формате ("f;g;h вес", вес в микросекундах)
+        для построения флеймграфа.
+        cProfile хранит только пары "вызывающая – вызываемая функция",
+        поэтому время функции, вызываемой из нескольких мест, делится
+        между стеками пропорционально времени вызовов из каждого места.
+        """
+        children = defaultdict(list)
+        for func, (*_, callers) in stats.stats.items():
+            for caller, (_, _, _, ct) in callers.items():
+                if caller != func:
+                    children[caller].append((func, ct))
+
+        stacks = defaultdict(float)
+
+        def walk(func: Function, total: float, path: tuple[Function, ...]) -> None:
+            path += (func,)
+            func_total = stats.stats[func][3]
+            scale = total / func_total if func_total else 0
+            own = total
+
+            if len(path) < MAX_STACK_DEPTH:
+                for child, ct in children[func]:
+                    # Стеки с временем меньше микросекунды не выводятся.
+                    if child not in path and ct * scale >= 1e-6:
+                        own -= ct * scale
+                        walk(child, ct * scale, path)
+
+            stacks[path] += max(own, 0)
+
+        for func, (*_, ct, callers) in stats.stats.items():
+            if not callers.keys() - {func}:
+                walk(func, ct, ())
+
+        return [
+            ";".join(function_to_string(f).replace(";", ",") for f in path)
+            + f" {round(weight * 1e6)}"
+            for path, weight in stacks.items()
+            if round(weight * 1e6) > 0
+        ]
+
+    def save(self, stats: pstats.Stats, path: str) -> tuple[str, str]:
+        """
+        Сохраняет профиль в формате pstats (для pstats, snakeviz и т.п.)
+        и стеки вызовов в свернутом формате (для flamegraph.pl, speedscope).
+        Возвращает пути к файлам.
+
+        :param stats: Статистика профиля.
+        :param path: Путь к файлам без расширения.
+        """
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+
+        pstats_path = path + ".pstats"
+        stats.dump_stats(pstats_path)
+
+        collapsed_path = path + ".collapsed"
+        create_text_file(
+            collapsed_path,
+            "".join(line + "\n" for line in self.get_collapsed_stacks(stats)),
+        )
+
+        return pstats_path, collapsed_path
@@ -0,0 +1,87 @@
+import sys
+import time
+
+from src.config import REPORT_INTERVAL
+
+
+class Reporter:
+    """
+    Вывод результатов тестов.
+    По умолчанию результат каждого теста выводится сразу. В тихом режиме
+    выводятся только непройденные тесты, их описания накапливаются
+    и записываются пачками, а в терминале отображается строка прогресса
+    с количеством выполненных тестов и скоростью тестирования.
+    """
+
+    def __init__(self, quiet: bool = False, preview_length: int = None):
+        """
+        :param quiet: Выводить только непройденные тесты.
+        :param preview_length: Длина сокращенного представления аргументов
+        и результатов (None – значения выводятся полностью).
+        """
+        self.quiet = quiet
+        self.preview_length = preview_length
+        self.__buffer: list[str] = []
+        self.__count_tests = 0
+        self.__count_failed = 0
+        self.__start_time = time.perf_counter()
+        self.__last_time = self.__start_time
+        # Строка прогресса выводится в поток ошибок, только если это терминал.
+        self.__show_progress = quiet and sys.stderr is not None and sys.stderr.isatty()
+        self.__progress_shown = False
+
+    def is_shown(self, success: bool) -> bool:
+        """
+        Выводится ли результат теста (описание строится только для них).
+        """
+        return not self.quiet or not success
+
+    def write(self, message: str) -> None:
+        """
+        Выводит описание результата теста.
+        """
+        if not self.quiet:
+            print(message)
+            return
+
+        self.__buffer.append(message)
+
+    def update(self, success: bool) -> None:
+        """
+        Учитывает выполненный тест. Не чаще, чем раз в REPORT_INTERVAL
+        секунд, накопленный вывод записывается и обновляется строка прогресса.
+        """
+        self.__count_tests += 1
+        self.__count_failed += not success
+        if not self.quiet:
+            return
+
+        now = time.perf_counter()
+        if now - self.__last_time < REPORT_INTERVAL:
+            return
+
+        self.__last_time = now
+        self.flush()
+        if self.__show_progress:
+            speed = self.__count_tests / (now - self.__start_time)
+            sys.stderr.write(
+                f"\rTests: {self.__count_tests:,}, failed: {self.__count_failed:,} "
+                f"({speed:,.0f} tests/s)"
+            )
+            sys.stderr.flush()
+            self.__progress_shown = True
+
+    def flush(self) -> None:
+        """
+        Стирает строку прогресса и записывает накопленный вывод.
+        Вызывается перед любым другим выводом во время тестирования.
+        """
+        if self.__progress_shown:
+            sys.stderr.write("\r\033[K")
+            sys.stderr.flush()
+            self.__progress_shown = False
+
+        if self.__buffer:
+            sys.stdout.write("\n".join(self.__buffer) + "\n")
+            self.__buffer.clear()
+        sys.stdout.flush()
@@ -0,0 +1,39 @@
+import math
+import statistics
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+from src.utils.general import time_to_string
+
+
+@dataclass
+class BenchStats:
+    """
+    Статистика времени выполнения теста по нескольким повторениям.
+    """
+
+    count: int
+    min: float
+    median: float
+    p95: float
+    stddev: float
+
+    @classmethod
+    def from_times(cls, times: Sequence[float]) -> "BenchStats":
+        times = sorted(times)
+        return cls(
+            count=len(times),
+            min=times[0],
+            median=statistics.median(times),
+            p95=times[max(0, math.ceil(0.95 * len(times)) - 1)],
+            stddev=statistics.stdev(times) if len(times) > 1 else 0.0,
+        )
+
+    def to_string(self, unit: str = "runs") -> str:
+        return (
+            f"min {time_to_string(self.min)}, "
+            f"median {time_to_string(self.median)}, "
+            f"p95 {time_to_string(self.p95)}, "
+            f"stddev {time_to_string(self.stddev)} "
+            f"({self.count} {unit})"
+        )
@@ -0,0 +1,21 @@
+from typing import Any
+
+from src.testing.results.result import Result
+from src.testing.results.verdict import Verdict
+from src.utils.style import italic
+
+
+class CachedResult(Result):
+    """
+    Результат пройденного теста, взятый из кэша (тест не выполнялся).
+    """
+
+    def __init__(self, time: float, args: Any):
+        super().__init__(
+            value=None, time=time, args_before=args, args_after=args, verdict=Verdict.OK
+        )
+
+    def _get_result_message(
+        self, success: bool, expected: Any, preview_length: int = None
+    ) -> str:
+        return italic("Passed (cached result)")
@@ -1,29 +1,44 @@
 from typing import Any
 
 from src.testing.results.result import Result
-from src.utils.general import string_to_json, to_json_string
+from src.testing.results.verdict import Verdict
+from src.utils.general import string_to_json, to_preview_string
 from src.utils.style import bold, underline
 
 
 class ClassicResult(Result):
-    def _get_result_message(self, success: bool, expected: Any) -> str:
-        args_before = "\n".join(to_json_string(a) for a in self.args_before)
+    def _get_result_message(
+        self, success: bool, expected: Any, preview_length: int = None
+    ) -> str:
+        args_before = "\n".join(
+            to_preview_string(a, preview_length) for a in self.args_before
+        )
         message = args_before + "\n" if args_before else ""
 
-        if self.args_before != self.args_after:
+        # Неизмененные аргументы не копируются, поэтому их можно не сравнивать.
+        if self.args_before is not self.args_after and (
+            self.args_before != self.args_after
+        ):
             message += underline(bold("Arguments after:")) + "\n"
-            message += "\n".join(to_json_string(a) for a in self.args_after) + "\n"
+            message += (
+                "\n".join(to_preview_string(a, preview_length) for a in self.args_after)
+                + "\n"
+            )
 
-        message += (
-            underline(bold("Result:"))
-            + " "
-            + ("" if success else "  ")
-            + to_json_string(self.value)
-        )
-        message += (
-            ""
-            if success
-            else f'\n{underline(bold("Expected:"))} {to_json_string(expected)}'
-        )
+        # Тест, прерванный ошибкой или ограничением, может не иметь результата.
+        if self.value is not None or self.verdict in (Verdict.OK, Verdict.WA):
+            message += (
+                underline(bold("Result:"))
+                + " "
+                + ("" if success else "  ")
+                + to_preview_string(self.value, preview_length)
+                + "\n"
+            )
+        if not success:
+            message += (
+                underline(bold("Expected:"))
+                + " "
+                + to_preview_string(expected, preview_length)
+            )
 
-        return string_to_json(message)
+        return string_to_json(message.rstrip("\n"))
@@ -0,0 +1,61 @@
+from collections.abc import Sequence
+from typing import Any
+
+from src.testing.results.result import Result
+from src.testing.results.verdict import Verdict
+from src.utils.general import time_to_string
+from src.utils.style import bold, underline
+
+
+class ComplexityResult(Result):
+    """
+    Результат анализа сложности: время выполнения на разных размерах
+    входных данных и подобранный класс сложности.
+    """
+
+    def __init__(
+        self,
+        sizes: Sequence[int],
+        times: Sequence[float],
+        complexity: str | None,
+        confidence: float,
+        time: float,
+        verdict: Verdict,
+        error: str | None = None,
+    ):
+        """
+        :param sizes: Размеры входных данных.
+        :param times: Время выполнения (медиана) на каждом размере.
+        :param complexity: Подобранный класс сложности.
+        :param confidence: Уверенность в подобранном классе (от 0 до 1).
+        :param time: Суммарное время выполнения (без повторных замеров).
+        """
+        super().__init__(
+            value=complexity,
+            time=time,
+            args_before=sizes,
+            args_after=sizes,
+            verdict=verdict,
+            error=error,
+        )
+        self.sizes = sizes
+        self.times = times
+        self.confidence = confidence
+
+    def _get_result_message(
+        self, success: bool, expected: Any, preview_length: int = None
+    ) -> str:
+        width = max([len(str(n)) for n in self.sizes] + [1])
+        message = "\n".join(
+            f"n = {n:>{width}}: {time_to_string(t)}"
+            for n, t in zip(self.sizes, self.times)
+        )
+        if self.value is not None:
+            message += (
+                f'\n{underline(bold("Complexity:"))} {self.value} '
+                f"(confidence {self.confidence:.0%})"
+            )
+        if expected is not None:
+            message += f'\n{underline(bold("Declared:"))} {expected}'
+
+        return message.lstrip("\n")
@@ -0,0 +1,50 @@
+import math
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+from src.utils.general import time_to_string
+
+
+@dataclass
+class MethodStats:
+    """
+    Время вызовов одного метода за тест тестировщика класса.
+    """
+
+    name: str
+    count: int
+    total: float
+    p50: float
+    p99: float
+    max: float
+    # Номер самого долгого вызова в списке команд теста.
+    slowest_index: int
+
+    @classmethod
+    def from_calls(
+        cls, name: str, times: Sequence[float], indexes: Sequence[int]
+    ) -> "MethodStats":
+        """
+        :param times: Время каждого вызова метода.
+        :param indexes: Номера вызовов в списке команд теста.
+        """
+        slowest = max(range(len(times)), key=times.__getitem__)
+        ordered = sorted(times)
+        return cls(
+            name=name,
+            count=len(times),
+            total=math.fsum(times),
+            p50=ordered[max(0, math.ceil(0.5 * len(ordered)) - 1)],
+            p99=ordered[max(0, math.ceil(0.99 * len(ordered)) - 1)],
+            max=ordered[-1],
+            slowest_index=indexes[slowest],
+        )
+
+    def to_string(self) -> str:
+        return (
+            f"{self.name}: {self.count} calls, "
+            f"total {time_to_string(self.total)}, "
+            f"p50 {time_to_string(self.p50)}, "
+            f"p99 {time_to_string(self.p99)}, "
+            f"max {time_to_string(self.max)} (command {self.slowest_index})"
+        )
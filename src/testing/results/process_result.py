@@ -0,0 +1,51 @@
+from typing import Any
+
+from src.testing.results.stream_result import StreamResult
+from src.utils.general import time_to_string, truncate_string
+from src.utils.style import bold, italic, underline
+
+
+class ProcessResult(StreamResult):
+    """
+    Результат теста, выполненного в отдельном процессе.
+    """
+
+    def __init__(
+        self,
+        *args,
+        user_time: float,
+        sys_time: float,
+        exit_code: int,
+        errors: str = "",
+        **kwargs,
+    ):
+        """
+        :param user_time: Процессорное время в режиме пользователя.
+        :param sys_time: Процессорное время в режиме ядра.
+        :param exit_code: Код возврата процесса
+        (отрицательный – номер сигнала, завершившего процесс).
+        :param errors: Вывод процесса в поток ошибок.
+        """
+        super().__init__(*args, **kwargs)
+        self.user_time = user_time
+        self.sys_time = sys_time
+        self.exit_code = exit_code
+        self.errors = errors
+
+    def _get_result_message(
+        self, success: bool, expected: Any, preview_length: int = None
+    ) -> str:
+        message = super()._get_result_message(success, expected, preview_length)
+
+        # При ошибке вывод в поток ошибок уже входит в ее описание.
+        if self.errors.strip() and not self.error:
+            errors = truncate_string(self.errors.strip(), preview_length)
+            message += f'\n{underline(bold("Stderr:"))}\n{errors}'
+
+        return message + italic(
+            bold(
+                f"\n(Exit code: {self.exit_code}, "
+                f"CPU: user {time_to_string(self.user_time)}, "
+                f"sys {time_to_string(self.sys_time)})"
+            )
+        )
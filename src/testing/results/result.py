@@ -3,9 +3,20 @@ from collections.abc import Callable, Sequence
 from typing import Any
 
 from src.config import HEADER_WIDTH
+from src.testing.reporter import Reporter
+from src.testing.results.bench_stats import BenchStats
+from src.testing.results.method_stats import MethodStats
+from src.testing.results.session import TestSession
+from src.testing.results.verdict import Verdict
 from src.testing.utils import get_header
-from src.utils.general import time_to_string
-from src.utils.style import Style, bold, italic, print_error, print_info, print_warning
+from src.utils.general import memory_to_string, time_to_string
+from src.utils.style import (
+    Style,
+    bold,
+    in_style,
+    italic,
+    underline,
+)
 
 
 class Result:
@@ -13,52 +24,77 @@ class Result:
     Класс, хранящий результаты работы тестируемой функции.
     """
 
-    __count_runs = 0
-    __count_passed = 0
-    __tests_without_expected = []
-    __total_time = 0
-
     def __init__(
-        self, value: Any, time: float, args_before: Sequence, args_after: Sequence
+        self,
+        value: Any,
+        time: float,
+        args_before: Sequence,
+        args_after: Sequence,
+        verdict: Verdict | None = None,
+        error: str | None = None,
+        memory: int | None = None,
     ):
+        """
+        :param verdict: Вердикт теста. Если не задан,
+        то будет определен при проверке результата (OK или WA).
+        :param error: Описание ошибки выполнения теста.
+        :param memory: Пиковый объем памяти, выделенной тестом, в байтах.
+        """
         self.value = value
         self.time = time
         self.args_before = args_before
         self.args_after = args_after
-
-    @classmethod
-    def print_status(cls, show_time: bool = False) -> None:
-        message = str(Style.BOLD) + get_header("RESULT", width=HEADER_WIDTH) + "\n"
-        message += f"Tests passed: {cls.__count_passed}/{cls.__count_runs}"
-
-        if show_time:
-            message += f"\nTime: {time_to_string(cls.__total_time)}"
-
-        if cls.__count_passed == cls.__count_runs:
-            print_info(message)
-        else:
-            print_warning(message)
-
-        if cls.__tests_without_expected:
-            count = len(cls.__tests_without_expected)
-            print_warning(
-                f"{count} tests do not have expected results: "
-                f"{cls.__tests_without_expected}",
-                level=True,
-            )
+        self.verdict = verdict
+        self.error = error
+        self.memory = memory
+        # Статистика многократного замера времени (режим бенчмарка).
+        self.bench: BenchStats | None = None
+        # Статистика времени вызовов методов (тестировщик класса).
+        self.method_stats: list[MethodStats] | None = None
 
     @abstractmethod
-    def _get_result_message(self, success: bool, expected: Any) -> str:
+    def _get_result_message(
+        self, success: bool, expected: Any, preview_length: int = None
+    ) -> str:
+        """
+        :param preview_length: Длина сокращенного представления значений
+        (None – значения выводятся полностью).
+        """
         pass
 
     def _validate_answer(self, expected: Any) -> bool:
         return expected is None or self.value == expected
 
+    def check(
+        self,
+        expected: Any = None,
+        validator: Callable[[Sequence, Sequence, Any, Any], bool] = None,
+    ) -> bool:
+        """
+        Проверка ответа теста без учета вердикта выполнения.
+        """
+        if validator:
+            return validator(self.args_before, self.args_after, expected, self.value)
+        return self._validate_answer(expected)
+
+    def get_message(self, expected: Any = None, preview_length: int = None) -> str:
+        """
+        Описание результата теста (без заголовка).
+        """
+        message = self._get_result_message(
+            self.verdict is Verdict.OK, expected, preview_length
+        )
+        if self.error:
+            message += f'\n{underline(bold("Error:"))}\n{self.error}'
+        return message
+
     def validate(
         self,
         expected: Any = None,
         validator: Callable[[Sequence, Sequence, Any, Any], bool] = None,
         show_time: bool = False,
+        reporter: Reporter = None,
+        session: TestSession = None,
     ) -> bool:
         """
         Проверка результата теста.
@@ -68,27 +104,61 @@ class Result:
         Принимает список аргументов теста, ожидаемое значение и результат.
         Возвращает логическое значение: был ли пройден тест.
         :param show_time: Выводить время выполнения теста.
+        :param reporter: Вывод результатов тестов. Описание результата
+        строится, только если он будет выведен.
+        :param session: Итоги запуска тестов, в которых учитывается результат.
         """
-        Result.__count_runs += 1
-        Result.__total_time += self.time
+        reporter = reporter or Reporter()
+        session = session or TestSession()
+
+        if self.verdict is None:
+            success = self.check(expected, validator)
+            self.verdict = Verdict.OK if success else Verdict.WA
+
+        success = self.verdict is Verdict.OK
+        number = session.add(self, expected)
+
+        if reporter.is_shown(success):
+            reporter.write(
+                in_style(
+                    Style.GREEN if success else Style.RED,
+                    self.__render(number, expected, show_time, reporter.preview_length)
+                    + "\n",
+                )
+            )
+        reporter.update(success)
 
-        if expected is None and self.value is not None:
-            Result.__tests_without_expected.append(Result.__count_runs)
+        return success
 
-        if validator:
-            success = validator(self.args_before, self.args_after, expected, self.value)
-        else:
-            success = self._validate_answer(expected)
+    def __render(
+        self, number: int, expected: Any, show_time: bool, preview_length: int
+    ) -> str:
+        """
+        Описание результата теста с заголовком и измерениями.
+        """
+        message = get_header(f"TEST {number}: {self.verdict}", HEADER_WIDTH) + "\n"
+        message += self.get_message(expected, preview_length)
 
-        if success:
-            Result.__count_passed += 1
+        measures = []
+        if show_time:
+            measures.append(f"Time: {time_to_string(self.time)}")
 
-        print_func = print_info if success else print_error
-        message = get_header(f"TEST {Result.__count_runs}", HEADER_WIDTH) + "\n"
-        message += self._get_result_message(success, expected)
+        if self.memory is not None:
+            measures.append(f"Memory: {memory_to_string(self.memory)}")
 
-        if show_time:
-            message += italic(bold(f"\n(Time: {time_to_string(self.time)})"))
+        if measures:
+            message += italic(bold(f"\n({', '.join(measures)})"))
 
-        print_func(message + "\n")
-        return success
+        if self.bench:
+            message += italic(bold(f"\n(Benchmark: {self.bench.to_string()})"))
+
+        if self.method_stats:
+            message += italic(
+                bold(
+                    "\n(Method calls:\n"
+                    + "\n".join(f"  {x.to_string()}" for x in self.method_stats)
+                    + ")"
+                )
+            )
+
+        return message
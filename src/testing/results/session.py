@@ -0,0 +1,152 @@
+from collections import Counter
+from threading import Lock
+from typing import TYPE_CHECKING, Any
+
+from src.config import HEADER_WIDTH
+from src.testing.results.bench_stats import BenchStats
+from src.testing.results.verdict import Verdict
+from src.testing.utils import get_header
+from src.utils.general import memory_to_string, time_to_string
+from src.utils.style import Style, print_info, print_warning
+
+if TYPE_CHECKING:
+    from src.testing.results.result import Result
+
+
+class TestSession:
+    """
+    Итоги одного запуска тестов: количество пройденных тестов, вердикты,
+    суммарное время, пик памяти и замеры бенчмарка.
+    Создается на каждый запуск, поэтому в одном процессе могут одновременно
+    тестироваться несколько решений. Учет результатов защищен блокировкой,
+    а итоги, подведенные в других процессах (сессия сериализуется
+    без блокировки), добавляются методом merge.
+    """
+
+    def __init__(self):
+        self.count_runs = 0
+        self.count_passed = 0
+        # Номера тестов без ожидаемого результата.
+        self.tests_without_expected: list[int] = []
+        self.total_time = 0
+        self.count_verdicts = Counter()
+        self.bench_totals: list[BenchStats] = []
+        # Наибольший пик памяти и номер теста, на котором он достигнут.
+        self.max_memory: tuple[int, int] | None = None
+        self.__lock = Lock()
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        del state["_TestSession__lock"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self.__lock = Lock()
+
+    @property
+    def success(self) -> bool:
+        return self.count_passed == self.count_runs
+
+    def add(self, result: "Result", expected: Any) -> int:
+        """
+        Учитывает проверенный результат теста и возвращает номер теста.
+        """
+        with self.__lock:
+            self.count_runs += 1
+            self.total_time += result.time
+            self.count_verdicts[result.verdict] += 1
+
+            if result.verdict is Verdict.OK:
+                self.count_passed += 1
+
+            if expected is None and result.value is not None:
+                self.tests_without_expected.append(self.count_runs)
+
+            if result.memory is not None and (
+                not self.max_memory or result.memory > self.max_memory[0]
+            ):
+                self.max_memory = (result.memory, self.count_runs)
+
+            if result.bench:
+                self.bench_totals.append(result.bench)
+
+            return self.count_runs
+
+    def merge(self, other: "TestSession") -> None:
+        """
+        Добавляет итоги другой сессии (тесты которой выполнялись после тестов
+        текущей, поэтому их номера сдвигаются).
+        """
+        with self.__lock:
+            offset = self.count_runs
+            self.count_runs += other.count_runs
+            self.count_passed += other.count_passed
+            self.total_time += other.total_time
+            self.count_verdicts += other.count_verdicts
+            self.bench_totals += other.bench_totals
+            self.tests_without_expected += [
+                offset + number for number in other.tests_without_expected
+            ]
+
+            if other.max_memory and (
+                not self.max_memory or other.max_memory[0] > self.max_memory[0]
+            ):
+                memory, number = other.max_memory
+                self.max_memory = (memory, offset + number)
+
+    def reset(self) -> None:
+        """
+        Сбрасывает итоги тестирования (перед новым запуском тестов).
+        """
+        with self.__lock:
+            self.count_runs = 0
+            self.count_passed = 0
+            self.tests_without_expected = []
+            self.total_time = 0
+            self.count_verdicts = Counter()
+            self.bench_totals = []
+            self.max_memory = None
+
+    def print_status(self, show_time: bool = False) -> None:
+        message = str(Style.BOLD) + get_header("RESULT", width=HEADER_WIDTH) + "\n"
+        message += f"Tests passed: {self.count_passed}/{self.count_runs}"
+
+        if show_time:
+            message += f"\nTime: {time_to_string(self.total_time)}"
+
+        if self.max_memory:
+            memory, number = self.max_memory
+            message += f"\nPeak memory: {memory_to_string(memory)} (test {number})"
+
+        if self.bench_totals:
+            # Дисперсии независимых замеров складываются.
+            message += "\nBenchmark: " + (
+                BenchStats(
+                    count=len(self.bench_totals),
+                    min=sum(x.min for x in self.bench_totals),
+                    median=sum(x.median for x in self.bench_totals),
+                    p95=sum(x.p95 for x in self.bench_totals),
+                    stddev=sum(x.stddev**2 for x in self.bench_totals) ** 0.5,
+                ).to_string(unit="tests")
+            )
+
+        if not self.success:
+            message += "\nVerdicts: " + ", ".join(
+                f"{verdict} {self.count_verdicts[verdict]}"
+                for verdict in Verdict
+                if self.count_verdicts[verdict]
+            )
+
+        if self.success:
+            print_info(message)
+        else:
+            print_warning(message)
+
+        if self.tests_without_expected:
+            count = len(self.tests_without_expected)
+            print_warning(
+                f"{count} tests do not have expected results: "
+                f"{self.tests_without_expected}",
+                level=True,
+            )
@@ -1,13 +1,16 @@
 from typing import Any
 
 from src.testing.results.result import Result
+from src.utils.general import truncate_string
 from src.utils.style import bold, italic, underline
 
 
 class StreamResult(Result):
-    def _get_result_message(self, success: bool, expected: Any) -> str:
-        input_string = self.args_before[0].strip()
-        output_string = self.value.strip()
+    def _get_result_message(
+        self, success: bool, expected: Any, preview_length: int = None
+    ) -> str:
+        input_string = truncate_string(self.args_before[0].strip(), preview_length)
+        output_string = truncate_string((self.value or "").strip(), preview_length)
 
         message = ""
         if input_string:
@@ -17,9 +20,10 @@ class StreamResult(Result):
             message += "\n" if message else ""
             message += f'{underline(bold("Output:"))}\n{output_string}'
 
-        if not success and expected.strip():
+        if not success and expected and expected.strip():
             message += "\n" if message else ""
-            message += f'{underline(bold("Expected:"))}\n{expected.strip()}'
+            expected_string = truncate_string(expected.strip(), preview_length)
+            message += f'{underline(bold("Expected:"))}\n{expected_string}'
 
         return message if message else italic("No input no output...")
 
@@ -0,0 +1,16 @@
+from enum import Enum
+
+
+class Verdict(Enum):
+    """
+    Вердикт теста в терминах систем автоматической проверки.
+    """
+
+    OK = "Accepted"
+    WA = "Wrong answer"
+    TLE = "Time limit exceeded"
+    MLE = "Memory limit exceeded"
+    RE = "Runtime error"
+
+    def __str__(self):
+        return self.name
@@ -0,0 +1,98 @@
+from collections.abc import Iterator, Sequence
+from typing import Any
+
+from src.nodes.node import Node
+
+
+def shrink_int(value: int) -> Iterator[int]:
+    """
+    Числа, более близкие к нулю (сначала самые простые).
+    """
+    candidates = [0, -value, value // 2 if value > 0 else -(-value // 2)]
+    candidates.append(value - 1 if value > 0 else value + 1)
+
+    seen = {value}
+    for candidate in candidates:
+        if candidate not in seen and abs(candidate) <= abs(value):
+            seen.add(candidate)
+            # Отрицательное число заменяется положительным, но не наоборот.
+            if not (candidate < 0 < value):
+                yield candidate
+
+
+def remove_parts(values: Sequence) -> Iterator[list]:
+    """
+    Списки без части элементов: сначала удаляются большие части
+    (половины, четверти, ...), затем отдельные элементы.
+    """
+    values = list(values)
+    size = len(values)
+    while size:
+        for start in range(0, len(values), size):
+            yield values[:start] + values[start + size :]
+        size //= 2
+
+
+def shrink_sequence(values: Sequence) -> Iterator[list]:
+    """
+    Списки без части элементов, затем списки с уменьшенным элементом.
+    """
+    values = list(values)
+    yield from remove_parts(values)
+
+    for i, value in enumerate(values):
+        for candidate in shrink_value(value):
+            yield values[:i] + [candidate] + values[i + 1 :]
+
+
+def shrink_string(value: str) -> Iterator[str]:
+    """
+    Многострочный текст уменьшается по строкам, строка – по словам
+    (числа уменьшаются как числа), из слова удаляются символы.
+    """
+    if "\n" in value.strip():
+        lines = value.strip().split("\n")
+        yield from ("\n".join(x) for x in shrink_sequence(lines) if x)
+    elif " " in value.strip():
+        tokens = value.split()
+        yield from (" ".join(x) for x in shrink_sequence(tokens) if x)
+    elif value.lstrip("-").isdigit():
+        yield from map(str, shrink_int(int(value)))
+    else:
+        yield from ("".join(x) for x in remove_parts(value))
+
+
+def shrink_value(value: Any) -> Iterator[Any]:
+    """
+    Более простые значения того же типа.
+    Узлы (списки, деревья) уменьшаются через их представление списком.
+    """
+    if isinstance(value, bool):
+        if value:
+            yield False
+    elif isinstance(value, int):
+        yield from shrink_int(value)
+    elif isinstance(value, float):
+        yield from (x for x in (0.0, float(int(value))) if x != value)
+    elif isinstance(value, str):
+        yield from shrink_string(value)
+    elif isinstance(value, list):
+        yield from shrink_sequence(value)
+    elif isinstance(value, tuple):
+        yield from map(tuple, shrink_sequence(value))
+    elif isinstance(value, Node):
+        for values in shrink_sequence(value.to_list()):
+            # Не всякий список – корректное представление узла.
+            try:
+                yield type(value).from_list(values)
+            except (IndexError, TypeError, ValueError):
+                continue
+
+
+def shrink_args(args: Sequence) -> Iterator[list]:
+    """
+    Аргументы теста, в которых уменьшен один из аргументов.
+    """
+    for i, arg in enumerate(args):
+        for candidate in shrink_value(arg):
+            yield list(args[:i]) + [candidate] + list(args[i + 1 :])
@@ -0,0 +1,260 @@
+import re
+import time
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import Executor
+from itertools import islice, repeat
+from typing import Any
+
+from src.config import HEADER_WIDTH, SHRINK_MAX_RUNS, SHRINK_TIME_BUDGET
+from src.testing.results.result import Result
+from src.testing.results.verdict import Verdict
+from src.testing.snapshot import ArgsSnapshot
+from src.testing.testers.tester import Tester
+from src.testing.utils import get_header
+from src.utils.general import time_to_string
+from src.utils.style import print_message, print_warning
+
+# Количество кандидатов, проверяемых за одну задачу в пуле процессов.
+CHUNK_SIZE = 4
+
+# Количество задач на один процесс, которые могут выполняться одновременно.
+TASKS_PER_WORKER = 4
+
+# Признак ошибки: вердикт, тип исключения и место, где оно выброшено.
+Failure = tuple[Verdict, str | None, str | None]
+
+# Строка трассировки с типом исключения ("ValueError: ..." или "ValueError").
+EXCEPTION_LINE_PATTERN = re.compile(r"^[A-Za-z_][\w.]*(:|$)")
+
+
+def get_failure(result: Result) -> Failure:
+    """
+    Признак ошибки теста. Для ошибок выполнения, кроме вердикта,
+    учитываются тип исключения и место, где оно выброшено
+    (последний кадр трассировки).
+    """
+    if result.verdict is not Verdict.RE or not result.error:
+        return result.verdict, None, None
+
+    lines = [line.strip() for line in result.error.splitlines()]
+    frames = [line for line in lines if line.startswith('File "')]
+    exceptions = [line for line in lines if EXCEPTION_LINE_PATTERN.match(line)]
+    return (
+        result.verdict,
+        exceptions[-1].split(":")[0] if exceptions else None,
+        frames[-1] if frames else None,
+    )
+
+
+def run_candidate(
+    tester: Tester, reference: Tester | None, args: Sequence, debug: bool = False
+) -> tuple[Result, Any] | None:
+    """
+    Запускает тест и возвращает его результат и ожидаемое значение
+    (результат эталонного решения, если оно задано).
+    Если эталонное решение завершилось ошибкой, тест некорректен
+    и возвращается None.
+    """
+    snapshot = ArgsSnapshot(args)
+    expected = None
+    if reference:
+        reference_result = reference.run(snapshot.restore(), debug)
+        if reference_result.verdict is not None:
+            return None
+        expected = reference_result.value
+
+    return tester.run(snapshot.restore(), debug), expected
+
+
+def check_failure(
+    tester: Tester,
+    reference: Tester | None,
+    validator: Callable[[Sequence, Sequence, Any, Any], bool] | None,
+    failure: Failure,
+    args: Sequence,
+    debug: bool = False,
+) -> bool:
+    """
+    Проверяет, что тест завершается той же ошибкой: тем же вердиктом
+    и, для ошибок выполнения, исключением того же типа в том же месте.
+    """
+    try:
+        run = run_candidate(tester, reference, args, debug)
+        if run is None:
+            return False
+
+        result, expected = run
+        if result.verdict is None:
+            result.verdict = (
+                Verdict.OK if result.check(expected, validator) else Verdict.WA
+            )
+        return get_failure(result) == failure
+
+    except Exception:
+        return False
+
+
+def check_failures(
+    tester: Tester,
+    reference: Tester | None,
+    validator: Callable[[Sequence, Sequence, Any, Any], bool] | None,
+    failure: Failure,
+    candidates: Sequence[Sequence],
+    debug: bool = False,
+) -> list[bool]:
+    return [
+        check_failure(tester, reference, validator, failure, args, debug)
+        for args in candidates
+    ]
+
+
+class Shrinker:
+    """
+    Уменьшение непройденного теста: аргументы жадно упрощаются
+    (удаляются элементы списков, уменьшаются числа, строки и узлы),
+    пока тест не перестанет завершаться той же ошибкой.
+    Кандидаты проверяются пачками в пуле процессов, из пачки выбирается
+    первый подходящий кандидат, поэтому результат не зависит
+    от количества процессов.
+    Неверный ответ можно проверить только эталонным решением
+    или валидатором (ожидаемое значение генератора для уменьшенного
+    теста неизвестно), поэтому без них уменьшаются только тесты,
+    завершившиеся ошибкой или превысившие ограничения.
+    """
+
+    def __init__(
+        self,
+        reference: Tester | None = None,
+        validator: Callable[[Sequence, Sequence, Any, Any], bool] | None = None,
+        executor: Executor | None = None,
+        jobs: int = 1,
+        debug: bool = False,
+    ):
+        """
+        :param reference: Тестировщик эталонного решения.
+        :param validator: Функция валидации результата теста
+        (получает ожидаемое значение эталона или None).
+        :param executor: Пул процессов для проверки кандидатов.
+        :param jobs: Количество процессов в пуле.
+        :param debug: Выводить отладочные данные.
+        """
+        self.reference = reference
+        self.validator = validator
+        self.executor = executor
+        self.jobs = jobs
+        self.debug = debug
+        self.runs = 0
+
+    def is_supported(self, failure: Failure) -> bool:
+        verdict, *_ = failure
+        return verdict is not Verdict.WA or bool(self.reference or self.validator)
+
+    def __find_failure(
+        self,
+        tester: Tester,
+        candidates: Iterator[Sequence],
+        failure: Failure,
+        deadline: float,
+    ) -> Sequence | None:
+        """
+        Первый кандидат, завершающийся той же ошибкой.
+        """
+        batch_size = CHUNK_SIZE * self.jobs * TASKS_PER_WORKER if self.executor else 1
+
+        while (
+            self.runs < SHRINK_MAX_RUNS
+            and time.perf_counter() < deadline
+            and (batch := list(islice(candidates, batch_size)))
+        ):
+            if self.executor:
+                chunks = [
+                    batch[i : i + CHUNK_SIZE] for i in range(0, len(batch), CHUNK_SIZE)
+                ]
+                flags = (
+                    flag
+                    for chunk_flags in self.executor.map(
+                        check_failures,
+                        repeat(tester),
+                        repeat(self.reference),
+                        repeat(self.validator),
+                        repeat(failure),
+                        chunks,
+                        repeat(self.debug),
+                    )
+                    for flag in chunk_flags
+                )
+            else:
+                flags = (
+                    check_failure(
+                        tester,
+                        self.reference,
+                        self.validator,
+                        failure,
+                        args,
+                        self.debug,
+                    )
+                    for args in batch
+                )
+
+            for args, flag in zip(batch, flags):
+                self.runs += 1
+                if flag:
+                    return args
+
+        return None
+
+    def shrink(
+        self, tester: Tester, args: Sequence, failure: Failure
+    ) -> tuple[Sequence, int]:
+        """
+        Уменьшает тест, пока он завершается той же ошибкой.
+        Возвращает наименьшие найденные аргументы и количество уменьшений.
+        Уменьшение ограничено SHRINK_MAX_RUNS запусками
+        и SHRINK_TIME_BUDGET секундами.
+        """
+        self.runs = 0
+        steps = 0
+        deadline = time.perf_counter() + SHRINK_TIME_BUDGET
+
+        while True:
+            smaller = self.__find_failure(
+                tester, tester.shrink_args(args), failure, deadline
+            )
+            if smaller is None:
+                return args, steps
+            args = smaller
+            steps += 1
+
+    def print_counterexample(self, tester: Tester, result: Result) -> None:
+        """
+        Уменьшает непройденный тест и выводит наименьший найденный контрпример.
+        """
+        failure = get_failure(result)
+        if not self.is_supported(failure):
+            return
+
+        start_time = time.perf_counter()
+        args, steps = self.shrink(tester, result.args_before, failure)
+        shrink_time = time.perf_counter() - start_time
+
+        if not steps:
+            print_message("The failed test could not be shrunk")
+            return
+
+        run = run_candidate(tester, self.reference, args, self.debug)
+        if run is None:
+            return
+
+        shrunk, expected = run
+        if shrunk.verdict is None:
+            shrunk.verdict = (
+                Verdict.OK if shrunk.check(expected, self.validator) else Verdict.WA
+            )
+
+        print_warning(
+            get_header(f"SHRUNK: {shrunk.verdict}", HEADER_WIDTH)
+            + "\n"
+            + shrunk.get_message(expected)
+            + f"\n({steps} shrinks, {self.runs} runs, {time_to_string(shrink_time)})"
+            + "\n"
+        )
@@ -0,0 +1,45 @@
+import copy
+import pickle
+from collections.abc import Sequence
+
+
+class ArgsSnapshot:
+    """
+    Снимок аргументов теста для отслеживания их изменения тестируемым кодом.
+    Аргументы хранятся в сериализованном виде: это компактнее полной копии,
+    а проверка изменения сводится к сравнению байтов.
+    Копия аргументов восстанавливается, только если они были изменены.
+    """
+
+    def __init__(self, args: Sequence):
+        try:
+            self.__data = pickle.dumps(args, pickle.HIGHEST_PROTOCOL)
+            self.__copy = None
+        except (pickle.PicklingError, TypeError, AttributeError, RecursionError):
+            # Аргументы, которые нельзя сериализовать, копируются.
+            self.__data = None
+            self.__copy = copy.deepcopy(args)
+
+    def is_changed(self, args: Sequence) -> bool:
+        if self.__data is None:
+            return self.__copy != args
+
+        try:
+            return pickle.dumps(args, pickle.HIGHEST_PROTOCOL) != self.__data
+        except (pickle.PicklingError, TypeError, AttributeError, RecursionError):
+            return True
+
+    def restore(self) -> Sequence:
+        """
+        Возвращает копию аргументов в состоянии на момент создания снимка.
+        """
+        if self.__data is None:
+            return copy.deepcopy(self.__copy)
+        return pickle.loads(self.__data)
+
+    def get_original(self, args: Sequence) -> Sequence:
+        """
+        Возвращает аргументы в исходном состоянии:
+        сами аргументы, если они не изменились, иначе их восстановленную копию.
+        """
+        return self.restore() if self.is_changed(args) else args
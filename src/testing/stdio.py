@@ -0,0 +1,141 @@
+import os
+import sys
+import tempfile
+from collections.abc import Iterator
+from contextlib import contextmanager, suppress
+from dataclasses import dataclass
+from typing import BinaryIO
+
+STDIN_FILENO = 0
+STDOUT_FILENO = 1
+STDERR_FILENO = 2
+
+
+@dataclass
+class CapturedOutput:
+    """
+    Данные, записанные в стандартный вывод (заполняются после выхода из блока).
+    """
+
+    data: bytes = b""
+
+
+def create_memory_file(name: str) -> BinaryIO:
+    """
+    Временный файл в памяти (memfd в Linux, иначе обычный временный файл).
+    В отличие от канала, в него можно записать данные любого объема
+    без отдельного потока для чтения.
+    """
+    if hasattr(os, "memfd_create"):
+        return os.fdopen(os.memfd_create(name), "w+b")
+    return tempfile.TemporaryFile()
+
+
+def reopen_stdin() -> None:
+    """
+    Заново открывает стандартный ввод на дескрипторе 0.
+    multiprocessing в дочерних процессах закрывает sys.stdin и заменяет его
+    на os.devnull, из-за чего подмена дескриптора 0 не доходила бы до решения.
+    Вызывается до импорта решения, чтобы сохраненные им при импорте функции
+    (input = sys.stdin.readline) читали дескриптор 0.
+    """
+    stdin = sys.__stdin__
+    with suppress(ValueError):
+        if stdin and not stdin.closed and stdin.fileno() == STDIN_FILENO:
+            return
+
+    sys.stdin = sys.__stdin__ = open(STDIN_FILENO, encoding="utf-8", closefd=False)
+
+
+@contextmanager
+def redirect_stdio(input_data: bytes) -> Iterator[CapturedOutput]:
+    """
+    Подменяет стандартные ввод и вывод на уровне файловых дескрипторов:
+    дескриптор 0 читает входные данные, а все, что записано в дескриптор 1,
+    сохраняется. Поэтому работают все способы ввода-вывода: input(),
+    sys.stdin.buffer, os.read(0, ...), sys.stdout.buffer.write и функции,
+    сохраненные при импорте (input = sys.stdin.readline).
+    Вывод на время блока буферизуется блоками, как при запуске
+    в системе проверки, где вывод перенаправлен в файл.
+
+    :param input_data: Входные данные.
+    """
+    stdin, stdout = sys.stdin, sys.stdout
+    # Объекты, созданные при запуске интерпретатора, могут быть сохранены
+    # кодом решения при импорте, поэтому используются именно они.
+    original_stdin, original_stdout = sys.__stdin__, sys.__stdout__
+
+    for stream in {stdout, original_stdout} - {None}:
+        stream.flush()
+
+    input_file = create_memory_file("stdin")
+    input_file.write(input_data)
+    input_file.seek(0)
+    output_file = create_memory_file("stdout")
+
+    saved_stdin_fd = os.dup(STDIN_FILENO)
+    saved_stdout_fd = os.dup(STDOUT_FILENO)
+    os.dup2(input_file.fileno(), STDIN_FILENO)
+    os.dup2(output_file.fileno(), STDOUT_FILENO)
+
+    line_buffering = original_stdout.line_buffering if original_stdout else False
+    if original_stdout:
+        original_stdout.reconfigure(line_buffering=False)
+    sys.stdin, sys.stdout = original_stdin, original_stdout
+
+    output = CapturedOutput()
+    try:
+        yield output
+
+    finally:
+        if original_stdout:
+            with suppress(OSError, ValueError):
+                original_stdout.flush()
+                original_stdout.reconfigure(line_buffering=line_buffering)
+
+        # Непрочитанные входные данные, оставшиеся в буфере sys.stdin,
+        # не должны попасть в следующий тест.
+        if original_stdin:
+            os.lseek(STDIN_FILENO, 0, os.SEEK_END)
+            with suppress(OSError, ValueError):
+                original_stdin.read()
+
+        os.dup2(saved_stdin_fd, STDIN_FILENO)
+        os.dup2(saved_stdout_fd, STDOUT_FILENO)
+        os.close(saved_stdin_fd)
+        os.close(saved_stdout_fd)
+        sys.stdin, sys.stdout = stdin, stdout
+
+        output_file.seek(0)
+        output.data = output_file.read()
+        input_file.close()
+        output_file.close()
+
+
+@contextmanager
+def discard_output() -> Iterator[None]:
+    """
+    Отбрасывает все, что записано в стандартный вывод и поток ошибок
+    (на уровне файловых дескрипторов, включая вывод решений).
+    """
+    for stream in (sys.stdout, sys.stderr):
+        with suppress(AttributeError, OSError, ValueError):
+            stream.flush()
+
+    saved_fds = [os.dup(fd) for fd in (STDOUT_FILENO, STDERR_FILENO)]
+    null_fd = os.open(os.devnull, os.O_WRONLY)
+    os.dup2(null_fd, STDOUT_FILENO)
+    os.dup2(null_fd, STDERR_FILENO)
+    os.close(null_fd)
+
+    try:
+        yield
+
+    finally:
+        for stream in (sys.stdout, sys.stderr):
+            with suppress(AttributeError, OSError, ValueError):
+                stream.flush()
+
+        for fd, saved_fd in zip((STDOUT_FILENO, STDERR_FILENO), saved_fds):
+            os.dup2(saved_fd, fd)
+            os.close(saved_fd)
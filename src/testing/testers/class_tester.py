@@ -1,23 +1,23 @@
-import copy
 import time
-from collections.abc import Sequence
+from collections.abc import Iterable, Iterator, Sequence
 from types import ModuleType
 from typing import Any
 
 from src.config import MAIN_FUNCTION_NAME, SOLUTION_CLASS_NAME
+from src.nodes.node import Node
+from src.testing.call_plan import CallPlan
+from src.testing.op_log import OpLog
 from src.testing.results.classic_result import ClassicResult
+from src.testing.results.method_stats import MethodStats
 from src.testing.results.result import Result
+from src.testing.shrink_candidates import remove_parts, shrink_args
+from src.testing.snapshot import ArgsSnapshot
 from src.testing.testers.tester import Tester
-from src.testing.utils import (
-    parse_test_data_as_lines,
-    proc_args_by_func,
-    proc_test_result,
-)
+from src.testing.utils import parse_test_data_as_lines
 from src.utils.general import (
     get_class_method_names,
     get_classes_from_module,
     get_funcs_from_module,
-    validate_signature,
 )
 from src.utils.style import print_debug
 
@@ -34,6 +34,14 @@ class ClassTester(Tester):
     def __init__(self, class_: type):
         super().__init__()
         self.__class = class_
+        # Планы вызова методов (составляются при первом вызове метода).
+        self.__plans: dict[str, CallPlan] = {}
+
+    def __get_plan(self, obj: Any, method_name: str) -> CallPlan:
+        plan = self.__plans.get(method_name)
+        if plan is None:
+            plan = self.__plans[method_name] = CallPlan(getattr(obj, method_name))
+        return plan
 
     @classmethod
     def verification_module(cls, module: ModuleType) -> bool:
@@ -54,7 +62,7 @@ class ClassTester(Tester):
         return len(get_class_method_names(classes[0])) > 1
 
     @classmethod
-    def parse_test_data(cls, test_data: str) -> list[list]:
+    def parse_test_data(cls, test_data: str | Iterable[str]) -> Iterator[list]:
         return parse_test_data_as_lines(test_data)
 
     @classmethod
@@ -129,36 +137,133 @@ class ClassTester(Tester):
             )
 
         obj = self.__class(*args_list[0])
+        plans = {
+            name: self.__get_plan(obj, name) for name in dict.fromkeys(commands[1:])
+        }
         for method_name, method_args in zip(commands[1:], args_list[1:]):
-            validate_signature(getattr(obj, method_name), *method_args)
+            plans[method_name].validate(method_args)
+
+    def shrink_args(self, args: Sequence) -> Iterator[Sequence]:
+        """
+        Команды удаляются вместе с их аргументами (кроме создания объекта),
+        затем уменьшаются аргументы каждой команды.
+        """
+        commands, args_list = list(args[0]), list(args[1])
+        operations = list(zip(commands[1:], args_list[1:]))
+
+        for part in remove_parts(operations):
+            yield (
+                commands[:1] + [command for command, _ in part],
+                args_list[:1] + [command_args for _, command_args in part],
+            )
+
+        for i, command_args in enumerate(args_list):
+            for candidate in shrink_args(command_args):
+                yield commands, args_list[:i] + [candidate] + args_list[i + 1 :]
+
+    def __convert_results(self, op_log: OpLog, results: list) -> list:
+        """
+        Конвертирует результаты команд (узлы – в списки). Если ни один метод
+        не возвращает узел, результаты возвращаются без изменений.
+        """
+        plans = [self.__plans.get(name) for name in op_log.names]
+        if not any(plan and plan.converts_result for plan in plans) and not any(
+            issubclass(x, Node) for x in set(map(type, results))
+        ):
+            return results
+
+        return results[:1] + [
+            plans[method_id].convert_result(value)
+            for method_id, value in zip(op_log.ids, results[1:])
+        ]
+
+    @staticmethod
+    def __get_method_stats(op_log: OpLog, times: Sequence[float]) -> list[MethodStats]:
+        """
+        Статистика времени вызовов по методам (сначала самые долгие в сумме).
+        Учитываются только завершившиеся вызовы.
+        """
+        method_times = [[] for _ in op_log.names]
+        method_indexes = [[] for _ in op_log.names]
+        # Номер команды 0 – создание объекта.
+        for index, (method_id, call_time) in enumerate(zip(op_log.ids, times), 1):
+            method_times[method_id].append(call_time)
+            method_indexes[method_id].append(index)
+
+        stats = [
+            MethodStats.from_calls(name, call_times, indexes)
+            for name, call_times, indexes in zip(
+                op_log.names, method_times, method_indexes
+            )
+            if call_times
+        ]
+        return sorted(stats, key=lambda x: x.total, reverse=True)
 
     def run(self, args: Sequence, debug: bool = False) -> Result:
-        args_after = copy.deepcopy(args)
-        commands = args[0]
-        args_list_after = args_after[1]
+        snapshot = ArgsSnapshot(args) if self.track_mutations else None
+        # Журнал команд составляется до запуска, чтобы при выполнении
+        # оставались только вызовы методов.
+        op_log = OpLog.from_test(args[0], args[1])
         results = [None]
+        # Время каждого вызова (в режиме статистики методов).
+        times = []
 
-        start_time = time.perf_counter()
+        def execute_commands() -> list:
+            obj = self.__class(*op_log.init_args)
+            # Таблица вызова: метод объекта и план по номеру имени метода.
+            methods = [getattr(obj, name) for name in op_log.names]
+            plans = [self.__get_plan(obj, name) for name in op_log.names]
+            append = results.append
 
-        if self.runner:
-            results = self.runner(self.__class, args_after)
-        else:
-            obj = self.__class(*args_list_after[0])
-            for method_name, method_args in zip(commands[1:], args_list_after[1:]):
-                func = getattr(obj, method_name)
-                method_args = proc_args_by_func(method_args, func)
-                result = func(*method_args)
+            trace_methods = self.trace_methods
+            if (
+                not debug
+                and not trace_methods
+                and not any(plan.converts_args for plan in plans)
+            ):
+                for method, method_args in zip(
+                    map(methods.__getitem__, op_log.ids), op_log.args
+                ):
+                    append(method(*method_args))
+                return results
+
+            perf_counter = time.perf_counter
+            for method_id, method_args in zip(op_log.ids, op_log.args):
+                method_args = plans[method_id].convert_args(method_args)
+                if trace_methods:
+                    start_time = perf_counter()
+                    result = methods[method_id](*method_args)
+                    times.append(perf_counter() - start_time)
+                else:
+                    result = methods[method_id](*method_args)
                 if debug:
                     print_debug(
-                        f'{method_name}({", ".join(map(str, method_args))}): {result}'
+                        f"{op_log.names[method_id]}"
+                        f'({", ".join(map(str, method_args))}): {result}'
                     )
-                results.append(proc_test_result(result, func))
+                append(result)
+            return results
 
-        run_time = time.perf_counter() - start_time
+        if self.runner:
+            execution = self.execute(self.runner, self.__class, args)
+            value = execution.value
+        else:
+            execution = self.execute(execute_commands)
+            # При ошибке выводятся результаты команд, выполненных до нее.
+            value = self.convert_result(
+                execution, lambda _: self.__convert_results(op_log, results)
+            )
 
-        return ClassicResult(
-            value=results,
-            time=run_time,
-            args_before=args,
-            args_after=args_after,
+        result = ClassicResult(
+            value=value,
+            time=execution.time,
+            args_before=snapshot.get_original(args) if snapshot else args,
+            args_after=args,
+            verdict=execution.verdict,
+            error=execution.error,
+            memory=execution.memory,
         )
+        if times:
+            result.method_stats = self.__get_method_stats(op_log, times)
+
+        return result
@@ -1,24 +1,15 @@
-import copy
-import time
-from collections.abc import Callable, Sequence
+from collections.abc import Callable, Iterable, Iterator, Sequence
 from types import ModuleType
 from typing import Any
 
 from src.config import MAIN_FUNCTION_NAME, SOLUTION_CLASS_NAME
+from src.testing.call_plan import CallPlan
 from src.testing.results.classic_result import ClassicResult
 from src.testing.results.result import Result
+from src.testing.snapshot import ArgsSnapshot
 from src.testing.testers.tester import Tester
-from src.testing.utils import (
-    parse_test_data_as_lines,
-    proc_args_by_func,
-    proc_test_result,
-)
-from src.utils.general import (
-    get_classes_from_module,
-    get_count_required_params,
-    get_funcs_from_module,
-    validate_signature,
-)
+from src.testing.utils import parse_test_data_as_lines
+from src.utils.general import get_classes_from_module, get_funcs_from_module
 
 
 class FunctionTester(Tester):
@@ -32,6 +23,7 @@ class FunctionTester(Tester):
     def __init__(self, func: Callable):
         super().__init__()
         self.__func = func
+        self.__plan = CallPlan(func)
 
     @classmethod
     def verification_module(cls, module: ModuleType) -> bool:
@@ -51,7 +43,7 @@ class FunctionTester(Tester):
         return True
 
     @classmethod
-    def parse_test_data(cls, test_data: str) -> list[list]:
+    def parse_test_data(cls, test_data: str | Iterable[str]) -> Iterator[list]:
         return parse_test_data_as_lines(test_data)
 
     @classmethod
@@ -77,7 +69,7 @@ class FunctionTester(Tester):
         если количество элементов N + 1,
         где N – количество параметров тестируемой функции.
         """
-        count_params = get_count_required_params(self.__func)
+        count_params = self.__plan.count_required
 
         if len(test_set) > count_params + 1:
             raise Exception(
@@ -85,7 +77,7 @@ class FunctionTester(Tester):
                 f"(more than {count_params}): {test_set}"
             )
 
-        args = proc_args_by_func(test_set[:count_params], self.__func)
+        args = self.__plan.convert_args(test_set[:count_params])
         expected = test_set[count_params] if len(test_set) > count_params else None
 
         return args, expected
@@ -94,22 +86,24 @@ class FunctionTester(Tester):
         if not isinstance(args, Sequence):
             raise Exception(f"List of arguments must be a sequence: {args}")
 
-        validate_signature(self.__func, *args)
+        self.__plan.validate(args)
 
     def run(self, args: Sequence, debug: bool = False) -> Result:
-        args_after = copy.deepcopy(args)
-        start_time = time.perf_counter()
+        snapshot = ArgsSnapshot(args) if self.track_mutations else None
 
         if self.runner:
-            result = self.runner(self.__func, args_after)
+            execution = self.execute(self.runner, self.__func, args)
         else:
-            result = self.__func(*args_after)
+            execution = self.execute(self.__func, *args)
 
-        run_time = time.perf_counter() - start_time
+        value = self.convert_result(execution, self.__plan.convert_result)
 
         return ClassicResult(
-            value=proc_test_result(result, self.__func),
-            time=run_time,
-            args_before=args,
-            args_after=args_after,
+            value=value,
+            time=execution.time,
+            args_before=snapshot.get_original(args) if snapshot else args,
+            args_after=args,
+            verdict=execution.verdict,
+            error=execution.error,
+            memory=execution.memory,
         )
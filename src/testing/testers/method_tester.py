@@ -1,24 +1,18 @@
-import copy
-import time
-from collections.abc import Callable, Sequence
+from collections.abc import Callable, Iterable, Iterator, Sequence
 from types import ModuleType
 from typing import Any
 
 from src.config import MAIN_FUNCTION_NAME, SOLUTION_CLASS_NAME
+from src.testing.call_plan import CallPlan
 from src.testing.results.classic_result import ClassicResult
 from src.testing.results.result import Result
+from src.testing.snapshot import ArgsSnapshot
 from src.testing.testers.tester import Tester
-from src.testing.utils import (
-    parse_test_data_as_lines,
-    proc_args_by_func,
-    proc_test_result,
-)
+from src.testing.utils import parse_test_data_as_lines
 from src.utils.general import (
     get_class_method_names,
     get_classes_from_module,
-    get_count_required_params,
     get_funcs_from_module,
-    validate_signature,
 )
 
 
@@ -34,6 +28,8 @@ class MethodTester(Tester):
         super().__init__()
         self.__class = class_
         self.__method_name = method_name
+        # План составляется по методу объекта (без параметра self).
+        self.__plan = CallPlan(getattr(class_(), method_name))
 
     @classmethod
     def verification_module(cls, module: ModuleType) -> bool:
@@ -57,7 +53,7 @@ class MethodTester(Tester):
         return len(get_class_method_names(solution_class)) > 0
 
     @classmethod
-    def parse_test_data(cls, test_data: str) -> list[list]:
+    def parse_test_data(cls, test_data: str | Iterable[str]) -> Iterator[list]:
         return parse_test_data_as_lines(test_data)
 
     @classmethod
@@ -105,17 +101,15 @@ class MethodTester(Tester):
         если количество элементов N + 1,
         где N – количество параметров тестируемой функции.
         """
-        obj = self.__class()
-        func = getattr(obj, self.__method_name)
-        count_params = get_count_required_params(func)
+        count_params = self.__plan.count_required
 
         if len(test_set) > count_params + 1:
             raise Exception(
-                f"Function {func.__name__} has too many arguments "
+                f"Function {self.__method_name} has too many arguments "
                 f"(more than {count_params}): {test_set}"
             )
 
-        args = proc_args_by_func(test_set[:count_params], func)
+        args = self.__plan.convert_args(test_set[:count_params])
         expected = test_set[count_params] if len(test_set) > count_params else None
 
         return args, expected
@@ -124,27 +118,27 @@ class MethodTester(Tester):
         if not isinstance(args, Sequence):
             raise Exception(f"List of arguments must be a sequence: {args}")
 
-        validate_signature(getattr(self.__class(), self.__method_name), *args)
+        self.__plan.validate(args)
 
     def run(self, args: Sequence, debug: bool = False) -> Result:
-        args_after = copy.deepcopy(args)
-        func = None
-        start_time = time.perf_counter()
+        snapshot = ArgsSnapshot(args) if self.track_mutations else None
+        # Каждый тест выполняется на новом объекте, чтобы состояние,
+        # сохраненное в объекте, не переходило между тестами.
+        func = getattr(self.__class(), self.__method_name)
 
         if self.runner:
-            result = self.runner(self.__class, args_after)
+            execution = self.execute(self.runner, self.__class, args)
         else:
-            obj = self.__class()
-            func = getattr(obj, self.__method_name)
-            result = func(*args_after)
+            execution = self.execute(func, *args)
 
-        run_time = time.perf_counter() - start_time
-        if not func:
-            func = getattr(self.__class(), self.__method_name)
+        value = self.convert_result(execution, self.__plan.convert_result)
 
         return ClassicResult(
-            value=proc_test_result(result, func),
-            time=run_time,
-            args_before=args,
-            args_after=args_after,
+            value=value,
+            time=execution.time,
+            args_before=snapshot.get_original(args) if snapshot else args,
+            args_after=args,
+            verdict=execution.verdict,
+            error=execution.error,
+            memory=execution.memory,
         )
@@ -1,14 +1,14 @@
-import copy
-import io
 import sys
-import time
-from collections.abc import Sequence
+from collections.abc import Iterable, Iterator, Sequence
 from types import ModuleType
 from typing import Any
 
 from src.config import MAIN_FUNCTION_NAME
+from src.testing.process_runner import get_fork_server
+from src.testing.results.process_result import ProcessResult
 from src.testing.results.result import Result
 from src.testing.results.stream_result import StreamResult
+from src.testing.stdio import redirect_stdio
 from src.testing.testers.tester import Tester
 from src.testing.utils import parse_test_data_as_stream
 from src.utils.general import get_funcs_from_module
@@ -22,9 +22,16 @@ class StreamTester(Tester):
 
     NAME = "stream"
 
-    def __init__(self, main_func: type):
+    def __init__(self, main_func: type, path: str = None):
+        """
+        :param main_func: Функция точки входа.
+        :param path: Путь к файлу решения (для запуска в отдельном процессе).
+        """
         super().__init__()
         self.__main_func = main_func
+        self.__path = path
+        # Запускать решение в отдельном процессе, как в системе проверки.
+        self.isolated: bool = False
 
     @classmethod
     def verification_module(cls, module: ModuleType) -> bool:
@@ -38,10 +45,10 @@ class StreamTester(Tester):
         return bool({x.__name__: x for x in funcs}.get(MAIN_FUNCTION_NAME))
 
     @classmethod
-    def parse_test_data(cls, test_data: str) -> list[list]:
-        return [
+    def parse_test_data(cls, test_data: str | Iterable[str]) -> Iterator[list]:
+        return (
             [[i], o if o else None] for i, o in parse_test_data_as_stream(test_data)
-        ]
+        )
 
     @classmethod
     def parse_module(cls, module: ModuleType, target: str = None) -> "StreamTester":
@@ -56,7 +63,7 @@ class StreamTester(Tester):
                 f"Module {module.__name__} does not have function {func_name}"
             )
 
-        return cls(func)
+        return cls(func, module.__file__)
 
     def split_test_set(self, test_set: Sequence) -> tuple[Sequence, Any]:
         """
@@ -85,35 +92,69 @@ class StreamTester(Tester):
         if expected is not None and not isinstance(expected, str):
             raise Exception(f"The expected value must be a string: {expected}")
 
-    def run(self, args: Sequence, debug: bool = False) -> Result:
-        if self.runner:
-            args_after = copy.deepcopy(args)
+    def __run_main(self) -> None:
+        self.__main_func()
+        # Вывод, оставшийся в буфере, записывается за время выполнения решения.
+        sys.stdout.flush()
 
-            start_time = time.perf_counter()
-            result = self.runner(self.__main_func, args_after)
-            run_time = time.perf_counter() - start_time
+    @staticmethod
+    def __get_input_data(args: Sequence) -> bytes:
+        input_data = args[0].encode("utf-8")
+        if not input_data.endswith(b"\n"):
+            input_data += b"\n"
+        return input_data
 
-        else:
-            args_after = args
-            try:
-                input_stream = io.StringIO(args[0].strip())
-                output_stream = io.StringIO()
+    def __run_process(self, args: Sequence) -> Result:
+        """
+        Запускает файл решения как скрипт в отдельном процессе.
+        Время выполнения включает импорт решения, а состояние модуля
+        не переходит между тестами.
+        """
+        if not self.__path:
+            raise Exception("Solution file is unknown, isolated run is impossible")
+
+        run = get_fork_server().run(
+            self.__path,
+            self.__get_input_data(args),
+            self.time_limit,
+            self.memory_limit,
+        )
+        verdict, error = run.get_verdict(self.time_limit)
 
-                sys.stdin = input_stream
-                sys.stdout = output_stream
+        return ProcessResult(
+            value=run.output.decode("utf-8", errors="replace"),
+            time=run.time,
+            args_before=args,
+            args_after=args,
+            verdict=verdict,
+            error=error,
+            user_time=run.user_time,
+            sys_time=run.sys_time,
+            exit_code=run.exit_code,
+            errors=run.errors.decode("utf-8", errors="replace"),
+        )
 
-                start_time = time.perf_counter()
-                self.__main_func()
-                run_time = time.perf_counter() - start_time
-                result = output_stream.getvalue()
+    def run(self, args: Sequence, debug: bool = False) -> Result:
+        if self.isolated:
+            return self.__run_process(args)
 
-            finally:
-                sys.stdin = sys.__stdin__
-                sys.stdout = sys.__stdout__
+        # Входные данные – строки, поэтому тестируемый код не может их изменить.
+        if self.runner:
+            execution = self.execute(self.runner, self.__main_func, args)
+            result = execution.value
+
+        else:
+            input_data = self.__get_input_data(args)
+            with redirect_stdio(input_data) as output:
+                execution = self.execute(self.__run_main)
+            result = output.data.decode("utf-8", errors="replace")
 
         return StreamResult(
             value=result,
-            time=run_time,
+            time=execution.time,
             args_before=args,
-            args_after=args_after,
+            args_after=args,
+            verdict=execution.verdict,
+            error=execution.error,
+            memory=execution.memory,
         )
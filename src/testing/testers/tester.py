@@ -1,9 +1,40 @@
+import os
+import time
 from abc import abstractmethod
-from collections.abc import Callable, Sequence
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from contextlib import nullcontext
+from dataclasses import dataclass
 from types import ModuleType
 from typing import Any
 
+from src.nodes.node import NodeStructureError
+from src.testing.limits import TimeLimitExceeded, limit_resources
+from src.testing.memory import trace_memory
+from src.testing.profiler import Profiler
 from src.testing.results.result import Result
+from src.testing.results.verdict import Verdict
+from src.testing.shrink_candidates import shrink_args
+from src.utils.general import format_exception
+from src.utils.registry import Registry
+
+# Папка тестирующего кода (его кадры не выводятся в трассировке ошибок решения).
+TESTING_DIRECTORY = os.path.dirname(os.path.dirname(__file__))
+
+
+@dataclass
+class Execution:
+    """
+    Результат выполнения тестируемого кода.
+    Вердикт задан, только если выполнение завершилось ошибкой
+    или превысило ограничения.
+    """
+
+    value: Any
+    time: float
+    verdict: Verdict | None = None
+    error: str | None = None
+    # Пиковый объем выделенной памяти в байтах (если она отслеживалась).
+    memory: int | None = None
 
 
 class Tester:
@@ -11,6 +42,74 @@ class Tester:
 
     def __init__(self):
         self.runner: Callable[[Any, Sequence], Any] | None = None
+        self.time_limit: float | None = None
+        self.memory_limit: float | None = None
+        # Отслеживать изменение аргументов тестируемым кодом.
+        self.track_mutations: bool = True
+        # Измерять пиковый объем памяти, выделенной тестом.
+        self.trace_memory: bool = False
+        # Измерять время каждого вызова метода (тестировщик класса).
+        self.trace_methods: bool = False
+        # Профиль, в котором накапливается профилирование тестируемого кода.
+        self.profiler: Profiler | None = None
+
+    def execute(self, func: Callable, *args) -> Execution:
+        """
+        Выполняет тестируемый код с ограничениями по времени и памяти
+        (и при необходимости измеряет пиковый объем выделенной памяти).
+        """
+        run_time = 0
+        value, verdict, error, usage = None, None, None, None
+        memory_tracing = trace_memory() if self.trace_memory else nullcontext()
+        profiling = self.profiler or nullcontext()
+
+        try:
+            with (
+                limit_resources(self.time_limit, self.memory_limit),
+                memory_tracing as usage,
+            ):
+                start_time = time.perf_counter()
+                try:
+                    with profiling:
+                        value = func(*args)
+                finally:
+                    run_time = time.perf_counter() - start_time
+
+        except TimeLimitExceeded:
+            verdict = Verdict.TLE
+
+        except MemoryError as e:
+            verdict, error = Verdict.MLE, format_exception(e, TESTING_DIRECTORY)
+
+        except SystemExit as e:
+            if e.code not in (None, 0):
+                verdict, error = Verdict.RE, f"Exit code: {e.code}"
+
+        except NodeStructureError as e:
+            # Результат команды не удалось преобразовать (цикл в узлах).
+            verdict, error = Verdict.RE, f"Invalid result: {e}"
+
+        except Exception as e:
+            verdict, error = Verdict.RE, format_exception(e, TESTING_DIRECTORY)
+
+        if verdict is None and self.time_limit and run_time > self.time_limit:
+            verdict = Verdict.TLE
+
+        return Execution(value, run_time, verdict, error, usage and usage.peak)
+
+    @staticmethod
+    def convert_result(execution: Execution, convert: Callable[[Any], Any]) -> Any:
+        """
+        Конвертирует результат выполнения для вывода и сравнения.
+        Если структура узлов в результате некорректна (цикл, общее поддерево,
+        слишком большой размер), выполнение считается завершенным с ошибкой.
+        """
+        try:
+            return convert(execution.value)
+        except NodeStructureError as e:
+            if execution.verdict is None:
+                execution.verdict, execution.error = Verdict.RE, f"Invalid result: {e}"
+            return None
 
     @classmethod
     @abstractmethod
@@ -21,10 +120,11 @@ class Tester:
 
     @classmethod
     @abstractmethod
-    def parse_test_data(cls, test_data: str) -> list[list]:
+    def parse_test_data(cls, test_data: str | Iterable[str]) -> Iterator[list]:
         """
-        Парсинг тестовых данных. Возвращает список, где каждый элемент –
-        список аргументов для каждого теста.
+        Парсинг тестовых данных (текста или итерируемого объекта по его строкам).
+        Возвращает итератор, где каждый элемент – список аргументов
+        для каждого теста. Тесты разбираются по мере перебора.
         """
 
     @classmethod
@@ -55,13 +155,31 @@ class Tester:
         Запускает тест.
         """
 
+    def shrink_args(self, args: Sequence) -> Iterator[Sequence]:
+        """
+        Более простые варианты аргументов теста для уменьшения
+        непройденного теста (в каждом упрощен один из аргументов).
+        """
+        return shrink_args(args)
+
+
+# Порядок тестировщиков определяет приоритет при автоматическом выборе.
+TESTERS = Registry(
+    {
+        "class": "src.testing.testers.class_tester.ClassTester",
+        "function": "src.testing.testers.function_tester.FunctionTester",
+        "method": "src.testing.testers.method_tester.MethodTester",
+        "stream": "src.testing.testers.stream_tester.StreamTester",
+    }
+)
+
 
 def get_tester_by_name(name: str) -> type[Tester]:
-    return {x.NAME: x for x in Tester.__subclasses__()}.get(name)
+    return TESTERS.get(name)
 
 
 def get_tester_class_by_module(module: ModuleType) -> type[Tester] | None:
     tester_classes = [
-        cls for cls in Tester.__subclasses__() if cls.verification_module(module)
+        cls for cls in TESTERS.values() if cls.verification_module(module)
     ]
     return tester_classes[0] if tester_classes else None
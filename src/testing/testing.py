@@ -1,67 +1,339 @@
+import linecache
 import os.path
-from collections.abc import Callable, Iterable, Sequence
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import Executor
+from dataclasses import dataclass, replace
+from functools import partial
 from importlib import import_module
+from itertools import repeat
 from types import FunctionType, ModuleType
 from typing import Any
 
 from src.config import (
     LAUNCH_LAST_MODIFIED_SOLUTION,
+    MEMORY_TOP_ALLOCATIONS,
+    PROFILE_DIRECTORY,
+    PROFILE_TOP_FUNCTIONS,
     SOLUTION_DEFAULT_NAME,
     SOLUTION_SETTINGS_MODULE_NAME,
     SOLUTION_TESTS_FILE_NAME,
     SOLUTIONS_DIRECTORY,
 )
-from src.solution import get_last_modified_solution_name, get_solution_module
+from src.solution import (
+    get_last_modified_solution_name,
+    get_solution_directory,
+    get_solution_module,
+)
+from src.testing.benchmark import Benchmark
+from src.testing.cache import ParsedTestsCache, ResultCache
+from src.testing.complexity import analyze_complexity, parse_complexity
+from src.testing.limits import is_memory_limit_supported, is_time_limit_supported
+from src.testing.memory import get_peak_allocations
+from src.testing.options import TestOptions
+from src.testing.parallel import (
+    CompletedTest,
+    Test,
+    create_executor,
+    get_jobs_count,
+    run_references_in_executor,
+    run_test,
+    run_tests_in_executor,
+)
+from src.testing.process_runner import is_isolation_supported
+from src.testing.profiler import Profiler
+from src.testing.reporter import Reporter
+from src.testing.results.cached_result import CachedResult
 from src.testing.results.result import Result
+from src.testing.results.session import TestSession
+from src.testing.shrinker import Shrinker
 from src.testing.testers.tester import (
     Tester,
     get_tester_by_name,
     get_tester_class_by_module,
 )
-from src.utils.file import read_text_file
-from src.utils.style import print_message
+from src.utils.file import read_binary_file, read_text_file_lines
+from src.utils.general import (
+    get_class_method_names,
+    memory_to_string,
+    time_to_string,
+)
+from src.utils.style import print_message, print_warning
+
+
+def create_tester(
+    tester_class: type[Tester],
+    module: ModuleType,
+    target: str = None,
+    runner: Callable[[Any, Sequence], Any] = None,
+    time_limit: float = None,
+    memory_limit: float = None,
+    track_mutations: bool = True,
+    profiler: Profiler = None,
+    options: TestOptions = TestOptions(),
+) -> Tester:
+    """
+    Создает тестировщик модуля с заданными настройками запуска.
+
+    :param options: Параметры запуска тестов (используются измерение памяти,
+    статистика методов и запуск в отдельном процессе).
+    """
+    obj = tester_class.parse_module(module, target)
+    obj.runner = runner
+    obj.time_limit = time_limit
+    obj.memory_limit = memory_limit
+    obj.track_mutations = track_mutations
+    obj.trace_memory = options.memory
+    obj.profiler = profiler
+    obj.trace_methods = options.methods
+    if options.isolated:
+        obj.isolated = True
+    return obj
+
+
+def create_reference_tester(
+    reference: str | type | FunctionType,
+    tester_class: type[Tester],
+    target: str = None,
+) -> Tester:
+    """
+    Создает тестировщик эталонного решения, входные данные которого
+    имеют тот же формат, что и у тестируемого решения.
+
+    :param reference: Функция, класс или имя папки эталонного решения.
+    :param tester_class: Класс-тестировщик тестируемого решения.
+    :param target: Цель тестирования тестируемого решения.
+    """
+    if isinstance(reference, str):
+        return tester_class.parse_module(get_solution_module(reference))
+
+    module = import_module(reference.__module__)
+    if isinstance(reference, FunctionType) and tester_class.NAME != "class":
+        # Функция потокового эталона сама читает ввод, остальные получают аргументы.
+        if tester_class.NAME != "stream":
+            tester_class = get_tester_by_name("function")
+        return tester_class.parse_module(module, reference.__name__)
+
+    if isinstance(reference, type) and tester_class.NAME in ("class", "method"):
+        reference_target = reference.__name__
+        if tester_class.NAME == "method":
+            method_names = get_class_method_names(reference)
+            if target and "." in target:
+                reference_target += "." + target.split(".")[1]
+            elif method_names:
+                reference_target += "." + method_names[0]
+        return tester_class.parse_module(module, reference_target)
+
+    raise Exception(
+        f"Reference {reference.__name__} can not be used "
+        f"with the {tester_class.NAME} tester"
+    )
+
+
+@dataclass
+class HeaviestTest:
+    """
+    Тест с наибольшим пиком выделенной памяти.
+    """
+
+    tester: Tester | None = None
+    args: Sequence | None = None
+    memory: int = -1
+
+    def update(self, tester: Tester, result: Result) -> None:
+        if result.memory is not None and result.memory > self.memory:
+            self.tester = tester
+            self.args = result.args_before
+            self.memory = result.memory
+
+
+def print_peak_allocations(test: HeaviestTest, directory: str) -> None:
+    """
+    Повторно выполняет тест и выводит строки кода решения,
+    выделившие больше всего памяти в момент ее пикового использования.
+
+    :param directory: Папка решения.
+    """
+    allocations = get_peak_allocations(
+        lambda: test.tester.run(test.args), directory, MEMORY_TOP_ALLOCATIONS
+    )
+    message = (
+        f"Top memory allocations of the heaviest test "
+        f"({memory_to_string(test.memory)}):"
+    )
+    for frame, size in allocations:
+        line = linecache.getline(frame.filename, frame.lineno).strip()
+        message += (
+            f"\n{memory_to_string(size):>8}  "
+            f"{os.path.relpath(frame.filename)}:{frame.lineno}  {line}"
+        )
+
+    print_message(message)
+
+
+def print_profile(profiler: Profiler, solution_name: str) -> None:
+    """
+    Выводит функции с наибольшим временем выполнения и сохраняет профиль.
+    """
+    stats = profiler.get_stats()
+    print_message(
+        "Profile (top functions by total time):\n"
+        + profiler.get_top_functions(stats, PROFILE_TOP_FUNCTIONS)
+    )
+    paths = profiler.save(stats, os.path.join(PROFILE_DIRECTORY, solution_name))
+    print_message(f"Profile saved: {', '.join(paths)}")
 
 
 def testing_module(
     tester_class: type[Tester],
     module: ModuleType,
-    test_data: str | Iterable[tuple[Sequence, Any]],
+    test_data: str | Iterable[Test] = (),
     target: str = None,
     runner: Callable[[Any, Sequence], Any] = None,
     validator: Callable[[Sequence, Any, Any], bool] = None,
-    show_time: bool = False,
-    debug: bool = False,
+    options: TestOptions = TestOptions(jobs=1),
+    executor: Executor = None,
+    time_limit: float = None,
+    memory_limit: float = None,
+    track_mutations: bool = True,
+    failed_tests: list[Test] = None,
+    cache: ResultCache = None,
+    benchmark: Benchmark = None,
+    heaviest_test: HeaviestTest = None,
+    profiler: Profiler = None,
+    test_file_name: str = None,
+    tests_cache: ParsedTestsCache = None,
+    stop_on_failure: bool = False,
+    shrinker: Shrinker = None,
+    reporter: Reporter = None,
+    session: TestSession = None,
 ) -> None:
     """
     :param tester_class: Класс-тестировщик модуля.
     :param module: Тестируемый модуль.
-    :param test_data: Тестовые данные.
+    :param test_data: Тестовые данные: текст тестов или последовательность
+    кортежей из аргументов теста и ожидаемого значения
+    (вместо кортежа может быть функция, которая его возвращает).
     :param target: Цель тестирования (функция, класс, метод).
     :param validator: Функция валидации результата теста.
     Принимает список аргументов теста, ожидаемое значение и результат.
     Возвращает логическое значение: был ли пройден тест.
-    :param show_time: Показывать время выполнения каждого теста.
-    :param debug: Выводить отладочные данные.
+    :param options: Параметры запуска тестов
+    (jobs – количество процессов в пуле).
+    :param executor: Пул процессов для параллельного запуска тестов.
+    :param time_limit: Ограничение по времени выполнения теста в секундах.
+    :param memory_limit: Ограничение по памяти теста в мегабайтах.
+    :param track_mutations: Отслеживать изменение аргументов тестируемым кодом
+    (иначе аргументы до выполнения теста недоступны).
+    :param failed_tests: Список, в который добавляются непройденные тесты.
+    :param cache: Кэш пройденных тестов. Тесты, найденные в нем,
+    не выполняются (генерируемые тесты не кэшируются).
+    :param benchmark: Многократный замер времени выполнения каждого теста.
+    :param heaviest_test: Тест с наибольшим пиком памяти, обновляемый
+    по результатам тестов.
+    :param profiler: Профиль, в котором накапливается профилирование тестов.
+    :param test_file_name: Файл с текстом тестов (вместо test_data).
+    Файл читается по мере выполнения тестов.
+    :param tests_cache: Кэш разобранных тестов из файла тестов.
+    :param stop_on_failure: Прекратить тестирование на первом непройденном тесте.
+    :param shrinker: Уменьшение первого непройденного теста
+    (выводится наименьший найденный контрпример).
+    :param reporter: Вывод результатов тестов.
+    :param session: Итоги запуска тестов.
     """
-    obj = tester_class.parse_module(module, target)
-    obj.runner = runner
+    reporter = reporter or Reporter()
+    session = session or TestSession()
+    obj = create_tester(
+        tester_class,
+        module,
+        target,
+        runner,
+        time_limit,
+        memory_limit,
+        track_mutations,
+        profiler,
+        options,
+    )
 
-    if isinstance(test_data, str):
-        test_data = (
-            obj.split_test_set(x) for x in tester_class.parse_test_data(test_data)
+    if test_file_name and tests_cache:
+        test_data = tests_cache.read(
+            test_file_name, tester_class.parse_test_data, tester_class.NAME
         )
+        split_test_set = obj.split_test_set
+    elif test_file_name:
+        test_data = tester_class.parse_test_data(read_text_file_lines(test_file_name))
+        split_test_set = obj.split_test_set
+    elif isinstance(test_data, str):
+        test_data = tester_class.parse_test_data(test_data)
+        split_test_set = obj.split_test_set
+    else:
+        split_test_set = None
 
-    for args, expected in test_data:
-        obj.validate_args_and_expected(args, expected)
-        result = obj.run(args, debug)
+    # Ключи кэша тестов в порядке их запуска (None – тест не кэшируется).
+    cache_keys = deque()
 
-        result.validate(expected=expected, validator=validator, show_time=show_time)
+    def get_tests() -> Iterator[Test]:
+        for test in test_data:
+            key = None
+            if cache and not callable(test):
+                key = cache.get_key(test)
+                run_time = cache.get(key)
+                if run_time is not None:
+                    cache_keys.append(None)
+                    yield CompletedTest(CachedResult(run_time, test), None)
+                    continue
 
+            cache_keys.append(key)
+            yield split_test_set(test) if split_test_set else test
 
-def testing_solution(
-    solution_name: str = None, show_time: bool = False, debug: bool = False
-) -> None:
-    # Получение имя решения.
+    if executor:
+        results = run_tests_in_executor(
+            obj, get_tests(), executor, options.jobs, options.debug
+        )
+    else:
+        results = (
+            run_test(obj, test, options.debug, benchmark) for test in get_tests()
+        )
+
+    shrunk = False
+    for result, expected in results:
+        success = result.validate(
+            expected=expected,
+            validator=validator,
+            show_time=options.show_time,
+            reporter=reporter,
+            session=session,
+        )
+        if heaviest_test is not None:
+            heaviest_test.update(obj, result)
+
+        if not success and failed_tests is not None:
+            failed_tests.append((result.args_before, expected))
+
+        # Кэшируются только тесты, результат которых действительно проверялся.
+        key = cache_keys.popleft()
+        if key and success and (expected is not None or validator):
+            cache.add(key, result.time)
+
+        if not success and stop_on_failure:
+            # Невыполненные тесты в пуле процессов отменяются.
+            results.close()
+
+        if not success and shrinker and not shrunk:
+            reporter.flush()
+            shrinker.print_counterexample(obj, result)
+            shrunk = True
+
+        if not success and stop_on_failure:
+            reporter.flush()
+            print_warning("Testing stopped at the first failed test", level=True)
+            break
+
+
+def get_solution_name(solution_name: str = None) -> str:
+    """
+    Имя тестируемого решения: заданное или выбранное по умолчанию.
+    """
     if not solution_name:
         if LAUNCH_LAST_MODIFIED_SOLUTION:
             solution_name = get_last_modified_solution_name()
@@ -71,6 +343,32 @@ def testing_solution(
     if not solution_name:
         raise Exception("No solutions found")
 
+    return solution_name
+
+
+def testing_solution(
+    solution_name: str = None,
+    options: TestOptions = TestOptions(),
+    first_tests: Sequence[Test] = None,
+    session: TestSession = None,
+    batch: bool = False,
+) -> list[Test]:
+    """
+    Тестирует решение и возвращает список непройденных тестов.
+
+    :param options: Параметры запуска тестов.
+    :param first_tests: Тесты, которые нужно запустить перед остальными
+    (например, непройденные при предыдущем запуске).
+    Их результаты подводятся отдельно.
+    :param session: Итоги, в которых учитываются тесты решения
+    (по умолчанию создаются новые).
+    :param batch: Решение тестируется вместе с другими (в процессе пула):
+    непройденные тесты не уменьшаются, эталон не использует
+    дополнительные процессы, а изолированный запуск применяется
+    только к потоковым решениям.
+    """
+    solution_name = get_solution_name(solution_name)
+
     # Загрузка настроек решения.
     try:
         settings_module = import_module(
@@ -80,6 +378,12 @@ def testing_solution(
         tester = vars(settings_module).get("TESTER")
         validator = vars(settings_module).get("VALIDATOR")
         runner = vars(settings_module).get("RUNNER")
+        time_limit = vars(settings_module).get("TIME_LIMIT")
+        memory_limit = vars(settings_module).get("MEMORY_LIMIT")
+        track_mutations = vars(settings_module).get("TRACK_MUTATIONS", True)
+        declared_complexity = vars(settings_module).get("COMPLEXITY")
+        complexity_generator = vars(settings_module).get("COMPLEXITY_GENERATOR")
+        reference = vars(settings_module).get("REFERENCE")
 
     except ModuleNotFoundError:
         settings_module = None
@@ -87,6 +391,12 @@ def testing_solution(
         validator = None
         target = None
         runner = None
+        time_limit = None
+        memory_limit = None
+        track_mutations = True
+        declared_complexity = None
+        complexity_generator = None
+        reference = None
 
     # Подготовка к тестированию.
     solution_module = get_solution_module(solution_name)
@@ -110,58 +420,274 @@ def testing_solution(
     if (target is not None) and (not isinstance(target, str)):
         raise Exception("Test target must be specified by the string")
 
+    for name, limit in (("Time", time_limit), ("Memory", memory_limit)):
+        if (limit is not None) and (not isinstance(limit, (int, float)) or limit <= 0):
+            raise Exception(f"{name} limit must be a positive number")
+
+    if declared_complexity is not None:
+        declared_complexity = parse_complexity(declared_complexity)
+
+    if (complexity_generator is not None) and (
+        not isinstance(complexity_generator, FunctionType)
+    ):
+        raise Exception("The complexity generator must be a function")
+
+    if (reference is not None) and (
+        not isinstance(reference, (str, type, FunctionType))
+    ):
+        raise Exception("The reference must be a function, a class or a solution name")
+
+    if options.isolated and batch and (tester_class.NAME != "stream" or runner):
+        # В пакетном режиме отдельными процессами запускаются только
+        # потоковые решения, остальные тестируются в процессе пула.
+        options = replace(options, isolated=False)
+
+    if options.isolated:
+        if tester_class.NAME != "stream":
+            raise Exception("Isolated mode is only supported by the stream tester")
+        if runner:
+            raise Exception("Runner can not be used in isolated mode")
+        if not is_isolation_supported():
+            raise Exception("Isolated mode is not supported on this platform")
+
     print_message(f"Solution: {solution_name}")
     print_message(f"Type: {tester_class.NAME}")
 
-    # Тестирование решения на тестовых данных с текстового файла.
-    test_data_file_name = os.path.join(
-        SOLUTIONS_DIRECTORY, solution_name, SOLUTION_TESTS_FILE_NAME
+    if reference is not None:
+        print_message(
+            f"Reference: "
+            f"{reference if isinstance(reference, str) else reference.__name__}"
+        )
+
+    if options.isolated:
+        print_message("Isolated: each test runs in a separate process")
+        if options.memory or options.profile:
+            print_warning(
+                "Memory tracing and profiling are not available in isolated mode",
+                level=True,
+            )
+            options = replace(options, memory=False, profile=False)
+
+    if options.methods and tester_class.NAME != "class":
+        print_warning(
+            "Method statistics are only available for the class tester", level=True
+        )
+        options = replace(options, methods=False)
+
+    if time_limit:
+        print_message(f"Time limit: {time_to_string(time_limit)}")
+        if not is_time_limit_supported():
+            print_warning(
+                "Time limit watchdog is not supported on this platform, "
+                "the limit is checked after the test",
+                level=True,
+            )
+
+    if memory_limit:
+        print_message(f"Memory limit: {memory_limit} MB")
+        if not is_memory_limit_supported():
+            print_warning("Memory limit is not supported on this platform", level=True)
+
+    if options.complexity:
+        if not complexity_generator:
+            raise Exception("COMPLEXITY_GENERATOR is not specified in the settings")
+
+        result = analyze_complexity(
+            create_tester(
+                tester_class,
+                solution_module,
+                target,
+                runner,
+                time_limit,
+                memory_limit,
+                track_mutations,
+                options=replace(options, memory=False, methods=False),
+            ),
+            complexity_generator,
+            declared_complexity,
+            options.debug,
+        )
+        session = TestSession()
+        result.validate(
+            expected=declared_complexity, show_time=options.show_time, session=session
+        )
+        session.print_status(options.show_time)
+        return []
+
+    benchmark = Benchmark(options.bench, options.warmup) if options.bench else None
+    if benchmark:
+        print_message(f"Benchmark: {options.bench} runs, {options.warmup} warmup runs")
+
+    profiler = Profiler() if options.profile else None
+
+    jobs = get_jobs_count(options.jobs)
+    if (benchmark or profiler) and jobs > 1:
+        mode = "Benchmark" if benchmark else "Profile"
+        print_warning(f"{mode} mode runs tests in a single process", level=True)
+        jobs = 1
+    options = replace(options, jobs=jobs)
+
+    executor = create_executor(jobs) if jobs > 1 else None
+
+    # Эталонное решение и уменьшение непройденных генерируемых тестов
+    # используют пул процессов, даже если само решение тестируется
+    # в одном процессе (процессы пула создаются при первой задаче).
+    has_generators = settings_module is not None and any(
+        test.get("generator") for test in vars(settings_module).get("TESTS") or []
     )
-    testing_module(
+    stress_executor, stress_jobs = executor, jobs
+    if not executor and not batch and (reference is not None or has_generators):
+        stress_jobs = get_jobs_count(0)
+        stress_executor = create_executor(stress_jobs) if stress_jobs > 1 else None
+
+    reference_tester = None
+    if reference is not None:
+        reference_tester = create_reference_tester(reference, tester_class, target)
+        reference_tester.track_mutations = track_mutations
+        if not stress_executor:
+            stress_executor = create_executor(stress_jobs)
+
+    # Профиль и замеры не должны включать запуски уменьшаемых тестов.
+    # Без отслеживания изменений исходные аргументы непройденного теста
+    # неизвестны (решение могло их изменить), поэтому он не уменьшается.
+    shrinker = None
+    if (
+        not benchmark
+        and not options.memory
+        and not profiler
+        and not batch
+        and track_mutations
+    ):
+        shrinker = Shrinker(
+            reference_tester,
+            validator,
+            stress_executor if stress_jobs > 1 else None,
+            stress_jobs,
+            options.debug,
+        )
+    heaviest_test = HeaviestTest() if options.memory else None
+    reporter = Reporter(options.quiet, options.preview)
+    session = session or TestSession()
+    testing = partial(
+        testing_module,
         tester_class=tester_class,
         module=solution_module,
-        test_data=(
-            read_text_file(test_data_file_name)
-            if os.path.exists(test_data_file_name)
-            else ""
-        ),
         target=target,
         runner=runner,
         validator=validator,
-        show_time=show_time,
-        debug=debug,
+        options=options,
+        executor=executor,
+        time_limit=time_limit,
+        memory_limit=memory_limit,
+        track_mutations=track_mutations,
+        benchmark=benchmark,
+        heaviest_test=heaviest_test,
+        profiler=profiler,
+        reporter=reporter,
+        session=session,
     )
+    failed_tests = []
 
-    # Тестирование решения на тестовых данных из файла с настройками решения.
-    if settings_module:
-        for test in vars(settings_module).get("TESTS") or []:
-            if "args" in test:
-                testing_module(
-                    tester_class=tester_class,
-                    module=solution_module,
-                    test_data=[(test["args"], test.get("expected"))],
-                    target=target,
-                    runner=runner,
-                    validator=validator,
-                    show_time=show_time,
-                    debug=debug,
-                )
-
-            elif "generator" in test:
-                generator = test["generator"]
-                if not generator:
-                    continue
-                count = test.get("count") or 1
-
-                testing_module(
-                    tester_class=tester_class,
-                    module=solution_module,
-                    test_data=(generator() for _ in range(count)),
-                    target=target,
-                    runner=runner,
-                    validator=validator,
-                    show_time=show_time,
-                    debug=debug,
-                )
-
-    Result.print_status(show_time)
+    cache = ResultCache(
+        solution_name,
+        [
+            read_binary_file(module.__file__)
+            for module in (solution_module, settings_module)
+            if module
+        ]
+        + [tester_class.NAME],
+    )
+    if (
+        options.use_cache
+        and not benchmark
+        and not options.memory
+        and not profiler
+        and not options.methods
+    ):
+        cache.load()
+
+    try:
+        # Тесты, которые нужно запустить первыми.
+        if first_tests:
+            print_message("Previously failed tests:")
+            first_session = TestSession()
+            testing(
+                test_data=first_tests,
+                failed_tests=failed_tests,
+                session=first_session,
+            )
+            reporter.flush()
+            first_session.print_status(options.show_time)
+
+        # Тестирование решения на тестовых данных с текстового файла.
+        test_data_file_name = os.path.join(
+            SOLUTIONS_DIRECTORY, solution_name, SOLUTION_TESTS_FILE_NAME
+        )
+        testing(
+            test_file_name=(
+                test_data_file_name if os.path.exists(test_data_file_name) else None
+            ),
+            tests_cache=ParsedTestsCache(solution_name),
+            failed_tests=failed_tests,
+            cache=cache,
+        )
+
+        # Тестирование решения на тестовых данных из файла с настройками решения.
+        if settings_module:
+            for test in vars(settings_module).get("TESTS") or []:
+                if "args" in test:
+                    testing(
+                        test_data=[(test["args"], test.get("expected"))],
+                        failed_tests=failed_tests,
+                        cache=cache,
+                    )
+
+                elif "generator" in test:
+                    generator = test["generator"]
+                    if not generator:
+                        continue
+                    count = test.get("count") or 1
+
+                    if reference_tester:
+                        # Стресс-тестирование: ожидаемые значения вычисляет
+                        # эталон, тестирование прекращается на первом расхождении.
+                        testing(
+                            test_data=run_references_in_executor(
+                                reference_tester,
+                                generator,
+                                count,
+                                stress_executor,
+                                stress_jobs,
+                                options.debug,
+                            ),
+                            failed_tests=failed_tests,
+                            stop_on_failure=True,
+                            shrinker=shrinker,
+                        )
+                        continue
+
+                    # Тесты генерируются там же, где выполняются
+                    # (в процессах пула при параллельном запуске).
+                    testing(
+                        test_data=repeat(generator, count),
+                        failed_tests=failed_tests,
+                        shrinker=shrinker,
+                    )
+
+    finally:
+        reporter.flush()
+        for pool in {executor, stress_executor} - {None}:
+            pool.shutdown(cancel_futures=True)
+
+    cache.save()
+
+    session.print_status(options.show_time)
+
+    if heaviest_test and heaviest_test.tester:
+        print_peak_allocations(heaviest_test, get_solution_directory(solution_name))
+
+    if profiler:
+        print_profile(profiler, solution_name)
+
+    # Тест, не пройденный повторно, не должен дублироваться.
+    return list({repr(test): test for test in failed_tests}.values())
@@ -1,46 +1,47 @@
-import copy
-import inspect
 import json
 import os
-from collections.abc import Callable, Sequence
-from typing import Any
+from collections.abc import Iterable, Iterator
 
 from src.config import SOLUTION_TEMPLATES_DIRECTORY, TEMPLATES_DIRECTORY
-from src.nodes.node import get_nodes
 from src.utils.file import read_text_file
-from src.utils.general import get_params_signature
 
 
-def parse_test_data(test_data: str) -> list[str]:
-    lines = [line.strip() for line in test_data.strip().splitlines()]
-    if not lines:
-        return []
+def parse_test_data(test_data: str | Iterable[str]) -> Iterator[str]:
+    """
+    Разбивает тестовые данные на наборы, разделенные пустыми строками.
+    Строки читаются по одной, поэтому данные могут быть итератором
+    по строкам большого файла: в памяти хранится только текущий набор.
+
+    :param test_data: Текст тестов или итерируемый объект по его строкам.
+    """
+    lines = test_data.splitlines() if isinstance(test_data, str) else test_data
+    test_set = []
 
-    lines = [
-        lines[i].strip()
-        for i in range(len(lines))
-        if i == 0 or lines[i].strip() or lines[i - 1].strip()
-    ]
-    return "\n".join(lines).split("\n\n")
+    for line in lines:
+        line = line.strip()
+        if line:
+            test_set.append(line)
+        elif test_set:
+            yield "\n".join(test_set)
+            test_set = []
 
+    if test_set:
+        yield "\n".join(test_set)
 
-def parse_test_data_as_lines(test_data: str) -> list[list]:
+
+def parse_test_data_as_lines(test_data: str | Iterable[str]) -> Iterator[list]:
     """
     Парсинг тестовых данных как списка аргументов.
     Каждый аргумент находится в отдельной строке.
     Наборы тестовых данных разделяются хотя бы одной пустой строкой.
     """
-    test_data_list = parse_test_data(test_data)
-    if not test_data_list:
-        return []
-
-    return [
-        [json.loads(line) for line in test_data.splitlines()]
-        for test_data in test_data_list
-    ]
+    for test_set in parse_test_data(test_data):
+        yield [json.loads(line) for line in test_set.splitlines()]
 
 
-def parse_test_data_as_stream(test_data: str) -> list[tuple[str, str]]:
+def parse_test_data_as_stream(
+    test_data: str | Iterable[str],
+) -> Iterator[tuple[str, str]]:
     """
     Парсинг тестовых данных как поток аргументов.
     Аргументы можно писать как в одной строке, так и разделив
@@ -49,55 +50,9 @@ def parse_test_data_as_stream(test_data: str) -> list[tuple[str, str]]:
     Наборы тестовых данных разделяются каждой второй последовательностью,
     состоящей минимум из одной пустой строки.
     """
-    test_data_list = parse_test_data(test_data)
-    if not test_data_list:
-        return []
-
-    if len(test_data_list) % 2 != 0:
-        test_data_list.append("")
-
-    return [
-        (test_data_list[i - 1], test_data_list[i])
-        for i in range(1, len(test_data_list), 2)
-    ]
-
-
-def proc_args_by_func(args: Sequence, func: Callable) -> list:
-    """
-    Конвертирует списки в классы Node (и списки списков),
-    если соответствующие параметры функции имеют сигнатуру
-    соответствующий Node.
-    """
-    result_args = list(copy.copy(args))
-    signatures = get_params_signature(func)
-
-    for i, (arg, (_, param_type)) in enumerate(zip(args, signatures)):
-        for node_class in get_nodes():
-            annotation = str(param_type.annotation)
-            if node_class.__name__ in annotation or node_class.ALT_NAME in annotation:
-                if len(arg) and isinstance(arg[0], Sequence):
-                    result_args[i] = [node_class.from_list(x) or [] for x in arg]
-                else:
-                    result_args[i] = node_class.from_list(arg) or []
-                break
-
-    return result_args
-
-
-def proc_test_result(value: Any, func: Callable) -> Any:
-    """
-    Конвертирует значение в список, если оно является классом node.
-    """
-    sig = inspect.signature(func)
-    return_annotation = str(sig.return_annotation)
-
-    for node_class in get_nodes():
-        if isinstance(value, node_class):
-            return value.to_list()
-        if value is None and node_class.__name__ in return_annotation:
-            return []
-
-    return value
+    test_sets = parse_test_data(test_data)
+    for input_data in test_sets:
+        yield input_data, next(test_sets, "")
 
 
 def get_header(name: str, width: int, line_char: str = "=") -> str:
@@ -0,0 +1,89 @@
+import os
+import sys
+import time
+import traceback
+
+from src.config import SOLUTION_TESTS_FILE_NAME, WATCH_INTERVAL
+from src.solution import get_solution_directory, unload_solution_modules
+from src.testing.options import TestOptions
+from src.testing.testing import get_solution_name, testing_solution
+from src.utils.style import print_error, print_message
+
+
+def get_files_state(path: str) -> dict[str, tuple[float, int]]:
+    """
+    Время изменения и размер файлов решения, изменение которых
+    требует перезапуска тестов (модули Python и файл тестов).
+    """
+    state = {}
+    for entry in os.scandir(path):
+        if entry.is_file() and (
+            entry.name.endswith(".py") or entry.name == SOLUTION_TESTS_FILE_NAME
+        ):
+            stat = entry.stat()
+            state[entry.name] = (stat.st_mtime, stat.st_size)
+
+    return state
+
+
+def wait_for_changes(path: str, state: dict) -> dict:
+    """
+    Ожидает изменения файлов решения и возвращает их новое состояние.
+    Серия быстрых сохранений (например, форматирование при сохранении)
+    приводит к одному перезапуску: ожидание продолжается,
+    пока файлы не перестанут меняться в течение одного интервала.
+    """
+    new_state = state
+    while new_state == state:
+        time.sleep(WATCH_INTERVAL)
+        new_state = get_files_state(path)
+
+    while True:
+        time.sleep(WATCH_INTERVAL)
+        last_state, new_state = new_state, get_files_state(path)
+        if new_state == last_state:
+            return new_state
+
+
+def watch_solution(
+    solution_name: str = None, options: TestOptions = TestOptions()
+) -> None:
+    """
+    Тестирует решение при каждом изменении его файлов, не перезапуская
+    интерпретатор: перед запуском тестов модули решения перезагружаются.
+    Тесты, не пройденные при предыдущем запуске, запускаются первыми.
+
+    :param solution_name: Имя решения.
+    :param options: Параметры запуска тестов.
+    """
+    path = get_solution_directory(get_solution_name(solution_name))
+    solution_name = os.path.basename(path)
+    state = get_files_state(path)
+    failed_tests = []
+
+    # Кэш байт-кода проверяется по времени изменения с точностью до секунды,
+    # поэтому файл, сохраненный в ту же секунду, что и записанный кэш,
+    # загрузился бы из устаревшего кэша. Пока идет наблюдение, кэш
+    # не записывается, и модули решения компилируются из исходного кода.
+    dont_write_bytecode, sys.dont_write_bytecode = sys.dont_write_bytecode, True
+
+    try:
+        while True:
+            unload_solution_modules(solution_name)
+
+            try:
+                failed_tests = testing_solution(
+                    solution_name, options, first_tests=failed_tests
+                )
+            except Exception as e:
+                traceback.print_exc()
+                print_error(str(e), level=True)
+
+            print_message(f'Watching for changes in "{path}" (Ctrl+C to exit)...')
+            state = wait_for_changes(path, state)
+
+    except KeyboardInterrupt:
+        print_message("Watching stopped")
+
+    finally:
+        sys.dont_write_bytecode = dont_write_bytecode
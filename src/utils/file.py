@@ -1,8 +1,24 @@
+from collections.abc import Iterator
+
+
 def read_text_file(file_name: str) -> str:
     with open(file_name, encoding="utf-8") as f:
         return f.read()
 
 
+def read_text_file_lines(file_name: str) -> Iterator[str]:
+    """
+    Читает текстовый файл построчно (файл не загружается в память целиком).
+    """
+    with open(file_name, encoding="utf-8") as f:
+        yield from f
+
+
+def read_binary_file(file_name: str) -> bytes:
+    with open(file_name, "rb") as f:
+        return f.read()
+
+
 def create_text_file(file_name: str, text: str = "") -> int:
     with open(file_name, "w", encoding="utf-8") as f:
         return f.write(text)
@@ -1,10 +1,9 @@
-import inspect
+import os
 import sys
 import traceback
-from collections.abc import Callable
 from itertools import chain
 from types import FunctionType, ModuleType
-from typing import Any, Union, get_origin
+from typing import Any
 
 
 def get_funcs_from_module(module: ModuleType) -> list[FunctionType]:
@@ -31,42 +30,6 @@ def get_class_method_names(cls: type) -> list[str]:
     ]
 
 
-def get_params_signature(func: Callable) -> list:
-    return list(inspect.signature(func).parameters.items())
-
-
-def get_count_required_params(func: Callable) -> int:
-    return sum(
-        1
-        for _, v in inspect.signature(func).parameters.items()
-        if v.default is inspect.Parameter.empty
-    )
-
-
-def validate_signature(func: Callable, *args, **kwargs) -> None:
-    try:
-        sig = inspect.signature(func)
-        bound_args = sig.bind(*args, **kwargs)
-
-        for name, value in bound_args.arguments.items():
-            param = sig.parameters[name]
-            if param.annotation != inspect.Parameter.empty:
-                annotation = get_origin(param.annotation) or param.annotation
-                if (
-                    not isinstance(annotation, str)
-                    and annotation != Union
-                    and not isinstance(value, annotation)
-                ):
-                    raise TypeError()
-
-    except TypeError:
-        raise TypeError(
-            f"Arguments ({args_to_string(*args, **kwargs)}) "
-            f"are not suitable for the signature of function "
-            f"{func.__qualname__}({parameters_to_string(func)})"
-        )
-
-
 def time_to_string(t: float) -> str:
     data = [
         (1e-6, 1e9, "ns"),
@@ -81,10 +44,63 @@ def time_to_string(t: float) -> str:
     return f"{round(t, 3):,} s"
 
 
+def memory_to_string(size: int) -> str:
+    data = [
+        (2**10, 1, "B"),
+        (2**20, 2**10, "KB"),
+        (2**30, 2**20, "MB"),
+    ]
+
+    for size_max, d, unit in data:
+        if size < size_max:
+            return f"{round(size / d):,} {unit}"
+
+    return f"{round(size / 2**30, 3):,} GB"
+
+
 def to_json_string(value: Any) -> str:
     return f'"{value}"' if isinstance(value, str) else str(value)
 
 
+def truncate_string(s: str, max_length: int = None) -> str:
+    if max_length is None or len(s) <= max_length:
+        return s
+    return s[:max_length] + "..."
+
+
+def to_preview_string(value: Any, max_length: int = None) -> str:
+    """
+    Строковое представление значения (как to_json_string), сокращенное
+    примерно до max_length символов. Списки и кортежи преобразуются
+    поэлементно, пока не будет превышена длина, поэтому большие значения
+    не преобразуются в строку целиком.
+    """
+    if max_length is None:
+        return to_json_string(value)
+
+    if isinstance(value, (list, tuple)):
+        items, length = [], 2
+        for item in value:
+            item_string = to_preview_string(item, max(max_length - length, 0))
+            # Вложенные списки сокращаются сами, а числа и строки не обрезаются.
+            if length >= max_length or (
+                length + len(item_string) > max_length
+                and not isinstance(item, (list, tuple))
+            ):
+                items.append("...")
+                break
+            items.append(item_string)
+            length += len(item_string) + 2
+
+        s = ", ".join(items)
+        return f"[{s}]" if isinstance(value, list) else f"({s})"
+
+    if isinstance(value, str):
+        return to_json_string(truncate_string(value, max_length))
+
+    return truncate_string(to_json_string(value), max_length)
+
+
 def string_to_json(s: str) -> str:
     REPLACE_LIST = {
         "'": '"',
@@ -107,11 +123,6 @@ def args_to_string(*args, **kwargs) -> str:
     )
 
 
-def parameters_to_string(func: Callable) -> str:
-    parameters = inspect.signature(func).parameters.values()
-    return ", ".join(map(str, parameters))
-
-
 def print_exc_from_level(level: int = 0) -> None:
     exc_type, exc_value, exc_traceback = sys.exc_info()
     if not exc_traceback:
@@ -125,3 +136,24 @@ def print_exc_from_level(level: int = 0) -> None:
 
     truncated_tb = traceback.format_exception(exc_type, exc_value, exc_traceback)
     print("".join(truncated_tb), end="", file=sys.stderr)
+
+
+def format_exception(exc: BaseException, exclude_directory: str | None = None) -> str:
+    """
+    Форматирует исключение с трассировкой стека.
+
+    :param exc: Исключение.
+    :param exclude_directory: Папка, кадры стека из файлов которой
+    не попадут в трассировку.
+    """
+    tb_exception = traceback.TracebackException.from_exception(exc)
+
+    if exclude_directory:
+        exclude_directory = os.path.abspath(exclude_directory) + os.sep
+        tb_exception.stack = traceback.StackSummary.from_list(
+            frame
+            for frame in tb_exception.stack
+            if not os.path.abspath(frame.filename).startswith(exclude_directory)
+        )
+
+    return "".join(tb_exception.format()).rstrip()
@@ -0,0 +1,35 @@
+from importlib import import_module
+from typing import Any
+
+
+class Registry:
+    """
+    Реестр объектов (классов команд, ресурсов, тестировщиков),
+    доступных по имени. Модуль объекта импортируется только
+    при первом обращении к нему, поэтому получение списка имен
+    не загружает модули и их зависимости.
+    """
+
+    def __init__(self, paths: dict[str, str]):
+        """
+        :param paths: Словарь: имя объекта – полный путь к нему
+        в формате "package.module.ObjectName".
+        """
+        self.__paths = paths
+        self.__objects = {}
+
+    def names(self) -> list[str]:
+        return list(self.__paths)
+
+    def get(self, name: str) -> Any | None:
+        if name not in self.__paths:
+            return None
+
+        if name not in self.__objects:
+            module_name, object_name = self.__paths[name].rsplit(".", 1)
+            self.__objects[name] = getattr(import_module(module_name), object_name)
+
+        return self.__objects[name]
+
+    def values(self) -> list:
+        return [self.get(name) for name in self.__paths]
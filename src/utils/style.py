@@ -39,11 +39,14 @@ def underline(value: Any) -> str:
     return f"{Style.UNDERLINE}{value}{Style.NO_UNDERLINE}"
 
 
-def print_in_style(styles: Style | Iterable[Style], *args, **kwargs) -> None:
+def in_style(styles: Style | Iterable[Style], *args, sep: str = None) -> str:
     styles = [styles] if (type(styles) is Style) else styles
-    sep = kwargs.get("sep") or " "
-    message = "".join(map(str, styles)) + sep.join(map(str, args)) + str(Style.RESET)
-    print(message, **kwargs)
+    sep = sep or " "
+    return "".join(map(str, styles)) + sep.join(map(str, args)) + str(Style.RESET)
+
+
+def print_in_style(styles: Style | Iterable[Style], *args, **kwargs) -> None:
+    print(in_style(styles, *args, sep=kwargs.get("sep")), **kwargs)
 
 
 def print_message(*args, **kwargs) -> None:
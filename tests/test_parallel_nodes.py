@@ -0,0 +1,50 @@
+import pickle
+import unittest
+
+from src.nodes.list_node import ListNode
+from src.testing.parallel import create_executor, run_tests_in_executor
+from src.testing.results.verdict import Verdict
+from src.testing.testers.function_tester import FunctionTester
+
+
+def link_tail_to_head(head: ListNode) -> ListNode:
+    node = head
+    while node.next:
+        node = node.next
+    node.next = head
+    return head
+
+
+class CyclicNodesInExecutorTest(unittest.TestCase):
+    """
+    Цикл в аргументах или результате, созданный решением в процессе пула,
+    должен передаваться в основной процесс и давать вердикт RE.
+    """
+
+    SIZE = 50000
+
+    def test_pickle_long_cycle(self):
+        head = link_tail_to_head(ListNode.from_list(list(range(self.SIZE))))
+        copy = pickle.loads(pickle.dumps(head))
+
+        node = copy
+        for _ in range(self.SIZE):
+            node = node.next
+        self.assertIs(node, copy)
+
+    def test_cycle_in_executor(self):
+        tester = FunctionTester(link_tail_to_head)
+        tests = [tester.split_test_set([list(range(self.SIZE)), [1]])]
+
+        executor = create_executor(2)
+        try:
+            [(result, _)] = run_tests_in_executor(tester, tests, executor, 2)
+        finally:
+            executor.shutdown()
+
+        self.assertIs(result.verdict, Verdict.RE)
+        self.assertIn("cycle at node 0", result.error)
+
+
+if __name__ == "__main__":
+    unittest.main()
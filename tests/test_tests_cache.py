@@ -0,0 +1,46 @@
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+ROOT_DIRECTORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class ParsedTestsCacheExitTest(unittest.TestCase):
+    """
+    Решение, завершившее процесс через os._exit, не должно оставлять
+    временный файл кэша разобранных тестов.
+    """
+
+    SOLUTION = "import os\n\n\ndef solution(x):\n    os._exit(3)\n"
+    TESTS = "1\n1\n\n2\n2\n"
+
+    def test_os_exit_leaves_no_temp_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            solution_directory = os.path.join(directory, "solutions", "exits")
+            os.makedirs(solution_directory)
+            for name, text in (
+                ("solution.py", self.SOLUTION),
+                ("tests.txt", self.TESTS),
+            ):
+                with open(os.path.join(solution_directory, name), "w") as f:
+                    f.write(text)
+
+            process = subprocess.run(
+                [sys.executable, os.path.join(ROOT_DIRECTORY, "main.py")]
+                + ["test", "exits"],
+                cwd=directory,
+                env={**os.environ, "PYTHONPATH": directory},
+                capture_output=True,
+            )
+
+            self.assertEqual(process.returncode, 3)
+            self.assertEqual(
+                os.listdir(os.path.join(directory, ".cache")),
+                ["exits.tests.cache"],
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()